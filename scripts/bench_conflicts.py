@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark timetable conflict detection at increasing schedule sizes.
+
+Seeds an event with N scheduled sessions (spread over spaces, with shared
+facilitators so every conflict type shows up), runs
+``ConflictDetectionService.list_all_for_track`` and reports the number of SQL
+queries and the wall time. All seeded rows are rolled back afterwards.
+
+Usage: ``python scripts/bench_conflicts.py [N ...]`` (default: 100 1000 5000).
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+from time import perf_counter
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = REPO_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+# pylint: disable=wrong-import-position  # Django imports must be after setup
+import django  # noqa: E402
+
+django.setup()
+
+from django.contrib.sites.models import Site  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from ludamus.adapters.db.django.models import (  # noqa: E402
+    AgendaItem,
+    Area,
+    Event,
+    Facilitator,
+    Session,
+    Space,
+    Sphere,
+    Venue,
+)
+from ludamus.links.db.django.uow import UnitOfWork  # noqa: E402
+from ludamus.mills.chronology import ConflictDetectionService  # noqa: E402
+
+DEFAULT_SIZES = (100, 1000, 5000)
+ITEMS_PER_SPACE = 10
+SESSIONS_PER_FACILITATOR = 5
+SLOT = timedelta(minutes=30)
+
+
+def _seed(size: int) -> Event:
+    site, _ = Site.objects.get_or_create(
+        domain="bench.local", defaults={"name": "Bench"}
+    )
+    sphere, _ = Sphere.objects.get_or_create(site=site, defaults={"name": "Bench"})
+    start = timezone.now()
+    event = Event.objects.create(
+        sphere=sphere,
+        name=f"Bench {size}",
+        slug=f"bench-{size}",
+        start_time=start,
+        end_time=start + SLOT * size,
+    )
+    venue = Venue.objects.create(event=event, name="Venue", slug="venue")
+    area = Area.objects.create(venue=venue, name="Area", slug="area")
+    spaces = Space.objects.bulk_create(
+        Space(area=area, name=f"Space {i}", slug=f"space-{i}", capacity=10)
+        for i in range(max(1, size // ITEMS_PER_SPACE))
+    )
+    facilitators = Facilitator.objects.bulk_create(
+        Facilitator(event=event, display_name=f"Facilitator {i}", slug=f"fac-{i}")
+        for i in range(max(1, size // SESSIONS_PER_FACILITATOR))
+    )
+    sessions = Session.objects.bulk_create(
+        Session(
+            sphere=sphere,
+            display_name="Bench",
+            title=f"Session {i}",
+            slug=f"bench-session-{i}",
+            participants_limit=8 + i % 5,
+        )
+        for i in range(size)
+    )
+    # Two items per slot in each space (a space overlap every other slot);
+    # consecutive sessions share a facilitator across spaces.
+    AgendaItem.objects.bulk_create(
+        AgendaItem(
+            session=session,
+            space=spaces[i % len(spaces)],
+            start_time=start + SLOT * (i // (2 * len(spaces))),
+            end_time=start + SLOT * (i // (2 * len(spaces)) + 2),
+        )
+        for i, session in enumerate(sessions)
+    )
+    Session.facilitators.through.objects.bulk_create(
+        Session.facilitators.through(
+            session_id=session.pk, facilitator_id=facilitators[i % len(facilitators)].pk
+        )
+        for i, session in enumerate(sessions)
+    )
+    return event
+
+
+def _run(size: int) -> None:
+    with transaction.atomic():
+        event = _seed(size)
+        service = ConflictDetectionService(UnitOfWork())
+        with CaptureQueriesContext(connection) as ctx:
+            started = perf_counter()
+            conflicts = service.list_all_for_track(event.pk, track_pk=None)
+            elapsed = perf_counter() - started
+        print(
+            f"{size:>6} items  {len(ctx.captured_queries):>6} queries  "
+            f"{elapsed * 1000:>9.1f} ms  {len(conflicts):>6} conflicts"
+        )
+        transaction.set_rollback(True)
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for size in sizes:
+        _run(size)
+
+
+if __name__ == "__main__":
+    main()
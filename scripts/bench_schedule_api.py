@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark serialization throughput of the JSON schedule API.
+
+Seeds an event with N scheduled sessions (each with a public and a private
+field value), then walks the sessions list page by page the way the API view
+does: ``ScheduleRowsRepository.read_page`` followed by JSON encoding. Reports
+rows serialized per second, the number of SQL queries and the payload size.
+All seeded rows are rolled back afterwards.
+
+Usage: ``python scripts/bench_schedule_api.py [N ...]`` (default: 1000 10000).
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import timedelta
+from pathlib import Path
+from time import perf_counter
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = REPO_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+# pylint: disable=wrong-import-position  # Django imports must be after setup
+import django  # noqa: E402
+
+django.setup()
+
+from django.contrib.sites.models import Site  # noqa: E402
+from django.core.serializers.json import DjangoJSONEncoder  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from ludamus.adapters.db.django.models import (  # noqa: E402
+    AgendaItem,
+    Area,
+    Event,
+    Session,
+    SessionField,
+    SessionFieldValue,
+    Space,
+    Sphere,
+    Venue,
+)
+from ludamus.links.db.django.schedule_rows import ScheduleRowsRepository  # noqa: E402
+from ludamus.pacts import (  # noqa: E402
+    SCHEDULE_API_FIELDS,
+    SCHEDULE_API_MAX_PAGE_SIZE,
+    SCHEDULE_API_PAGE_SIZE,
+    ScheduleResource,
+)
+
+DEFAULT_SIZES = (1000, 10000)
+ITEMS_PER_SPACE = 10
+SLOT = timedelta(minutes=30)
+
+
+def _seed(size: int) -> Event:
+    site, _ = Site.objects.get_or_create(
+        domain="bench.local", defaults={"name": "Bench"}
+    )
+    sphere, _ = Sphere.objects.get_or_create(site=site, defaults={"name": "Bench"})
+    start = timezone.now()
+    event = Event.objects.create(
+        sphere=sphere,
+        name=f"Bench {size}",
+        slug=f"bench-{size}",
+        start_time=start,
+        end_time=start + SLOT * size,
+        publication_time=start,
+    )
+    venue = Venue.objects.create(event=event, name="Venue", slug="venue")
+    area = Area.objects.create(venue=venue, name="Area", slug="area")
+    spaces = Space.objects.bulk_create(
+        Space(area=area, name=f"Space {i}", slug=f"space-{i}", capacity=10)
+        for i in range(max(1, size // ITEMS_PER_SPACE))
+    )
+    sessions = Session.objects.bulk_create(
+        Session(
+            sphere=sphere,
+            display_name="Bench",
+            title=f"Session {i}",
+            slug=f"bench-session-{i}",
+            description="Lorem ipsum dolor sit amet. " * 8,
+            participants_limit=8 + i % 5,
+        )
+        for i in range(size)
+    )
+    AgendaItem.objects.bulk_create(
+        AgendaItem(
+            session=session,
+            space=spaces[i % len(spaces)],
+            start_time=start + SLOT * (i // len(spaces)),
+            end_time=start + SLOT * (i // len(spaces) + 1),
+        )
+        for i, session in enumerate(sessions)
+    )
+    public = SessionField.objects.create(
+        event=event, name="System", question="?", slug="system", is_public=True
+    )
+    private = SessionField.objects.create(
+        event=event, name="Notes", question="?", slug="notes"
+    )
+    SessionFieldValue.objects.bulk_create(
+        SessionFieldValue(session=session, field=field, value=f"Value {i}")
+        for i, session in enumerate(sessions)
+        for field in (public, private)
+    )
+    return event
+
+
+def _run(size: int, page_size: int) -> None:
+    with transaction.atomic():
+        event = _seed(size)
+        repository = ScheduleRowsRepository()
+        fields = SCHEDULE_API_FIELDS[ScheduleResource.SESSIONS]
+        rows = payload = 0
+        after = None
+        with CaptureQueriesContext(connection) as ctx:
+            started = perf_counter()
+            while page := repository.read_page(
+                ScheduleResource.SESSIONS,
+                event.pk,
+                fields,
+                after=after,
+                limit=page_size,
+            ):
+                payload += len(json.dumps({"data": page}, cls=DjangoJSONEncoder))
+                rows += len(page)
+                after = page[-1]["id"]
+            elapsed = perf_counter() - started
+        print(
+            f"{size:>6} sessions  page {page_size:>4}  "
+            f"{len(ctx.captured_queries):>5} queries  {elapsed * 1000:>8.1f} ms  "
+            f"{rows / elapsed:>9.0f} rows/s  {payload / 1024:>8.0f} KiB"
+        )
+        transaction.set_rollback(True)
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for size in sizes:
+        for page_size in (SCHEDULE_API_PAGE_SIZE, SCHEDULE_API_MAX_PAGE_SIZE):
+            _run(size, page_size)
+
+
+if __name__ == "__main__":
+    main()
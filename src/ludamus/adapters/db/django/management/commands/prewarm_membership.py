@@ -0,0 +1,82 @@
+"""Management command to pre-warm membership-backed enrollment configs."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ludamus.adapters.db.django.models import Event
+from ludamus.inits import DependencyInjector
+from ludamus.mills import prewarm_user_enrollment_configs
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+class Command(BaseCommand):
+    """Look up memberships for many emails before enrollment opens."""
+
+    help = (
+        "Create user enrollment configs from the membership API for the given "
+        "emails, for every enrollment config of the event that is open or opens "
+        "soon"
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:  # noqa: PLR6301
+        """Add command arguments."""
+        parser.add_argument("event_id", type=int, help="Event ID")
+        parser.add_argument("emails", nargs="*", help="Emails to look up")
+        parser.add_argument(
+            "--file", type=Path, help="File with one email per line to look up"
+        )
+        parser.add_argument(
+            "--within-days",
+            type=int,
+            default=7,
+            help="Include enrollment configs opening within this many days",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=8, help="Concurrent membership lookups"
+        )
+
+    def handle(self, *args: object, **options: object) -> None:  # noqa: ARG002
+        event_id = cast("int", options["event_id"])
+        if not Event.objects.filter(pk=event_id).exists():
+            msg = f"Event {event_id} does not exist."
+            raise CommandError(msg)
+
+        emails = list(cast("list[str]", options["emails"]))
+        if path := cast("Path | None", options["file"]):
+            emails.extend(path.read_text(encoding="utf-8").splitlines())
+        if not emails:
+            msg = "No emails given."
+            raise CommandError(msg)
+
+        di = DependencyInjector()
+        now = datetime.now(tz=UTC)
+        enrollment_configs = di.uow.enrollment_configs.read_list(
+            event_id,
+            max_start_time=now + timedelta(days=cast("int", options["within_days"])),
+            min_end_time=now,
+        )
+        if not enrollment_configs:
+            self.stdout.write(self.style.WARNING("No open or upcoming enrollment."))
+            return
+
+        result = prewarm_user_enrollment_configs(
+            enrollment_configs=enrollment_configs,
+            user_emails=emails,
+            ticket_api=di.ticket_api,
+            enrollment_config_repo=di.uow.enrollment_configs,
+            workers=cast("int", options["workers"]),
+        )
+
+        self.stdout.write(
+            f"Summary: {result.created} created, {result.existing} already existed, "
+            f"{len(result.failed_emails)} failed"
+        )
+        for email in result.failed_emails:
+            self.stdout.write(self.style.ERROR(f"Lookup failed: {email}"))
@@ -0,0 +1,45 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_participant_counters(apps, schema_editor):
+    Session = apps.get_model("db_main", "Session")
+    SessionParticipation = apps.get_model("db_main", "SessionParticipation")
+
+    def count(status):
+        return Coalesce(
+            Subquery(
+                SessionParticipation.objects.filter(
+                    session=OuterRef("pk"), status=status
+                )
+                .values("session")
+                .annotate(count=Count("pk"))
+                .values("count")
+            ),
+            0,
+        )
+
+    Session.objects.update(
+        confirmed_participants_count=count("confirmed"),
+        waiting_participants_count=count("waiting"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("db_main", "0079_remove_session_session_min_age_range_and_more")]
+
+    operations = [
+        migrations.AddField(
+            model_name="session",
+            name="confirmed_participants_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="session",
+            name="waiting_participants_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_participant_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,149 @@
+from itertools import batched
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+SEARCH_INDEX_SQL = {
+    "postgresql": (
+        (
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            (
+                "CREATE INDEX session_search_document_trgm "
+                "ON session_search_document USING gin (document gin_trgm_ops)"
+            ),
+            (
+                "CREATE INDEX session_search_document_tsv "
+                "ON session_search_document USING gin (to_tsvector('simple', document))"
+            ),
+        ),
+        (
+            "DROP INDEX IF EXISTS session_search_document_tsv",
+            "DROP INDEX IF EXISTS session_search_document_trgm",
+        ),
+    ),
+    "sqlite": (
+        (
+            (
+                "CREATE VIRTUAL TABLE session_search_document_fts USING fts5("
+                "document, content='session_search_document', "
+                "content_rowid='session_id', tokenize='trigram')"
+            ),
+            (
+                "CREATE TRIGGER session_search_document_ai "
+                "AFTER INSERT ON session_search_document BEGIN "
+                "INSERT INTO session_search_document_fts(rowid, document) "
+                "VALUES (new.session_id, new.document); END"
+            ),
+            (
+                "CREATE TRIGGER session_search_document_ad "
+                "AFTER DELETE ON session_search_document BEGIN "
+                "INSERT INTO session_search_document_fts"
+                "(session_search_document_fts, rowid, document) "
+                "VALUES ('delete', old.session_id, old.document); END"
+            ),
+            (
+                "CREATE TRIGGER session_search_document_au "
+                "AFTER UPDATE ON session_search_document BEGIN "
+                "INSERT INTO session_search_document_fts"
+                "(session_search_document_fts, rowid, document) "
+                "VALUES ('delete', old.session_id, old.document); "
+                "INSERT INTO session_search_document_fts(rowid, document) "
+                "VALUES (new.session_id, new.document); END"
+            ),
+        ),
+        (
+            "DROP TRIGGER IF EXISTS session_search_document_au",
+            "DROP TRIGGER IF EXISTS session_search_document_ad",
+            "DROP TRIGGER IF EXISTS session_search_document_ai",
+            "DROP TABLE IF EXISTS session_search_document_fts",
+        ),
+    ),
+}
+
+
+def _run(schema_editor, direction):
+    statements = SEARCH_INDEX_SQL.get(schema_editor.connection.vendor)
+    for statement in statements[direction] if statements else ():
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    _run(schema_editor, 0)
+
+
+def drop_search_index(apps, schema_editor):
+    _run(schema_editor, 1)
+
+
+def _text(value):
+    if isinstance(value, list):
+        return " ".join(_text(item) for item in value)
+    return "" if value is None else str(value)
+
+
+def populate_search_documents(apps, schema_editor):
+    Session = apps.get_model("db_main", "Session")
+    SessionSearchDocument = apps.get_model("db_main", "SessionSearchDocument")
+
+    sessions = (
+        Session.objects.select_related("presenter", "category")
+        .prefetch_related("facilitators", "tracks", "field_values")
+        .order_by("pk")
+    )
+    for batch in batched(
+        sessions.iterator(chunk_size=BATCH_SIZE), BATCH_SIZE, strict=False
+    ):
+        documents = []
+        for session in batch:
+            parts = [session.title, session.display_name]
+            if session.presenter is not None:
+                parts.append(session.presenter.name)
+            parts.extend(f.display_name for f in session.facilitators.all())
+            parts.extend(t.name for t in session.tracks.all())
+            parts.extend(_text(v.value) for v in session.field_values.all())
+            documents.append(
+                SessionSearchDocument(
+                    session=session,
+                    event_id=getattr(session.category, "event_id", None),
+                    document="\n".join(part for part in parts if part).lower(),
+                )
+            )
+        SessionSearchDocument.objects.bulk_create(documents)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("db_main", "0080_session_participant_counters")]
+
+    operations = [
+        migrations.CreateModel(
+            name="SessionSearchDocument",
+            fields=[
+                (
+                    "session",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="db_main.session",
+                    ),
+                ),
+                ("document", models.TextField(blank=True, default="")),
+                (
+                    "event",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="db_main.event",
+                    ),
+                ),
+            ],
+            options={"db_table": "session_search_document"},
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+import re
+from itertools import batched
+
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?")
+
+
+def _minutes(duration):
+    if not (m := DURATION_RE.match(duration)):
+        return 0
+    return int(m.group(1) or 0) * 60 + int(m.group(2) or 0)
+
+
+def populate_duration_minutes(apps, schema_editor):
+    Session = apps.get_model("db_main", "Session")
+
+    sessions = Session.objects.exclude(duration="").only("pk", "duration")
+    for batch in batched(
+        sessions.iterator(chunk_size=BATCH_SIZE), BATCH_SIZE, strict=False
+    ):
+        for session in batch:
+            session.duration_minutes = _minutes(session.duration)
+        Session.objects.bulk_update(batch, ["duration_minutes"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("db_main", "0081_session_search_document")]
+
+    operations = [
+        migrations.AddField(
+            model_name="session",
+            name="duration_minutes",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_duration_minutes, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(
+                fields=["category", "title", "id"], name="session_category_title_idx"
+            ),
+        ),
+    ]
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import math
+import re
 import sys
+from collections import Counter
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, ClassVar, Never, cast
+from itertools import batched
+from typing import TYPE_CHECKING, Any, ClassVar, Never, Self, cast
 
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, UserManager
 from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.db.models import F, Q
-from django.db.models.functions import Lower
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Greatest, Lower
 from django.utils import timezone
 from django.utils.timezone import localtime
 from django.utils.translation import gettext_lazy as _
@@ -24,7 +28,7 @@ from ludamus.pacts import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Collection
+    from collections.abc import Collection, Iterable
 
     from ludamus.pacts import EventDTO, UserDTO
 
@@ -33,6 +37,8 @@ MAX_SLUG_RETRIES = 10
 RANDOM_SLUG_BYTES = 7  # 10 characters
 DEFAULT_NAME = "Andrzej"
 MAX_CONNECTED_USERS = 6  # Maximum number of connected users per manager
+RECONCILE_BATCH_SIZE = 500
+SEARCH_BATCH_SIZE = 500
 
 
 class User(AbstractBaseUser, PermissionsMixin):
@@ -619,7 +625,104 @@ class Facilitator(models.Model):
         return self.display_name
 
 
+_PARTICIPANT_COUNT_FIELDS: dict[str | None, str] = {
+    SessionParticipationStatus.CONFIRMED: "confirmed_participants_count",
+    SessionParticipationStatus.WAITING: "waiting_participants_count",
+}
+
+
+def _participation_count(status: SessionParticipationStatus) -> Coalesce:
+    return Coalesce(
+        Subquery(
+            SessionParticipation.objects.filter(session=OuterRef("pk"), status=status)
+            .values("session")
+            .annotate(count=Count("pk"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+_ISO8601_DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?")
+
+
+def duration_to_minutes(duration: str) -> int:
+    """Convert an ISO 8601 ``PT#H#M`` duration to whole minutes (0 if invalid).
+
+    Returns:
+        Number of minutes.
+    """
+    if not (m := _ISO8601_DURATION_RE.match(duration)):
+        return 0
+    hours = int(m.group(1) or 0)
+    minutes = int(m.group(2) or 0)
+    return hours * 60 + minutes
+
+
 class SessionManager(models.Manager["Session"]):
+    def adjust_participant_counts(
+        self, session_id: int, *, old_status: str | None, new_status: str | None
+    ) -> None:
+        """Move a participation between the materialized session counters."""
+        if old_status == new_status:
+            return
+        updates: dict[str, Any] = {}
+        if field := _PARTICIPANT_COUNT_FIELDS.get(old_status):
+            updates[field] = Greatest(F(field) - 1, 0)
+        if field := _PARTICIPANT_COUNT_FIELDS.get(new_status):
+            updates[field] = F(field) + 1
+        if updates:
+            self.filter(pk=session_id).update(**updates)
+
+    def reconcile_participant_counts(
+        self, session_ids: Collection[int] | None = None
+    ) -> int:
+        """Recount participations and repair drifted session counters.
+
+        Each batch is recounted under a row lock, so enrollments running at the
+        same time cannot be lost between the count and the write.
+
+        Returns:
+            Number of sessions whose counters were corrected.
+        """
+        sessions = self.get_queryset().order_by("pk")
+        if session_ids is not None:
+            sessions = sessions.filter(pk__in=session_ids)
+        pks = list(sessions.values_list("pk", flat=True))
+        fields = list(_PARTICIPANT_COUNT_FIELDS.values())
+        corrected = 0
+        for start in range(0, len(pks), RECONCILE_BATCH_SIZE):
+            with transaction.atomic():
+                batch = (
+                    self.get_queryset()
+                    .select_for_update()
+                    .filter(pk__in=pks[start : start + RECONCILE_BATCH_SIZE])
+                    .only("pk", *fields)
+                    .annotate(
+                        confirmed_recount=_participation_count(
+                            SessionParticipationStatus.CONFIRMED
+                        ),
+                        waiting_recount=_participation_count(
+                            SessionParticipationStatus.WAITING
+                        ),
+                    )
+                )
+                drifted = []
+                for session in batch:
+                    recount = (session.confirmed_recount, session.waiting_recount)
+                    if recount != (
+                        session.confirmed_participants_count,
+                        session.waiting_participants_count,
+                    ):
+                        (
+                            session.confirmed_participants_count,
+                            session.waiting_participants_count,
+                        ) = recount
+                        drifted.append(session)
+                self.bulk_update(drifted, fields)
+                corrected += len(drifted)
+        return corrected
+
     def has_conflicts(self, session: Session, user: UserDTO) -> bool:
         return (
             self.get_queryset()
@@ -682,6 +785,9 @@ class Session(models.Model):
         blank=True,
         help_text="ISO 8601 duration, e.g. PT1H30M",
     )
+    # ``duration`` in minutes, kept in sync by save() and SessionRepository.update
+    # so the timetable can filter by length in SQL.
+    duration_minutes = models.PositiveIntegerField(default=0, editable=False)
     tags = models.ManyToManyField(Tag, blank=True)
     # Preferences
     time_slots = models.ManyToManyField(TimeSlot, blank=True)
@@ -696,6 +802,13 @@ class Session(models.Model):
     modification_time = models.DateTimeField(auto_now=True)
     # Participants
     participants_limit = models.PositiveIntegerField()
+    # Materialized participation counters, moved by SessionParticipation.save()
+    # and delete(); drift from bulk writes is repaired by
+    # ``manage.py reconcile_participant_counts``.
+    confirmed_participants_count = models.PositiveIntegerField(
+        default=0, editable=False
+    )
+    waiting_participants_count = models.PositiveIntegerField(default=0, editable=False)
     min_age = models.PositiveIntegerField(
         default=0, help_text="Minimum age requirement (0 = no restriction)"
     )
@@ -719,27 +832,36 @@ class Session(models.Model):
                 name="session_min_age_range",
             ),
         )
+        indexes = (
+            models.Index(
+                fields=("category", "title", "id"), name="session_category_title_idx"
+            ),
+        )
 
     def __str__(self) -> str:
         return self.title
 
+    def save(self, **kwargs: Any) -> None:
+        self.duration_minutes = duration_to_minutes(self.duration)
+        if (update_fields := kwargs.get("update_fields")) is not None and (
+            "duration" in update_fields
+        ):
+            kwargs["update_fields"] = {*update_fields, "duration_minutes"}
+        super().save(**kwargs)
+
     @property
     def enrolled_count(self) -> int:
-        # Use cached count if available from annotation, otherwise query
+        # Use cached count if available from annotation, otherwise the counter
         if hasattr(self, "enrolled_count_cached"):
             return cast("int", self.enrolled_count_cached)
-        return self.session_participations.filter(
-            status=SessionParticipationStatus.CONFIRMED
-        ).count()
+        return self.confirmed_participants_count
 
     @property
     def waiting_count(self) -> int:
-        # Use cached count if available from annotation, otherwise query
+        # Use cached count if available from annotation, otherwise the counter
         if hasattr(self, "waiting_count_cached"):
             return cast("int", self.waiting_count_cached)
-        return self.session_participations.filter(
-            status=SessionParticipationStatus.WAITING
-        ).count()
+        return self.waiting_participants_count
 
     @property
     def effective_participants_limit(self) -> int:
@@ -747,11 +869,29 @@ class Session(models.Model):
         if self.participants_limit == 0:
             return 0
         event = self.agenda_item.space.area.venue.event
-        if enrollment_config := event.get_most_liberal_config(self):
-            return math.ceil(
-                self.participants_limit * enrollment_config.percentage_slots / 100
-            )
-        return self.participants_limit
+        return self.get_effective_participants_limit(
+            event.get_active_enrollment_configs()
+        )
+
+    def get_effective_participants_limit(
+        self, active_configs: Iterable[EnrollmentConfig]
+    ) -> int:
+        """Get effective participants limit under already loaded active configs.
+
+        Returns:
+            The limit scaled by the most liberal eligible config, if any.
+        """
+        if self.participants_limit == 0:
+            return 0
+        eligible_configs = [
+            config for config in active_configs if config.is_session_eligible(self)
+        ]
+        if not eligible_configs:
+            return self.participants_limit
+        enrollment_config = max(eligible_configs, key=lambda c: c.percentage_slots)
+        return math.ceil(
+            self.participants_limit * enrollment_config.percentage_slots / 100
+        )
 
     @property
     def is_full(self) -> bool:
@@ -773,20 +913,40 @@ class Session(models.Model):
         """Get complete participant information display."""
         # TODO(@fancysnake): This is used in templates. Rewrite to pass static values
         # ZAG-16
-        if self.effective_participants_limit == 0:
-            base_info = str(self.enrolled_count)
-        else:
-            base_info = f"{self.enrolled_count}/{self.effective_participants_limit}"
+        return format_participant_info(
+            enrolled_count=self.enrolled_count,
+            waiting_count=self.waiting_count,
+            effective_limit=self.effective_participants_limit,
+            participants_limit=self.participants_limit,
+        )
+
 
-            # Add session limit if different from effective limit
-            if self.effective_participants_limit != self.participants_limit:
-                base_info += f" (session limit: {self.participants_limit})"
+def format_participant_info(
+    *,
+    enrolled_count: int,
+    waiting_count: int,
+    effective_limit: int,
+    participants_limit: int,
+) -> str:
+    """Get complete participant information display.
+
+    Returns:
+        Enrolled count against the effective limit, plus the waiting list.
+    """
+    if effective_limit == 0:
+        base_info = str(enrolled_count)
+    else:
+        base_info = f"{enrolled_count}/{effective_limit}"
+
+        # Add session limit if different from effective limit
+        if effective_limit != participants_limit:
+            base_info += f" (session limit: {participants_limit})"
 
-        # Add waiting list info
-        if self.waiting_count > 0:
-            base_info += f", {self.waiting_count} waiting"
+    # Add waiting list info
+    if waiting_count > 0:
+        base_info += f", {waiting_count} waiting"
 
-        return base_info
+    return base_info
 
 
 class AgendaItem(models.Model):
@@ -888,6 +1048,9 @@ class SessionParticipation(models.Model):
         choices=[(item.value, item.name) for item in SessionParticipationStatus],
     )
 
+    # Status as last read from or written to the database
+    saved_status: str | None = None
+
     class Meta:
         unique_together = (("session", "user"),)
         db_table = "session_participant"
@@ -895,6 +1058,31 @@ class SessionParticipation(models.Model):
     def __str__(self) -> str:
         return f"{self.user.name} {self.status} on {self.session}"
 
+    def save(self, **kwargs: Any) -> None:
+        with transaction.atomic(savepoint=False):
+            super().save(**kwargs)
+            Session.objects.adjust_participant_counts(
+                self.session_id, old_status=self.saved_status, new_status=self.status
+            )
+        self.saved_status = self.status
+
+    def delete(self, *args: Any, **kwargs: Any) -> tuple[int, dict[str, int]]:
+        with transaction.atomic(savepoint=False):
+            result = super().delete(*args, **kwargs)
+            Session.objects.adjust_participant_counts(
+                self.session_id, old_status=self.saved_status, new_status=None
+            )
+        self.saved_status = None
+        return result
+
+    @classmethod
+    def from_db(
+        cls, db: str | None, field_names: Collection[str], values: Collection[Any]
+    ) -> Self:
+        instance = super().from_db(db, field_names, values)
+        instance.saved_status = instance.__dict__.get("status")
+        return instance
+
 
 class PersonalDataFieldType(models.TextChoices):
     TEXT = "text", "Text"
@@ -1035,6 +1223,100 @@ class HostPersonalData(models.Model):
         return f"{self.field.name}: {value_preview}"
 
 
+def _search_text(value: object) -> str:
+    if isinstance(value, list):
+        return " ".join(_search_text(item) for item in value)
+    return "" if value is None else str(value)
+
+
+def build_search_document(session: Session) -> str:
+    """Flatten a session's searchable text into one lower-cased document.
+
+    Expects presenter, facilitators, tracks and field_values to be loaded.
+
+    Returns:
+        Title, host names, facilitators, track names and field values, one
+        per line.
+    """
+    parts = [session.title, session.display_name]
+    if session.presenter is not None:
+        parts.append(session.presenter.name)
+    parts.extend(f.display_name for f in session.facilitators.all())
+    parts.extend(t.name for t in session.tracks.all())
+    parts.extend(_search_text(v.value) for v in session.field_values.all())
+    return "\n".join(part for part in parts if part).lower()
+
+
+class SessionSearchDocumentManager(models.Manager["SessionSearchDocument"]):
+    def refresh(self, session_ids: Iterable[int] | None = None) -> int:
+        """Rebuild search documents of the given sessions (all when None).
+
+        Returns:
+            Number of documents written.
+        """
+        sessions = Session.objects.select_related("presenter", "category")
+        stale = self.all()
+        if session_ids is not None:
+            ids = list(session_ids)
+            sessions = sessions.filter(pk__in=ids)
+            stale = stale.filter(session_id__in=ids)
+        sessions = sessions.prefetch_related(
+            "facilitators",
+            "tracks",
+            models.Prefetch(
+                "field_values",
+                queryset=SessionFieldValue.objects.only("session_id", "value"),
+            ),
+        ).order_by("pk")
+
+        written = 0
+        with transaction.atomic(savepoint=False):
+            stale.delete()
+            for batch in batched(
+                sessions.iterator(chunk_size=SEARCH_BATCH_SIZE),
+                SEARCH_BATCH_SIZE,
+                strict=False,
+            ):
+                documents = [
+                    SessionSearchDocument(
+                        session=session,
+                        event_id=getattr(session.category, "event_id", None),
+                        document=build_search_document(session),
+                    )
+                    for session in batch
+                ]
+                written += len(self.bulk_create(documents))
+        return written
+
+
+class SessionSearchDocument(models.Model):
+    """Denormalized full-text document of a session for panel search.
+
+    Kept current by signal handlers in ``ludamus.links.db.django.session_search``.
+    On Postgres the document carries trigram and ``tsvector`` GIN indexes; on
+    SQLite an FTS5 (trigram) table mirrors it through triggers.
+    """
+
+    session = models.OneToOneField(
+        Session,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_document",
+    )
+    event = models.ForeignKey(
+        Event, on_delete=models.CASCADE, null=True, related_name="+"
+    )
+    document = models.TextField(default="", blank=True)
+
+    objects = SessionSearchDocumentManager()
+
+    class Meta:
+        db_table = "session_search_document"
+
+    def __str__(self) -> str:
+        return f"Search document of session {self.session_id}"
+
+
 class SessionFieldType(models.TextChoices):
     TEXT = "text", "Text"
     SELECT = "select", "Select"
@@ -1313,6 +1595,57 @@ class ScheduleChangeLog(models.Model):
         return f"{self.action} {self.session} by {self.user}"
 
 
+@dataclass(frozen=True)
+class EnrollmentEligibility:
+    """Enrollment state of several users for one session."""
+
+    participations: dict[int, SessionParticipation]
+    conflicting_user_ids: frozenset[int]
+    waitlist_counts: Counter[int]
+
+    def has_conflict(self, user_id: int) -> bool:
+        return user_id in self.conflicting_user_ids
+
+
+def get_enrollment_eligibility(
+    session: Session, user_ids: Collection[int]
+) -> EnrollmentEligibility:
+    """Load what enrollment decisions need for many users in one query.
+
+    Answers ``SessionManager.has_conflicts``, the per-user waitlist count and
+    the current participation in ``session`` for every user at once, from the
+    users' participations in the session's event.
+
+    Returns:
+        The eligibility of all given users.
+    """
+    agenda_item = session.agenda_item
+    participations: dict[int, SessionParticipation] = {}
+    conflicting_user_ids: set[int] = set()
+    waitlist_counts: Counter[int] = Counter()
+    for participation in SessionParticipation.objects.filter(
+        user_id__in=user_ids,
+        session__agenda_item__space__area__venue__event_id=agenda_item.space.area.venue.event_id,
+    ).select_related("session__agenda_item"):
+        user_id = participation.user_id
+        if participation.status == SessionParticipationStatus.WAITING:
+            waitlist_counts[user_id] += 1
+        if participation.session_id == session.pk:
+            participations[user_id] = participation
+            continue
+        other = participation.session.agenda_item
+        if participation.status == SessionParticipationStatus.CONFIRMED and (
+            agenda_item.start_time <= other.start_time < agenda_item.end_time
+            or agenda_item.start_time < other.end_time <= agenda_item.end_time
+        ):
+            conflicting_user_ids.add(user_id)
+    return EnrollmentEligibility(
+        participations=participations,
+        conflicting_user_ids=frozenset(conflicting_user_ids),
+        waitlist_counts=waitlist_counts,
+    )
+
+
 def can_enroll_users(
     *,
     users: list[UserDTO],
@@ -17,6 +17,7 @@ from ludamus.adapters.db.django.models import (
     Space,
     TimeSlot,
     can_enroll_users,
+    get_enrollment_eligibility,
     get_used_slots,
     get_vc_available_slots,
 )
@@ -72,8 +73,7 @@ class ConnectedUserForm(BaseUserForm):
 
 def _can_join_waitlist(
     *,
-    user: UserDTO,
-    session: Session,
+    current_waitlist_count: int,
     enrollment_config: EnrollmentConfig | None,
     current_user_enrollment_config: VirtualEnrollmentConfig | None,
 ) -> bool:
@@ -87,11 +87,6 @@ def _can_join_waitlist(
     ):
         return False
 
-    current_waitlist_count = SessionParticipation.objects.filter(
-        user_id=user.pk,
-        status=SessionParticipationStatus.WAITING,
-        session__agenda_item__space__area__venue__event=session.agenda_item.space.area.venue.event,
-    ).count()
     return current_waitlist_count < enrollment_config.max_waitlist_sessions
 
 
@@ -315,14 +310,13 @@ def create_enrollment_form(
     form_fields: dict[str, _UserEnrollmentChoiceField] = {}
     field_to_user_name: dict[str, str] = {}
 
-    for user in (current_user, *connected_users):
-        current_participation = SessionParticipation.objects.filter(
-            session=session, user_id=user.pk
-        ).first()
-        has_conflict = Session.objects.has_conflicts(session, user)
+    users = [current_user, *connected_users]
+    eligibility = get_enrollment_eligibility(session, [user.pk for user in users])
+    for user in users:
+        current_participation = eligibility.participations.get(user.pk)
+        has_conflict = eligibility.has_conflict(user.pk)
         can_join_wl = _can_join_waitlist(
-            user=user,
-            session=session,
+            current_waitlist_count=eligibility.waitlist_counts[user.pk],
             enrollment_config=enrollment_config,
             current_user_enrollment_config=current_user_enrollment_config,
         )
@@ -35,15 +35,17 @@ class RequestContextMiddleware:
             return self.get_response(request)
 
         sphere_repository = request.di.uow.spheres
-        root_sphere = sphere_repository.read_by_domain(settings.ROOT_DOMAIN)
+        root_sphere, root_site = sphere_repository.resolve_domain(settings.ROOT_DOMAIN)
         try:
-            current_sphere = sphere_repository.read_by_domain(request.get_host())
+            current_sphere, current_site = sphere_repository.resolve_domain(
+                request.get_host()
+            )
         except NotFoundError:
             host = request.get_host().split(":", 1)[0]
             if settings.ENV == "development" and (
                 host == "127.0.0.1" or host.endswith((".localhost", ".local"))
             ):
-                current_sphere = root_sphere
+                current_sphere, current_site = root_sphere, root_site
             else:
                 url = f"{request.scheme}://{settings.ROOT_DOMAIN}{reverse('web:index')}"
                 messages.error(request, _("Sphere not found"))
@@ -57,6 +59,9 @@ class RequestContextMiddleware:
                 current_site_id=current_sphere.site_id,
                 current_user_slug=request.user.slug,
                 current_user_id=request.user.pk,
+                current_sphere=current_sphere,
+                current_site=current_site,
+                root_site=root_site,
             )
         else:
             request.context = RequestContext(
@@ -64,6 +69,9 @@ class RequestContextMiddleware:
                 current_sphere_id=current_sphere.pk,
                 root_site_id=root_sphere.site_id,
                 current_site_id=current_sphere.site_id,
+                current_sphere=current_sphere,
+                current_site=current_site,
+                root_site=root_site,
             )
 
         return self.get_response(request)
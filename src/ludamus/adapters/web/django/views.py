@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 from collections import defaultdict
@@ -23,7 +24,10 @@ from django.http import Http404, HttpRequest, HttpResponse, HttpResponseRedirect
 from django.shortcuts import redirect
 from django.template.response import TemplateResponse
 from django.urls import reverse, reverse_lazy
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 from django.utils.text import slugify
+from django.utils.translation import get_language
 from django.utils.translation import gettext as _
 from django.views.generic.base import ContextMixin, RedirectView, TemplateView, View
 from django.views.generic.detail import DetailView, SingleObjectTemplateResponseMixin
@@ -41,6 +45,8 @@ from ludamus.adapters.db.django.models import (
     SessionParticipation,
     SessionParticipationStatus,
     can_enroll_users,
+    format_participant_info,
+    get_enrollment_eligibility,
 )
 from ludamus.adapters.oauth import oauth
 from ludamus.adapters.web.django.entities import (
@@ -101,8 +107,14 @@ if TYPE_CHECKING:
 
     from django.db.models.query import QuerySet
 
+    from ludamus.adapters.db.django.models import EnrollmentEligibility
+    from ludamus.pacts import SiteDTO
+
 MINIMUM_ALLOWED_USER_AGE = 16
 CACHE_TIMEOUT = 600  # 10 minutes
+# Sessions start and end and membership checks expire without a write, so
+# page validators also change every window.
+PAGE_VERSION_WINDOW = 60
 
 
 class LoginRequiredPageView(TemplateView):
@@ -118,6 +130,12 @@ class LoginRequiredPageView(TemplateView):
         return context
 
 
+def _root_site(request: RootRequest) -> SiteDTO:
+    return request.context.root_site or request.di.uow.spheres.read_site(
+        request.context.root_sphere_id
+    )
+
+
 class Auth0LoginActionView(View):
     @staticmethod
     def get(request: RootRequest) -> HttpResponse:
@@ -129,9 +147,7 @@ class Auth0LoginActionView(View):
         Raises:
             RedirectError: If the request is not from the root domain.
         """
-        root_domain = request.di.uow.spheres.read_site(
-            request.context.root_sphere_id
-        ).domain
+        root_domain = _root_site(request).domain
         next_path = request.GET.get("next")
         if request.get_host() != root_domain:
             if next_path:
@@ -351,8 +367,11 @@ class Auth0LogoutActionView(RedirectView):
 
         django_logout(self.request)
 
-        last_domain = self.request.di.uow.spheres.read_site(
-            self.request.context.current_sphere_id
+        last_domain = (
+            self.request.context.current_site
+            or self.request.di.uow.spheres.read_site(
+                self.request.context.current_sphere_id
+            )
         ).domain
         messages.success(self.request, _("You have been successfully logged out."))
 
@@ -367,9 +386,7 @@ def _auth0_logout_url(
     last_domain: str | None = None,
     redirect_to: str | None = None,
 ) -> str:
-    root_domain = request.di.uow.spheres.read_site(
-        request.context.root_sphere_id
-    ).domain
+    root_domain = _root_site(request).domain
     last_domain = last_domain or root_domain
     redirect_to = redirect_to or reverse("web:index")
     return f"https://{settings.AUTH0_DOMAIN}/v2/logout?" + urlencode(
@@ -737,13 +754,37 @@ class UserDiscordUsernameComponentView(View):
             user = request.di.uow.active_users.read(user_slug)
         except NotFoundError:
             return HttpResponse(status=404)
+        etag = _etag(user.discord_username)
+        if not_modified := get_conditional_response(request, etag=etag):
+            return _with_validators(not_modified, etag)
         if user.discord_username:
-            return TemplateResponse(
+            response: HttpResponse = TemplateResponse(
                 request,
                 "crowd/user/parts/discord_username.html",
                 {"discord_username": user.discord_username},
             )
-        return HttpResponse("")
+        else:
+            response = HttpResponse("")
+        return _with_validators(response, etag)
+
+
+def _etag(*parts: object) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(f"{part}\0".encode())
+    return quote_etag(digest.hexdigest())
+
+
+def _with_validators(
+    response: HttpResponse, etag: str, last_modified: datetime | None = None
+) -> HttpResponse:
+    # Responses differ per user, so only the browser may keep them and it has
+    # to revalidate every time.
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(int(last_modified.timestamp()))
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
 
 
 def _get_displayed_field_ids(event: Event) -> set[int]:
@@ -794,12 +835,59 @@ class EventPageView(DetailView):  # type: ignore [type-arg]
         return (
             Event.objects.filter(sphere_id=self.request.context.current_sphere_id)
             .select_related("sphere")
-            .prefetch_related(
-                "venues__areas__spaces__agenda_items__session__field_values__field",
-                "venues__areas__spaces__agenda_items__session__session_participations__user",
-                "enrollment_configs",
-            )
+            .prefetch_related("enrollment_configs")
+        )
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Answer a conditional GET before building the schedule.
+
+        The validators combine the event's and the user's page versions,
+        the current ``PAGE_VERSION_WINDOW`` and whatever else about the
+        request the page varies on.
+
+        Returns:
+            ``304 Not Modified`` when the client's copy is current, otherwise
+            the rendered page.
+        """
+        if (validators := self._get_validators()) is None:
+            response: HttpResponse = super().get(request, *args, **kwargs)
+            return response
+        etag, last_modified = validators
+        if not_modified := get_conditional_response(
+            request, etag=etag, last_modified=int(last_modified.timestamp())
+        ):
+            return _with_validators(not_modified, etag, last_modified)
+        response = super().get(request, *args, **kwargs)
+        return _with_validators(response, etag, last_modified)
+
+    def _get_validators(self) -> tuple[str, datetime] | None:
+        session = self.request.session
+        if messages.get_messages(self.request) or (
+            # The page clears an anonymous enrollment left over from before login
+            self.request.context.current_user_id
+            and session.get("anonymous_enrollment_active")
+        ):
+            return None
+        version = self.request.di.uow.events.read_page_version(
+            self.kwargs["slug"],
+            self.request.context.current_sphere_id,
+            self.request.context.current_user_id,
+        )
+        if version is None:
+            return None
+        now = datetime.now(tz=UTC)
+        window = int(now.timestamp()) // PAGE_VERSION_WINDOW
+        etag = _etag(
+            version.tag,
+            window,
+            self.request.context.current_user_id,
+            get_language(),
+            session.get("anonymous_enrollment_active"),
+            session.get("anonymous_user_code"),
+            session.get("anonymous_site_id"),
         )
+        window_start = datetime.fromtimestamp(window * PAGE_VERSION_WINDOW, tz=UTC)
+        return etag, max(version.modified_at, window_start)
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
@@ -807,16 +895,13 @@ class EventPageView(DetailView):  # type: ignore [type-arg]
         if not self.object.is_published and not _is_manager(self.request):
             raise Http404
 
-        # Get all sessions for this event that are published
-        event_sessions = (
+        # Get all sessions for this event that are published. Everything the page
+        # shows is loaded here in a fixed number of queries and turned into
+        # SessionData in a single pass below.
+        event_sessions = list(
             Session.objects.filter(agenda_item__space__area__venue__event=self.object)
-            .select_related("presenter", "agenda_item__space", "sphere")
-            .prefetch_related(
-                "tags__category",
-                "session_participations__user__manager",
-                "session_participations__user__connected",
-                "agenda_item__space__area__venue__event__enrollment_configs",
-            )
+            .select_related("presenter", "agenda_item__space__area__venue")
+            .prefetch_related("field_values__field", "session_participations__user")
             .annotate(
                 enrolled_count_cached=Count(
                     "session_participations",
@@ -834,11 +919,11 @@ class EventPageView(DetailView):  # type: ignore [type-arg]
             .order_by("agenda_item__start_time")
         )
 
-        hour_data = dict(self._get_hour_data(event_sessions))
         # Get session data objects that include enrollment status
         sessions_data = self._get_session_data(event_sessions)
 
         current_time = datetime.now(tz=UTC)
+        hour_data: dict[datetime, list[SessionData]] = defaultdict(list)
         ended_hour_data: dict[datetime, list[SessionData]] = defaultdict(list)
         current_hour_data: dict[datetime, list[SessionData]] = defaultdict(list)
         future_unavailable_hour_data: dict[datetime, list[SessionData]] = defaultdict(
@@ -849,6 +934,7 @@ class EventPageView(DetailView):  # type: ignore [type-arg]
             session_end_time = session_data.agenda_item.end_time
             session_start_time = session_data.agenda_item.start_time
             hour_key = session_start_time
+            hour_data[hour_key].append(session_data)
             # Check if session has ended
             if session_end_time <= current_time:
                 ended_hour_data[hour_key].append(session_data)
@@ -863,7 +949,7 @@ class EventPageView(DetailView):  # type: ignore [type-arg]
 
         context.update(
             {
-                "hour_data": hour_data,  # Keep original for backward compatibility
+                "hour_data": dict(hour_data),  # Kept for backward compatibility
                 "sessions": list(sessions_data.values()),
                 "ended_hour_data": dict(ended_hour_data),
                 "current_hour_data": dict(current_hour_data),
@@ -989,7 +1075,7 @@ class EventPageView(DetailView):  # type: ignore [type-arg]
         }
 
     def _set_user_participations(
-        self, sessions: dict[int, SessionData], event_sessions: QuerySet[Session]
+        self, sessions: dict[int, SessionData], event_sessions: list[Session]
     ) -> None:
         anonymous_service = AnonymousEnrollmentService(
             self.request.di.uow.anonymous_users
@@ -1008,8 +1094,8 @@ class EventPageView(DetailView):  # type: ignore [type-arg]
 
             # Pre-fetch all participations for relevant users and sessions
             participations = SessionParticipation.objects.filter(
-                session__in=event_sessions, user_id__in=[u.pk for u in all_users]
-            ).select_related("user", "session")
+                session_id__in=list(sessions), user_id__in=[u.pk for u in all_users]
+            )
 
             # Create lookup dictionaries for efficient access
             participation_by_user_session: dict[tuple[int, int], list[str]] = (
@@ -1052,8 +1138,8 @@ class EventPageView(DetailView):  # type: ignore [type-arg]
                 if anonymous_user:
                     # Pre-fetch anonymous user participations for event sessions
                     anonymous_participations = SessionParticipation.objects.filter(
-                        session__in=event_sessions, user_id=anonymous_user.pk
-                    ).select_related("session")
+                        session_id__in=list(sessions), user_id=anonymous_user.pk
+                    )
 
                     # Create lookup dictionary for anonymous user
                     anonymous_participation_by_session: dict[int, list[str]] = (
@@ -1078,22 +1164,13 @@ class EventPageView(DetailView):  # type: ignore [type-arg]
                             SessionParticipationStatus.WAITING in statuses
                         )
 
-    def _get_hour_data(
-        self, event_sessions: QuerySet[Session]
-    ) -> dict[datetime, list[SessionData]]:
-        sessions_data = self._get_session_data(event_sessions)
-
-        sessions_by_hour: dict[datetime, list[SessionData]] = defaultdict(list)
-        for session in event_sessions:
-            sessions_by_hour[session.agenda_item.start_time].append(
-                sessions_data[session.id]
-            )
-
-        return sessions_by_hour
-
     def _get_session_data(
-        self, event_sessions: QuerySet[Session]
+        self, event_sessions: list[Session]
     ) -> dict[int, SessionData]:
+        # The event (with its prefetched enrollment configs) is shared by every
+        # session, so enrollment rules are evaluated against it once instead of
+        # walking agenda_item.space.area.venue.event per session.
+        active_configs = self.object.get_active_enrollment_configs()
         sessions_data = {}
         for session in event_sessions:
             area = getattr(
@@ -1115,15 +1192,27 @@ class EventPageView(DetailView):  # type: ignore [type-arg]
                     slug="",
                     username=presenter_name,
                 )
+            effective_limit = session.get_effective_participants_limit(active_configs)
+            enrolled_count = session.enrolled_count
             sessions_data[session.id] = SessionData(
-                effective_participants_limit=session.effective_participants_limit,
-                full_participant_info=session.full_participant_info,
+                effective_participants_limit=effective_limit,
+                full_participant_info=format_participant_info(
+                    enrolled_count=enrolled_count,
+                    waiting_count=session.waiting_count,
+                    effective_limit=effective_limit,
+                    participants_limit=session.participants_limit,
+                ),
                 agenda_item=AgendaItemDTO.model_validate(session.agenda_item),
                 session=SessionDTO.model_validate(session),
                 presenter=presenter,
                 field_values=_field_value_dtos_from_models(session.field_values.all()),
-                is_enrollment_available=session.is_enrollment_available,
-                is_full=session.is_full,
+                is_enrollment_available=any(
+                    config.is_session_eligible(session) for config in active_configs
+                ),
+                is_full=(
+                    session.participants_limit != 0
+                    and enrolled_count >= effective_limit
+                ),
                 loc=LocationData(
                     space=SpaceDTO.model_validate(session.agenda_item.space),
                     area=(  # TODO(fancysnake): Fix after merging venues
@@ -1133,7 +1222,7 @@ class EventPageView(DetailView):  # type: ignore [type-arg]
                         VenueDTO.model_validate(area.venue) if area else None
                     ),
                 ),
-                enrolled_count=session.enrolled_count,
+                enrolled_count=enrolled_count,
                 waiting_count=session.waiting_count,
                 session_participations=[
                     ParticipationInfo(
@@ -1144,14 +1233,11 @@ class EventPageView(DetailView):  # type: ignore [type-arg]
                         status=sp.status,
                         creation_time=sp.creation_time,
                     )
-                    for sp in session.session_participations.select_related(
-                        "user"
-                    ).all()
+                    for sp in session.session_participations.all()
                 ],
             )
 
         # Check if any active enrollment config has limit_to_end_time enabled
-        active_configs = self.object.get_active_enrollment_configs()
         limit_configs = [c for c in active_configs if c.limit_to_end_time]
         current_time = datetime.now(tz=UTC)
 
@@ -1452,33 +1538,56 @@ class SessionEnrollPageView(LoginRequiredMixin, View):
 
         # Lock the session to prevent race conditions within the transaction
         session = Session.objects.select_for_update().get(id=session.id)
-        participations = SessionParticipation.objects.filter(session=session).order_by(
-            "creation_time"
+        participations = list(
+            SessionParticipation.objects.filter(session=session)
+            .select_related("user__manager")
+            .order_by("creation_time")
+        )
+        participations_by_user = {p.user_id: p for p in participations}
+        # Conflicts of everyone who may be enrolled here (the requesting users and
+        # the waiting list candidates for promotion), answered in one query
+        eligibility = get_enrollment_eligibility(
+            session,
+            {req.user.pk for req in enrollment_requests}
+            | {
+                p.user_id
+                for p in participations
+                if p.status == SessionParticipationStatus.WAITING
+            },
         )
 
         for req in enrollment_requests:
             # Handle cancellation
-            if req.choice == "cancel" and (
-                existing_participation := next(
-                    p for p in participations if p.user.id == req.user.pk
-                )
-            ):
-                existing_participation.delete()
-                enrollments.cancelled_users.append(req.name)
-
-                # If this was a confirmed enrollment, promote from waiting list
-                self._promote_from_waitlist(
-                    existing_participation, participations, req, session, enrollments
-                )
+            if req.choice == "cancel":
+                if existing_participation := participations_by_user.get(req.user.pk):
+                    existing_participation.delete()
+                    enrollments.cancelled_users.append(req.name)
+
+                    # If this was a confirmed enrollment, promote from waiting list
+                    self._promote_from_waitlist(
+                        existing_participation,
+                        participations,
+                        eligibility,
+                        req,
+                        session,
+                        enrollments,
+                    )
                 continue
 
-            self._check_and_create_enrollment(req, session, enrollments)
+            self._check_and_create_enrollment(
+                req,
+                session,
+                enrollments,
+                participation=participations_by_user.get(req.user.pk),
+                has_conflict=eligibility.has_conflict(req.user.pk),
+            )
         return enrollments
 
-    def _promote_from_waitlist(
+    def _promote_from_waitlist(  # noqa: PLR0913, PLR0917
         self,
         existing_participation: SessionParticipation,
-        participations: QuerySet[SessionParticipation],
+        participations: list[SessionParticipation],
+        eligibility: EnrollmentEligibility,
         req: EnrollmentRequest,
         session: Session,
         enrollments: Enrollments,
@@ -1486,11 +1595,9 @@ class SessionEnrollPageView(LoginRequiredMixin, View):
         if existing_participation.status == SessionParticipationStatus.CONFIRMED:
             for participation in participations:
                 if (
-                    participation.user.id != req.user.pk
+                    participation.user_id != req.user.pk
                     and participation.status == SessionParticipationStatus.WAITING
-                ) and not Session.objects.has_conflicts(
-                    session, UserDTO.model_validate(participation.user)
-                ):
+                ) and not eligibility.has_conflict(participation.user_id):
 
                     can_be_promoted = True
                     if participation.user.email:
@@ -1535,7 +1642,12 @@ class SessionEnrollPageView(LoginRequiredMixin, View):
 
     @staticmethod
     def _check_and_create_enrollment(
-        req: EnrollmentRequest, session: Session, enrollments: Enrollments
+        req: EnrollmentRequest,
+        session: Session,
+        enrollments: Enrollments,
+        *,
+        participation: SessionParticipation | None,
+        has_conflict: bool,
     ) -> None:
         # Check if user is the session presenter
         if session.presenter_id and req.user.pk == session.presenter_id:
@@ -1543,15 +1655,11 @@ class SessionEnrollPageView(LoginRequiredMixin, View):
             return
 
         # Check for time conflicts for confirmed enrollment
-        if req.choice == "enroll" and Session.objects.has_conflicts(session, req.user):
+        if req.choice == "enroll" and has_conflict:
             enrollments.skipped_users.append(f"{req.name} ({_('time conflict')!s})")
             return
 
-        # Use get_or_create to prevent duplicate enrollments in race conditions
-        participation = SessionParticipation.objects.filter(
-            session=session, user_id=req.user.pk
-        ).first()
-
+        # The session row is locked, so the participation read with it is current
         if not participation:
             participation = SessionParticipation(session=session, user_id=req.user.pk)
 
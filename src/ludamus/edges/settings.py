@@ -27,6 +27,8 @@ env = environ.Env(
     AUTH0_CLIENT_ID=(str, ""),
     AUTH0_CLIENT_SECRET=(str, ""),
     AUTH0_DOMAIN=(str, ""),
+    # Cache
+    CACHE_URL=(str, ""),  # Redis-protocol server, e.g. redis://cache:6379/0
     # Database
     DB_NAME=(str, ""),  # Database name or file path
     USE_POSTGRES=(bool, False),
@@ -36,9 +38,20 @@ env = environ.Env(
     STATIC_ROOT=(str, str(BASE_DIR / "staticfiles")),
     # Membership API
     MEMBERSHIP_API_BASE_URL=(str, ""),
+    MEMBERSHIP_API_CACHE_TIMEOUT=(int, 600),
     MEMBERSHIP_API_CHECK_INTERVAL=(int, 15),
-    MEMBERSHIP_API_TIMEOUT=(int, 30),
+    MEMBERSHIP_API_NEGATIVE_CACHE_TIMEOUT=(int, 60),
+    MEMBERSHIP_API_TIMEOUT=(int, 5),
     MEMBERSHIP_API_TOKEN=(str, ""),
+    # Outbound HTTP
+    OUTBOUND_HTTP_CONNECT_TIMEOUT=(float, 3.0),
+    OUTBOUND_HTTP_FAILURE_THRESHOLD=(int, 5),
+    OUTBOUND_HTTP_MAX_PER_HOST=(int, 10),
+    OUTBOUND_HTTP_READ_TIMEOUT=(float, 10.0),
+    OUTBOUND_HTTP_RESET_TIMEOUT=(int, 30),
+    # Request metrics
+    REQUEST_METRICS_QUERY_BUDGET=(int, 50),
+    REQUEST_METRICS_SAMPLE_RATE=(float, 0.0),
     # Other
     CREDENTIALS_ENCRYPTION_KEY=str,
     DEBUG=(bool, False),
@@ -105,6 +118,7 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "ludamus.inits.instrumentation.RequestMetricsMiddleware",
     "ludamus.inits.RepositoryInjectionMiddleware",
     "ludamus.inits.middleware.ServiceInjectionMiddleware",
     "ludamus.adapters.web.django.middlewares.RequestContextMiddleware",
@@ -350,21 +364,31 @@ else:
     MEDIA_URL = "/media/"
 
 # Cache configuration
-CACHES = (
-    {
+# Any Redis-protocol server (Redis, Valkey, ...) keeps cache traffic, such as
+# rate-limit counters, off the database. Without one, production falls back
+# to the database cache.
+if CACHE_URL := env("CACHE_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+            "KEY_PREFIX": "ludamus",
+        }
+    }
+elif IS_PRODUCTION:
+    CACHES = {
         "default": {
             "BACKEND": "django.core.cache.backends.db.DatabaseCache",
             "LOCATION": "cache_table",
         }
     }
-    if IS_PRODUCTION
-    else {
+else:
+    CACHES = {
         "default": {
             "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
             "LOCATION": "unique-snowflake",
         }
     }
-)
 
 # Logging configuration
 LOGGING = {
@@ -393,6 +417,24 @@ MEMBERSHIP_API_BASE_URL = env("MEMBERSHIP_API_BASE_URL")
 MEMBERSHIP_API_TOKEN = env("MEMBERSHIP_API_TOKEN")
 MEMBERSHIP_API_TIMEOUT = env("MEMBERSHIP_API_TIMEOUT")
 MEMBERSHIP_API_CHECK_INTERVAL = env("MEMBERSHIP_API_CHECK_INTERVAL")
+MEMBERSHIP_API_CACHE_TIMEOUT = env("MEMBERSHIP_API_CACHE_TIMEOUT")
+MEMBERSHIP_API_NEGATIVE_CACHE_TIMEOUT = env("MEMBERSHIP_API_NEGATIVE_CACHE_TIMEOUT")
+
+# Outbound HTTP (shared by external integrations, see ludamus.links.outbound)
+OUTBOUND_HTTP_CONNECT_TIMEOUT = env("OUTBOUND_HTTP_CONNECT_TIMEOUT")
+OUTBOUND_HTTP_READ_TIMEOUT = env("OUTBOUND_HTTP_READ_TIMEOUT")
+OUTBOUND_HTTP_MAX_PER_HOST = env("OUTBOUND_HTTP_MAX_PER_HOST")
+OUTBOUND_HTTP_FAILURE_THRESHOLD = env("OUTBOUND_HTTP_FAILURE_THRESHOLD")
+OUTBOUND_HTTP_RESET_TIMEOUT = env("OUTBOUND_HTTP_RESET_TIMEOUT")
+
+# Request metrics (see ludamus.inits.instrumentation). Sampled requests get a
+# log line, plus a Server-Timing header for staff or under DEBUG; 0 removes the
+# middleware entirely.
+REQUEST_METRICS_SAMPLE_RATE = env("REQUEST_METRICS_SAMPLE_RATE")
+# Queries a sampled request may run before a warning is logged (0: no limit),
+# overridden per URL name below
+REQUEST_METRICS_QUERY_BUDGET = env("REQUEST_METRICS_QUERY_BUDGET")
+REQUEST_METRICS_VIEW_BUDGETS: dict[str, int] = {}
 
 # Vendor Dependencies Configuration
 # Download with: mise run dj downloadvendor
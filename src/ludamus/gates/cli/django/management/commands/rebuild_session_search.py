@@ -0,0 +1,40 @@
+"""Management command to rebuild the session full-text search documents."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand
+
+from ludamus.adapters.db.django.models import SessionSearchDocument
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+class Command(BaseCommand):
+    """Rebuild the search document of each session."""
+
+    help = (
+        "Rebuild the session search documents used by the panel proposal search "
+        "(e.g. after bulk imports or raw SQL edits)"
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:  # noqa: PLR6301
+        """Add command arguments."""
+        parser.add_argument(
+            "--session",
+            type=int,
+            action="append",
+            dest="session_ids",
+            help="Only rebuild this session's document (can be repeated)",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:  # noqa: ARG002
+        session_ids = options["session_ids"]
+        written = SessionSearchDocument.objects.refresh(
+            session_ids if isinstance(session_ids, list) else None
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {written} session search document(s).")
+        )
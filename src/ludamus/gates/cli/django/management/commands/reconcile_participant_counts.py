@@ -0,0 +1,43 @@
+"""Management command to repair drifted session participant counters."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand
+
+from ludamus.adapters.db.django.models import Session
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+class Command(BaseCommand):
+    """Recount confirmed and waiting participations for each session."""
+
+    help = (
+        "Recount session participations and fix materialized enrollment counters "
+        "that drifted (e.g. after bulk imports or cascade deletes)"
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:  # noqa: PLR6301
+        """Add command arguments."""
+        parser.add_argument(
+            "--session",
+            type=int,
+            action="append",
+            dest="session_ids",
+            help="Only reconcile this session (can be repeated)",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:  # noqa: ARG002
+        session_ids = options["session_ids"]
+        corrected = Session.objects.reconcile_participant_counts(
+            session_ids if isinstance(session_ids, list) else None
+        )
+        if corrected:
+            self.stdout.write(
+                self.style.WARNING(f"Corrected counters of {corrected} session(s).")
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("All participant counters match."))
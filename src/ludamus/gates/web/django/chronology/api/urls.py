@@ -0,0 +1,30 @@
+"""URL patterns for the read-only schedule API."""
+
+from django.urls import path
+
+from ludamus.gates.web.django.chronology.api.views import (
+    EventListApiView,
+    EventScheduleApiView,
+)
+from ludamus.pacts import ScheduleResource
+
+app_name = "api"  # pylint: disable=invalid-name
+
+urlpatterns = [
+    path("events/", EventListApiView.as_view(), name="events"),
+    path(
+        "events/<str:event_slug>/spaces/",
+        EventScheduleApiView.as_view(resource=ScheduleResource.SPACES),
+        name="spaces",
+    ),
+    path(
+        "events/<str:event_slug>/agenda/",
+        EventScheduleApiView.as_view(resource=ScheduleResource.AGENDA),
+        name="agenda",
+    ),
+    path(
+        "events/<str:event_slug>/sessions/",
+        EventScheduleApiView.as_view(resource=ScheduleResource.SESSIONS),
+        name="sessions",
+    ),
+]
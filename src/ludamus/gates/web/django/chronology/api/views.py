@@ -0,0 +1,171 @@
+"""Read-only JSON API over the public schedule.
+
+Every list answers with one page of plain rows,
+``{"data": [...], "next": <url or null>}``, and takes three query parameters:
+
+* ``fields``: comma-separated names to keep (``id`` is always sent);
+* ``limit``: page size, up to ``SCHEDULE_API_MAX_PAGE_SIZE``;
+* ``cursor``: the opaque position copied from a previous ``next``.
+
+Lists of an event's spaces, agenda and sessions carry an ``ETag`` made from
+the event's page version, so a poller revalidating an unchanged schedule is
+answered from one cache read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from django.http import JsonResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    set_response_etag,
+)
+from django.utils.encoding import force_bytes
+from django.utils.http import quote_etag, urlsafe_base64_decode, urlsafe_base64_encode
+from django.views.generic.base import View
+
+from ludamus.pacts import (
+    SCHEDULE_API_FIELDS,
+    SCHEDULE_API_MAX_PAGE_SIZE,
+    SCHEDULE_API_PAGE_SIZE,
+    NotFoundError,
+    ScheduleResource,
+)
+
+if TYPE_CHECKING:
+    from django.http import HttpResponseBase
+
+    from ludamus.gates.web.django.entities import RootRequest
+
+
+@dataclass(frozen=True)
+class _PageQuery:
+    fields: tuple[str, ...]
+    after: int | None
+    limit: int
+
+
+def _parse_fields(raw: str, resource: ScheduleResource) -> tuple[str, ...]:
+    allowed = SCHEDULE_API_FIELDS[resource]
+    if not raw:
+        return allowed
+    fields = tuple(dict.fromkeys(name for name in raw.split(",") if name))
+    if unknown := [name for name in fields if name not in allowed]:
+        msg = f"Unknown fields: {', '.join(unknown)}"
+        raise ValueError(msg)
+    return fields
+
+
+def _parse_limit(raw: str) -> int:
+    msg = f"limit must be a whole number from 1 to {SCHEDULE_API_MAX_PAGE_SIZE}"
+    if not raw:
+        return SCHEDULE_API_PAGE_SIZE
+    try:
+        limit = int(raw)
+    except ValueError as exc:
+        raise ValueError(msg) from exc
+    if not 1 <= limit <= SCHEDULE_API_MAX_PAGE_SIZE:
+        raise ValueError(msg)
+    return limit
+
+
+def _encode_cursor(pk: object) -> str:
+    return urlsafe_base64_encode(force_bytes(pk))
+
+
+def _decode_cursor(raw: str) -> int | None:
+    if not raw:
+        return None
+    try:
+        return int(urlsafe_base64_decode(raw))
+    except ValueError as exc:
+        msg = "Invalid cursor"
+        raise ValueError(msg) from exc
+
+
+def _parse_query(request: RootRequest, resource: ScheduleResource) -> _PageQuery:
+    return _PageQuery(
+        fields=_parse_fields(request.GET.get("fields", ""), resource),
+        after=_decode_cursor(request.GET.get("cursor", "")),
+        limit=_parse_limit(request.GET.get("limit", "")),
+    )
+
+
+def _error(message: str, status: HTTPStatus) -> JsonResponse:
+    return JsonResponse({"error": message}, status=status)
+
+
+def _page(
+    request: RootRequest, resource: ScheduleResource, scope_pk: int, query: _PageQuery
+) -> JsonResponse:
+    # One row past the page tells whether there is a next one
+    rows = request.di.uow.schedule_rows.read_page(
+        resource, scope_pk, query.fields, after=query.after, limit=query.limit + 1
+    )
+    next_url = None
+    if len(rows) > query.limit:
+        rows = rows[: query.limit]
+        params = request.GET.copy()
+        params["cursor"] = _encode_cursor(rows[-1]["id"])
+        next_url = request.build_absolute_uri(f"{request.path}?{params.urlencode()}")
+    response = JsonResponse({"data": rows, "next": next_url})
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+class EventListApiView(View):
+    """Published events of the current sphere."""
+
+    request: RootRequest
+
+    @staticmethod
+    def get(request: RootRequest) -> HttpResponseBase:
+        try:
+            query = _parse_query(request, ScheduleResource.EVENTS)
+        except ValueError as exc:
+            return _error(str(exc), HTTPStatus.BAD_REQUEST)
+        sphere_id = request.context.current_sphere_id
+        response = _page(request, ScheduleResource.EVENTS, sphere_id, query)
+        # Publication times move events in and out, so hash what was sent
+        set_response_etag(response)
+        return (
+            get_conditional_response(request, etag=response["ETag"], response=response)
+            or response
+        )
+
+
+class EventScheduleApiView(View):
+    """Spaces, agenda items or sessions of one published event."""
+
+    request: RootRequest
+    resource: ScheduleResource = ScheduleResource.SESSIONS
+
+    def get(self, request: RootRequest, event_slug: str) -> HttpResponseBase:
+        try:
+            query = _parse_query(request, self.resource)
+        except ValueError as exc:
+            return _error(str(exc), HTTPStatus.BAD_REQUEST)
+        uow = request.di.uow
+        sphere_id = request.context.current_sphere_id
+        version = uow.events.read_page_version(event_slug, sphere_id, None)
+        if version is None:
+            return _error("Event not found", HTTPStatus.NOT_FOUND)
+        path = hashlib.blake2b(request.get_full_path().encode(), digest_size=8)
+        etag = quote_etag(f"{version.tag}-{path.hexdigest()}")
+        response: HttpResponseBase
+        if not_modified := get_conditional_response(request, etag=etag):
+            response = not_modified
+            patch_cache_control(response, no_cache=True)
+        else:
+            try:
+                event = uow.events.read_by_slug(event_slug, sphere_id)
+            except NotFoundError:
+                return _error("Event not found", HTTPStatus.NOT_FOUND)
+            response = _page(request, self.resource, event.pk, query)
+        response["ETag"] = etag
+        return response
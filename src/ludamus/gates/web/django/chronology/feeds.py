@@ -0,0 +1,99 @@
+"""Subscribable iCalendar feeds of an event's agenda.
+
+Calendar clients poll feeds without a login, so a personal feed is addressed
+by a signed token carrying the user's id. Both feeds carry an ``ETag`` made
+from the event's page version, which any agenda, session or enrollment
+change replaces.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.signing import BadSignature, Signer
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.shortcuts import redirect
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.views.generic.base import View
+
+from ludamus.mills.chronology import EventCalendarService
+from ludamus.pacts import NotFoundError
+
+if TYPE_CHECKING:
+    from django.http import HttpResponseBase
+
+    from ludamus.gates.web.django.entities import AuthenticatedRootRequest, RootRequest
+
+_TOKEN_SIGNER = Signer(salt="ludamus.chronology.calendar")
+
+
+def _calendar_feed(
+    request: RootRequest, event_slug: str, participant_id: int | None = None
+) -> HttpResponseBase:
+    uow = request.di.uow
+    sphere_id = request.context.current_sphere_id
+    version = uow.events.read_page_version(event_slug, sphere_id, None)
+    if version is None:
+        raise Http404
+    scope = "all" if participant_id is None else f"user-{participant_id}"
+    etag = quote_etag(f"{version.tag}-{scope}")
+    response: HttpResponseBase
+    if not_modified := get_conditional_response(request, etag=etag):
+        response = not_modified
+    else:
+        try:
+            event = uow.events.read_by_slug(event_slug, sphere_id)
+        except NotFoundError as exc:
+            raise Http404 from exc
+        url = request.build_absolute_uri(
+            reverse("web:chronology:event", kwargs={"slug": event_slug})
+        )
+        response = StreamingHttpResponse(
+            EventCalendarService(uow, request.di.cache).feed(
+                event, version.tag, url, participant_id
+            ),
+            content_type="text/calendar; charset=utf-8",
+        )
+        response["Content-Disposition"] = f'inline; filename="{event_slug}.ics"'
+    response["ETag"] = etag
+    if participant_id is None:
+        patch_cache_control(response, no_cache=True)
+    else:
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+class EventCalendarFeedView(View):
+    request: RootRequest
+
+    @staticmethod
+    def get(request: RootRequest, event_slug: str) -> HttpResponseBase:
+        return _calendar_feed(request, event_slug)
+
+
+class PersonalCalendarFeedView(View):
+    request: RootRequest
+
+    @staticmethod
+    def get(request: RootRequest, event_slug: str, token: str) -> HttpResponseBase:
+        try:
+            participant_id = int(_TOKEN_SIGNER.unsign(token))
+        except BadSignature as exc:
+            raise Http404 from exc
+        return _calendar_feed(request, event_slug, participant_id)
+
+
+class PersonalCalendarLinkView(LoginRequiredMixin, View):
+    """Send a logged-in user to the address of their personal feed."""
+
+    request: AuthenticatedRootRequest
+
+    @staticmethod
+    def get(request: AuthenticatedRootRequest, event_slug: str) -> HttpResponse:
+        token = _TOKEN_SIGNER.sign(str(request.context.current_user_id))
+        return redirect(
+            "web:chronology:event-calendar-personal", event_slug=event_slug, token=token
+        )
@@ -124,6 +124,11 @@ urlpatterns = [
         venues.VenueCopyPageView.as_view(),
         name="venue-copy",
     ),
+    path(
+        "event/<slug:slug>/venues/do/copy-layout",
+        venues.VenueLayoutCopyPageView.as_view(),
+        name="venues-copy-layout",
+    ),
     path(
         "event/<slug:slug>/venues/do/reorder",
         venues.VenueReorderActionView.as_view(),
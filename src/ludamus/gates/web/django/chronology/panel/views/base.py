@@ -74,15 +74,12 @@ class EventContextMixin:
         Returns:
             Tuple of (context dict, current_event or None if not found).
         """
-        sphere_id = self.request.context.current_sphere_id
-        events = self.request.di.uow.events.list_by_sphere(sphere_id)
-
-        try:
-            current_event = self.request.di.uow.events.read_by_slug(slug, sphere_id)
-        except NotFoundError:
-            messages.error(self.request, _("Event not found."))
+        if (current_event := self.get_current_event(slug)) is None:
             return {}, None
 
+        events = self.request.di.uow.events.list_by_sphere(
+            self.request.context.current_sphere_id
+        )
         panel_service = PanelService(self.request.di.uow)
         stats = panel_service.get_event_stats(current_event.pk)
 
@@ -95,6 +92,21 @@ class EventContextMixin:
 
         return context, current_event
 
+    def get_current_event(self, slug: str) -> EventDTO | None:
+        """Resolve the event for partials and actions that render no header.
+
+        Skips the sphere's event list and the header stats.
+
+        Returns:
+            The current event, or None (with an error message) if not found.
+        """
+        sphere_id = self.request.context.current_sphere_id
+        try:
+            return self.request.di.uow.events.read_by_slug(slug, sphere_id)
+        except NotFoundError:
+            messages.error(self.request, _("Event not found."))
+            return None
+
     def get_track_filter_context(
         self, event_pk: int
     ) -> tuple[list[Any], set[int], int | None]:
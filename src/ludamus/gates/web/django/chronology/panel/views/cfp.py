@@ -356,7 +356,7 @@ class CFPDeleteActionView(PanelAccessMixin, EventContextMixin, View):
         Returns:
             Redirect response to CFP list.
         """
-        _context, current_event = self.get_event_context(event_slug)
+        current_event = self.get_current_event(event_slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -254,7 +254,7 @@ class IntegrationCheckActionView(PanelAccessMixin, EventContextMixin, View):
     request: PanelRequest
 
     def post(self, _request: PanelRequest, slug: str) -> HttpResponse:
-        _ctx, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return HttpResponseBadRequest("Unknown event")
 
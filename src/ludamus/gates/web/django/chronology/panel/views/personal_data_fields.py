@@ -233,7 +233,7 @@ class PersonalDataFieldDeleteActionView(PanelAccessMixin, EventContextMixin, Vie
         Returns:
             Redirect response to personal data fields list.
         """
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -332,7 +332,7 @@ class ProposalRejectActionView(PanelAccessMixin, EventContextMixin, View):
     http_method_names = ("post",)
 
     def post(self, _request: PanelRequest, slug: str, proposal_id: int) -> HttpResponse:
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -361,7 +361,7 @@ class ProposalSetFacilitatorsActionView(PanelAccessMixin, EventContextMixin, Vie
     http_method_names = ("post",)
 
     def post(self, _request: PanelRequest, slug: str, proposal_id: int) -> HttpResponse:
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
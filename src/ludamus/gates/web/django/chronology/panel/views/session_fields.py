@@ -286,7 +286,7 @@ class SessionFieldDeleteActionView(PanelAccessMixin, EventContextMixin, View):
         Returns:
             Redirect response to session fields list.
         """
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
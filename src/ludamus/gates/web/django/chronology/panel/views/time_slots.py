@@ -252,7 +252,7 @@ class TimeSlotDeleteActionView(PanelAccessMixin, EventContextMixin, View):
     http_method_names = ("post",)
 
     def post(self, _request: PanelRequest, slug: str, pk: int) -> HttpResponse:
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
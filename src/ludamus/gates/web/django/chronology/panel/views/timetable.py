@@ -21,6 +21,7 @@ from ludamus.gates.web.django.chronology.panel.views.base import (
 )
 from ludamus.mills.chronology import (
     ConflictDetectionService,
+    ScheduleSnapshotService,
     TimetableOverviewService,
     TimetableService,
 )
@@ -54,6 +55,10 @@ def _build_back_url(slug: str, query: QueryDict) -> str:
     return f"{base}?{urlencode(params)}" if params else base
 
 
+def _schedule_snapshots(request: PanelRequest) -> ScheduleSnapshotService:
+    return ScheduleSnapshotService(request.di.uow, request.di.cache)
+
+
 def _parse_date_param(raw: str | None) -> date | None:
     if not raw:
         return None
@@ -92,21 +97,22 @@ class TimetablePageView(PanelAccessMixin, EventContextMixin, View):
         max_duration_minutes = int(max_dur_raw) if max_dur_raw.isdigit() else None
 
         uow = self.request.di.uow
-        grid = TimetableService(uow).build_grid(
+        snapshots = _schedule_snapshots(self.request)
+        grid = TimetableService(uow, snapshots).build_grid(
             event_pk=current_event.pk,
             tz=get_current_timezone(),
             track_pk=filter_track_pk,
             space_page=room_page,
             selected_date=selected_date,
         )
-        conflict_service = ConflictDetectionService(uow)
+        conflict_service = ConflictDetectionService(uow, snapshots)
         conflicts = conflict_service.list_all_for_track(
             event_pk=current_event.pk, track_pk=filter_track_pk
         )
         slot_violations = conflict_service.list_preferred_slot_violations(
             event_pk=current_event.pk, track_pk=filter_track_pk
         )
-        categories = uow.proposal_categories.list_by_event(current_event.pk)
+        categories = list(snapshots.get(current_event.pk).categories)
 
         context["all_tracks"] = sorted_tracks
         context["managed_track_pks"] = managed_pks
@@ -131,7 +137,7 @@ class TimetableSessionListPartView(PanelAccessMixin, EventContextMixin, View):
     request: PanelRequest
 
     def get(self, _request: PanelRequest, slug: str) -> HttpResponse:
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -142,6 +148,12 @@ class TimetableSessionListPartView(PanelAccessMixin, EventContextMixin, View):
         category_pk = int(category_pk_raw) if category_pk_raw.isdigit() else None
         max_dur_raw = self.request.GET.get("max_duration", "").strip()
         max_duration_minutes = int(max_dur_raw) if max_dur_raw.isdigit() else None
+        after_raw = self.request.GET.get("after", "").strip()
+        after = (
+            (self.request.GET.get("after_title", ""), int(after_raw))
+            if after_raw.isdigit()
+            else None
+        )
 
         uow = self.request.di.uow
         sessions, has_more = uow.sessions.list_unscheduled_by_event(
@@ -150,7 +162,24 @@ class TimetableSessionListPartView(PanelAccessMixin, EventContextMixin, View):
             search=search,
             max_duration_minutes=max_duration_minutes,
             category_pk=category_pk,
+            after=after,
         )
+        next_after = sessions[-1] if has_more else None
+        if after is not None:
+            # "Load more": only the next page of cards, appended in place.
+            return TemplateResponse(
+                self.request,
+                "panel/parts/timetable-session-list-page.html",
+                {
+                    "sessions": sessions,
+                    "next_after": next_after,
+                    "search": search or "",
+                    "category_pk": category_pk,
+                    "max_duration_minutes": max_duration_minutes,
+                    "filter_track_pk": filter_track_pk,
+                    "slug": slug,
+                },
+            )
         categories = uow.proposal_categories.list_by_event(current_event.pk)
 
         duration_chips = [("≤30 min", 30), ("≤60 min", 60), ("≤90 min", 90)]
@@ -158,6 +187,7 @@ class TimetableSessionListPartView(PanelAccessMixin, EventContextMixin, View):
         context = {
             "sessions": sessions,
             "has_more": has_more,
+            "next_after": next_after,
             "limit": UNSCHEDULED_LIST_LIMIT,
             "categories": categories,
             "search": search or "",
@@ -178,7 +208,7 @@ class TimetableBrowsePanePartView(PanelAccessMixin, EventContextMixin, View):
     request: PanelRequest
 
     def get(self, _request: PanelRequest, slug: str) -> HttpResponse:
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -209,7 +239,7 @@ class TimetableSessionDetailPartView(PanelAccessMixin, EventContextMixin, View):
     request: PanelRequest
 
     def get(self, _request: PanelRequest, slug: str, pk: int) -> HttpResponse:
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -260,7 +290,7 @@ class TimetableGridPartView(PanelAccessMixin, EventContextMixin, View):
     request: PanelRequest
 
     def get(self, _request: PanelRequest, slug: str) -> HttpResponse:
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -274,14 +304,16 @@ class TimetableGridPartView(PanelAccessMixin, EventContextMixin, View):
         selected_date = _parse_date_param(self.request.GET.get("date"))
 
         uow = self.request.di.uow
-        grid = TimetableService(uow).build_grid(
+        snapshots = _schedule_snapshots(self.request)
+        grid = TimetableService(uow, snapshots).build_grid(
             event_pk=current_event.pk,
             tz=get_current_timezone(),
             track_pk=filter_track_pk,
             space_page=room_page,
             selected_date=selected_date,
         )
-        slot_violations = ConflictDetectionService(uow).list_preferred_slot_violations(
+        conflict_service = ConflictDetectionService(uow, snapshots)
+        slot_violations = conflict_service.list_preferred_slot_violations(
             event_pk=current_event.pk, track_pk=filter_track_pk
         )
 
@@ -303,7 +335,7 @@ class TimetableAssignView(PanelAccessMixin, EventContextMixin, View):
     request: PanelRequest
 
     def post(self, _request: PanelRequest, slug: str) -> HttpResponse:
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -319,7 +351,7 @@ class TimetableAssignView(PanelAccessMixin, EventContextMixin, View):
 
         uow = self.request.di.uow
         try:
-            TimetableService(uow).assign_session(
+            TimetableService(uow, _schedule_snapshots(self.request)).assign_session(
                 session_pk=session_pk,
                 placement=placement,
                 event_pk=current_event.pk,
@@ -350,7 +382,7 @@ class TimetableUnassignView(PanelAccessMixin, EventContextMixin, View):
     request: PanelRequest
 
     def post(self, _request: PanelRequest, slug: str) -> HttpResponse:
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -361,7 +393,7 @@ class TimetableUnassignView(PanelAccessMixin, EventContextMixin, View):
 
         uow = self.request.di.uow
         try:
-            TimetableService(uow).unassign_session(
+            TimetableService(uow, _schedule_snapshots(self.request)).unassign_session(
                 session_pk, event_pk=current_event.pk, user_pk=self.request.user.pk
             )
         except NotFoundError:
@@ -385,7 +417,7 @@ class TimetableOverviewPageView(PanelAccessMixin, EventContextMixin, View):
         context["active_nav"] = "timetable"
 
         uow = self.request.di.uow
-        overview = TimetableOverviewService(uow)
+        overview = TimetableOverviewService(uow, _schedule_snapshots(self.request))
 
         context["heatmap"] = overview.build_heatmap(
             current_event.pk, tz=get_current_timezone()
@@ -409,9 +441,12 @@ class TimetableProblemsPageView(PanelAccessMixin, EventContextMixin, View):
         context["active_nav"] = "timetable"
 
         uow = self.request.di.uow
-        conflict_service = ConflictDetectionService(uow)
-        overview = TimetableOverviewService(uow)
-        all_conflicts = overview.get_all_conflicts(current_event.pk)
+        snapshots = _schedule_snapshots(self.request)
+        conflict_service = ConflictDetectionService(uow, snapshots)
+        overview = TimetableOverviewService(uow, snapshots)
+        all_conflicts = conflict_service.list_all_for_track(
+            event_pk=current_event.pk, track_pk=None
+        )
         slot_violations = conflict_service.list_preferred_slot_violations(
             event_pk=current_event.pk, track_pk=None
         )
@@ -461,7 +496,7 @@ class TimetableRevertView(PanelAccessMixin, EventContextMixin, View):
     request: PanelRequest
 
     def post(self, _request: PanelRequest, slug: str) -> HttpResponse:
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -472,7 +507,7 @@ class TimetableRevertView(PanelAccessMixin, EventContextMixin, View):
 
         uow = self.request.di.uow
         try:
-            TimetableService(uow).revert_change(
+            TimetableService(uow, _schedule_snapshots(self.request)).revert_change(
                 log_pk, event_pk=current_event.pk, user_pk=self.request.user.pk
             )
         except ValueError, NotFoundError:
@@ -487,15 +522,15 @@ class TimetableConflictsPartView(PanelAccessMixin, EventContextMixin, View):
     request: PanelRequest
 
     def get(self, _request: PanelRequest, slug: str) -> HttpResponse:
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
         _, _, filter_track_pk = self.get_track_filter_context(current_event.pk)
 
-        conflicts = ConflictDetectionService(self.request.di.uow).list_all_for_track(
-            event_pk=current_event.pk, track_pk=filter_track_pk
-        )
+        conflicts = ConflictDetectionService(
+            self.request.di.uow, _schedule_snapshots(self.request)
+        ).list_all_for_track(event_pk=current_event.pk, track_pk=filter_track_pk)
 
         context = {
             "conflicts": conflicts,
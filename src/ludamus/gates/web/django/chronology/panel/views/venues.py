@@ -27,6 +27,7 @@ from ludamus.gates.web.django.forms import (
     VenueDuplicateForm,
     VenueForm,
     create_venue_copy_form,
+    create_venue_layout_copy_form,
 )
 from ludamus.mills import PanelService
 from ludamus.pacts import NotFoundError
@@ -285,7 +286,7 @@ class VenueDeleteActionView(PanelAccessMixin, EventContextMixin, View):
         Returns:
             Redirect response to venues list.
         """
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -483,6 +484,78 @@ class VenueCopyPageView(PanelAccessMixin, EventContextMixin, View):
         return redirect("panel:venues", slug=slug)
 
 
+class VenueLayoutCopyPageView(PanelAccessMixin, EventContextMixin, View):
+    """Copy all venues, time slots and tracks of another event into this one."""
+
+    request: PanelRequest
+
+    def get(self, _request: PanelRequest, slug: str) -> HttpResponse:
+        """Display the copy layout form.
+
+        Returns:
+            TemplateResponse with the form or redirect if no source is available.
+        """
+        context, current_event = self.get_event_context(slug)
+        if current_event is None:
+            return redirect("panel:index")
+
+        events = context["events"]
+        event_choices = [(e.pk, e.name) for e in events if e.pk != current_event.pk]
+
+        if not event_choices:
+            messages.warning(self.request, _("No other events available to copy from."))
+            return redirect("panel:venues", slug=slug)
+
+        context["active_nav"] = "venues"
+        context["form"] = create_venue_layout_copy_form(event_choices)()
+        return TemplateResponse(self.request, "panel/venue-layout-copy.html", context)
+
+    def post(self, _request: PanelRequest, slug: str) -> HttpResponse:
+        """Handle copying another event's layout.
+
+        Returns:
+            Redirect response on success, or form with errors.
+        """
+        context, current_event = self.get_event_context(slug)
+        if current_event is None:
+            return redirect("panel:index")
+
+        events = context["events"]
+        event_choices = [(e.pk, e.name) for e in events if e.pk != current_event.pk]
+
+        form = create_venue_layout_copy_form(event_choices)(self.request.POST)
+        if not form.is_valid():
+            context["active_nav"] = "venues"
+            context["form"] = form
+            return TemplateResponse(
+                self.request, "panel/venue-layout-copy.html", context
+            )
+
+        source_event_id = int(form.cleaned_data["source_event"])
+        source_event_name = next(
+            (e.name for e in events if e.pk == source_event_id), "another event"
+        )
+
+        copied = self.request.di.uow.venues.copy_layout_from_event(
+            source_event_id, current_event.pk
+        )
+        messages.success(
+            self.request,
+            _(
+                "Copied %(venues)s venues, %(spaces)s spaces, %(time_slots)s time "
+                "slots and %(tracks)s tracks from %(event)s."
+            )
+            % {
+                "venues": copied.venues,
+                "spaces": copied.spaces,
+                "time_slots": copied.time_slots,
+                "tracks": copied.tracks,
+                "event": source_event_name,
+            },
+        )
+        return redirect("panel:venues", slug=slug)
+
+
 class AreaCreatePageView(PanelAccessMixin, EventContextMixin, View):
     """Create a new area within a venue."""
 
@@ -639,7 +712,7 @@ class AreaDeleteActionView(PanelAccessMixin, EventContextMixin, View):
         Returns:
             Redirect response to venue detail.
         """
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -682,7 +755,7 @@ class AreaReorderActionView(PanelAccessMixin, EventContextMixin, View):
         Returns:
             JSON response with success status.
         """
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -963,7 +1036,7 @@ class SpaceDeleteActionView(PanelAccessMixin, EventContextMixin, View):
         Returns:
             Redirect response to area detail.
         """
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
@@ -1026,7 +1099,7 @@ class SpaceReorderActionView(PanelAccessMixin, EventContextMixin, View):
         Returns:
             JSON response with success status.
         """
-        _context, current_event = self.get_event_context(slug)
+        current_event = self.get_current_event(slug)
         if current_event is None:
             return redirect("panel:index")
 
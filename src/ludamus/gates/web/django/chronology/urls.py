@@ -1,6 +1,6 @@
 from django.urls import URLPattern, path
 
-from . import views
+from . import feeds, views
 
 urlpatterns: list[URLPattern] = [
     path(
@@ -38,4 +38,19 @@ urlpatterns: list[URLPattern] = [
         views.ProposeSessionSubmitActionView.as_view(),
         name="session-propose-submit",
     ),
+    path(
+        "event/<str:event_slug>/calendar.ics",
+        feeds.EventCalendarFeedView.as_view(),
+        name="event-calendar",
+    ),
+    path(
+        "event/<str:event_slug>/calendar/mine",
+        feeds.PersonalCalendarLinkView.as_view(),
+        name="event-calendar-mine",
+    ),
+    path(
+        "event/<str:event_slug>/calendar/<str:token>.ics",
+        feeds.PersonalCalendarFeedView.as_view(),
+        name="event-calendar-personal",
+    ),
 ]
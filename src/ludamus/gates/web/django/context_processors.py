@@ -32,19 +32,25 @@ def sites(request: RootRepositoryRequest) -> SitesContextData:
             is_sphere_manager=False,
         )
 
+    context = request.context
     sphere_repository = request.di.uow.spheres
-    root_sphere = sphere_repository.read(request.context.root_sphere_id)
-    current_sphere = sphere_repository.read(request.context.current_sphere_id)
+    current_sphere = context.current_sphere or sphere_repository.read(
+        context.current_sphere_id
+    )
+    root_site = context.root_site or sphere_repository.read_site(context.root_sphere_id)
+    current_site = context.current_site or sphere_repository.read_site(
+        current_sphere.pk
+    )
 
     is_sphere_manager = False
-    if request.user.is_authenticated and request.context.current_user_slug:
+    if request.user.is_authenticated and context.current_user_slug:
         is_sphere_manager = sphere_repository.is_manager(
-            current_sphere.pk, request.context.current_user_slug
+            current_sphere.pk, context.current_user_slug
         )
 
     return SitesContextData(
-        root_site=sphere_repository.read_site(root_sphere.pk),
-        current_site=sphere_repository.read_site(current_sphere.pk),
+        root_site=root_site,
+        current_site=current_site,
         current_sphere=current_sphere,
         is_sphere_manager=is_sphere_manager,
     )
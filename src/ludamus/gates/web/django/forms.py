@@ -278,6 +278,29 @@ def create_venue_copy_form(events: list[tuple[int, str]]) -> type[forms.Form]:
     return type("VenueCopyForm", (forms.Form,), {"target_event": target_event_field})
 
 
+def create_venue_layout_copy_form(events: list[tuple[int, str]]) -> type[forms.Form]:
+    """Create a form for copying the whole venue layout of another event.
+
+    Args:
+        events: List of (event_id, event_name) tuples for source event choices.
+
+    Returns:
+        A form class with the source_event field configured.
+    """
+    source_event_field = forms.ChoiceField(
+        label=_("Source Event"),
+        choices=events,
+        error_messages={
+            "required": _("Please select a source event."),
+            "invalid_choice": _("Invalid event selection."),
+        },
+    )
+
+    return type(
+        "VenueLayoutCopyForm", (forms.Form,), {"source_event": source_event_field}
+    )
+
+
 class AreaForm(forms.Form):
     """Form for creating/editing areas within a venue."""
 
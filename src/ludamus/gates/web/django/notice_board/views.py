@@ -151,13 +151,18 @@ class EncountersIndexPageView(TemplateView):
                 _SAMPLE_ENCOUNTERS, SAMPLE_COUNT
             )
             return context
+        past_before_raw = self.request.GET.get("past_before", "").strip()
+        past_before = int(past_before_raw) if past_before_raw.isdigit() else None
         service = EncounterService(self.request.di.uow)
         result = service.build_index(
             self.request.context.current_sphere_id,
             cast("int", self.request.context.current_user_id),
+            past_before=past_before,
         )
         context["upcoming_encounters"] = result.upcoming
         context["past_encounters"] = result.past
+        context["past_before"] = past_before
+        context["past_next_before"] = result.past_next_before
         return context
 
 
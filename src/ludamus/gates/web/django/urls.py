@@ -52,6 +52,10 @@ urlpatterns: list[URLResolver | URLPattern] = [
         "panel/",
         include("ludamus.gates.web.django.chronology.panel.urls", namespace="panel"),
     ),
+    path(
+        "api/v1/",
+        include("ludamus.gates.web.django.chronology.api.urls", namespace="api"),
+    ),
     path(
         "multiverse/",
         include("ludamus.gates.web.django.multiverse.urls", namespace="multiverse"),
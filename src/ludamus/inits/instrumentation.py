@@ -0,0 +1,211 @@
+"""Per-request database and template timing.
+
+``RequestMetricsMiddleware`` counts the SQL queries a sampled request runs,
+their total time and how many of them repeat an earlier statement's
+fingerprint, and times template rendering. The numbers go out as a
+``request_metrics`` log line, and a request running more queries than its
+view's budget logs a warning naming the most repeated statement. Staff users,
+and everyone when ``DEBUG`` is on, also get them in a ``Server-Timing``
+header.
+
+With ``REQUEST_METRICS_SAMPLE_RATE`` at 0 the middleware drops out of the
+stack when Django loads it, so an unsampled deployment pays nothing; below 1,
+an unsampled request costs one random draw.
+
+Template time covers ``TemplateResponse`` rendering; a view that renders
+its own template counts it as view time.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.http import HttpRequest, HttpResponseBase
+    from django.template.response import SimpleTemplateResponse
+
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER_LIST = re.compile(r"\(%s(?:, %s)*\)")
+_NUMBER = re.compile(r"\b\d+\b")
+
+
+def sql_fingerprint(sql: str) -> str:
+    """Fold numbers and ``IN`` list lengths out of a statement.
+
+    Returns:
+        The shape of the statement.
+    """
+    return _NUMBER.sub("?", _PLACEHOLDER_LIST.sub("(%s, ...)", " ".join(sql.split())))
+
+
+@dataclass
+class RequestMetrics:
+    """Queries and render time of one request.
+
+    An instance is a ``connection.execute_wrapper``. Statements are counted
+    as sent and fingerprinted only when read, which keeps the per-query cost
+    to a dict update.
+    """
+
+    queries: int = 0
+    db_seconds: float = 0.0
+    template_seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: object,
+        many: bool,  # noqa: FBT001
+        context: dict[str, Any],
+    ) -> object:
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_seconds += perf_counter() - started
+            self.queries += 1
+            self.statements[sql] += 1
+
+    def fingerprints(self) -> Counter[str]:
+        folded: Counter[str] = Counter()
+        for sql, count in self.statements.items():
+            folded[sql_fingerprint(sql)] += count
+        return folded
+
+
+def duplicate_count(fingerprints: Counter[str]) -> int:
+    """Count queries that repeat a fingerprint already run before them.
+
+    Returns:
+        The number of repeated queries.
+    """
+    return sum(count - 1 for count in fingerprints.values())
+
+
+def server_timing(metrics: RequestMetrics, duplicates: int, total: float) -> str:
+    description = f"{metrics.queries} queries, {duplicates} duplicated"
+    return (
+        f'db;dur={metrics.db_seconds * 1000:.1f};desc="{description}", '
+        f"tpl;dur={metrics.template_seconds * 1000:.1f}, "
+        f"total;dur={total * 1000:.1f}"
+    )
+
+
+_current: ContextVar[RequestMetrics | None] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+class RequestMetricsMiddleware:
+    """Log query counts and timings of sampled requests.
+
+    The numbers describe the database, so only staff (or anyone under
+    ``DEBUG``) see them in the response.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponseBase]) -> None:
+        self.sample_rate: float = settings.REQUEST_METRICS_SAMPLE_RATE
+        if self.sample_rate <= 0:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.query_budget: int = settings.REQUEST_METRICS_QUERY_BUDGET
+        self.view_budgets: dict[str, int] = settings.REQUEST_METRICS_VIEW_BUDGETS
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase:
+        if request.path.startswith(settings.MIDDLEWARE_SKIP_PREFIXES) or (
+            random.random() >= self.sample_rate  # noqa: S311
+        ):
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = perf_counter()
+        try:
+            with connection.execute_wrapper(metrics):
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        elapsed = perf_counter() - started
+        fingerprints = metrics.fingerprints()
+        if settings.DEBUG or getattr(request.user, "is_staff", False):
+            response["Server-Timing"] = server_timing(
+                metrics, duplicate_count(fingerprints), elapsed
+            )
+        self._log(request, response, metrics, fingerprints, elapsed)
+        return response
+
+    @staticmethod
+    def process_template_response(
+        request: HttpRequest, response: SimpleTemplateResponse  # noqa: ARG004
+    ) -> SimpleTemplateResponse:
+        # Django renders the response right after the last of these hooks
+        if (metrics := _current.get()) is not None:
+            started = perf_counter()
+
+            def rendered(_response: SimpleTemplateResponse) -> None:
+                metrics.template_seconds += perf_counter() - started
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def _log(
+        self,
+        request: HttpRequest,
+        response: HttpResponseBase,
+        metrics: RequestMetrics,
+        fingerprints: Counter[str],
+        elapsed: float,
+    ) -> None:
+        match = request.resolver_match
+        view = match.view_name if match is not None else request.path
+        duplicates = duplicate_count(fingerprints)
+        logger.info(
+            "request_metrics view=%s method=%s status=%d queries=%d "
+            "duplicates=%d db_ms=%.1f template_ms=%.1f total_ms=%.1f",
+            view,
+            request.method,
+            response.status_code,
+            metrics.queries,
+            duplicates,
+            metrics.db_seconds * 1000,
+            metrics.template_seconds * 1000,
+            elapsed * 1000,
+            extra={
+                "request_metrics": {
+                    "view": view,
+                    "queries": metrics.queries,
+                    "duplicates": duplicates,
+                    "db_ms": metrics.db_seconds * 1000,
+                    "template_ms": metrics.template_seconds * 1000,
+                    "total_ms": elapsed * 1000,
+                }
+            },
+        )
+        budget = self.view_budgets.get(view, self.query_budget)
+        if budget and metrics.queries > budget:
+            statement, count = fingerprints.most_common(1)[0]
+            logger.warning(
+                "%s ran %d queries, over its budget of %d; most repeated (%dx): %s",
+                view,
+                metrics.queries,
+                budget,
+                count,
+                statement,
+            )
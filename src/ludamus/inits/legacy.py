@@ -1,3 +1,4 @@
+import logging
 from functools import cached_property
 from typing import TYPE_CHECKING, TypeVar
 
@@ -6,7 +7,7 @@ from django.conf import settings
 from ludamus.links.cache import DjangoCache
 from ludamus.links.db.django.uow import UnitOfWork
 from ludamus.links.gravatar import gravatar_url
-from ludamus.links.ticket_api import MembershipApiClient
+from ludamus.links.ticket_api import CachedMembershipApiClient, MembershipApiClient
 from ludamus.pacts import CacheProtocol, DependencyInjectorProtocol, TicketAPIProtocol
 
 if TYPE_CHECKING:
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
     from ludamus.pacts import RootRequestProtocol
 
 
+logger = logging.getLogger(__name__)
+
 Response = TypeVar("Response")
 
 
@@ -26,13 +29,16 @@ class DependencyInjector(DependencyInjectorProtocol):
         request.di.ticket_api
     """
 
+    def __init__(self, *, identity_map: bool = False) -> None:
+        self._identity_map = identity_map
+
     @cached_property
     def uow(self) -> UnitOfWork:
-        return UnitOfWork()
+        return UnitOfWork(identity_map=self._identity_map)
 
     @cached_property
     def ticket_api(self) -> TicketAPIProtocol:
-        return MembershipApiClient()
+        return CachedMembershipApiClient(MembershipApiClient(), cache=self.cache)
 
     @cached_property
     def cache(self) -> CacheProtocol:
@@ -55,7 +61,17 @@ class RepositoryInjectionMiddleware[Response]:
         self.get_response: Callable[[RootRequestProtocol], Response] = get_response
 
     def __call__(self, request: RootRequestProtocol) -> Response:
-        if not request.path.startswith(settings.MIDDLEWARE_SKIP_PREFIXES):
-            request.di = DependencyInjector()
-
-        return self.get_response(request)
+        if request.path.startswith(settings.MIDDLEWARE_SKIP_PREFIXES):
+            return self.get_response(request)
+
+        di = DependencyInjector(identity_map=True)
+        request.di = di
+        response = self.get_response(request)
+        if settings.DEBUG and (identity_map := di.uow.identity_map) is not None:
+            logger.debug(
+                "%s: identity map served %d of %d reads",
+                request.path,
+                identity_map.hits,
+                identity_map.hits + identity_map.misses,
+            )
+        return response
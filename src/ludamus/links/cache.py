@@ -1,5 +1,20 @@
+"""Shared cache adapter over Django's configured ``default`` cache.
+
+With ``CACHE_URL`` set the backend is Django's Redis cache, so any
+Redis-protocol server works and ``incr`` maps onto the server's atomic
+``SET NX``/``INCRBY``. The database and local-memory backends used without
+it keep the same interface, but only local memory increments atomically.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from django.core.cache import cache
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
 
 class DjangoCache:
     @staticmethod
@@ -10,3 +25,27 @@ class DjangoCache:
     @staticmethod
     def set(key: str, value: object, timeout: int | None = None) -> None:
         cache.set(key, value, timeout)
+
+    @staticmethod
+    def get_many(keys: Iterable[str]) -> dict[str, object]:
+        # Redis rejects an MGET without keys
+        if not (key_list := list(keys)):
+            return {}
+        result: dict[str, object] = cache.get_many(key_list)
+        return result
+
+    @staticmethod
+    def set_many(values: Mapping[str, object], timeout: int | None = None) -> None:
+        if values:
+            cache.set_many(dict(values), timeout)
+
+    @staticmethod
+    def incr(key: str, delta: int = 1, timeout: int | None = None) -> int:
+        # A missing key starts at delta and expires after timeout; an existing
+        # one keeps its expiry.
+        while not cache.add(key, delta, timeout):
+            try:
+                return int(cache.incr(key, delta))
+            except ValueError:
+                continue  # expired between add and incr
+        return delta
@@ -2,12 +2,20 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from ludamus.adapters.db.django.models import AgendaItem
+from django.db.models import Q
+
+from ludamus.adapters.db.django.models import (
+    AgendaItem,
+    SessionParticipation,
+    SessionParticipationStatus,
+)
+from ludamus.links.db.django.page_version import bump_event_page_version
 from ludamus.pacts import (
     AgendaItemData,
     AgendaItemDTO,
     AgendaItemRepositoryProtocol,
     AgendaItemUpdateData,
+    CalendarEntryDTO,
     NotFoundError,
     SessionStatus,
 )
@@ -35,6 +43,8 @@ def _to_dto(item: AgendaItem) -> AgendaItemDTO:
         category_name=(
             item.session.category.name if item.session.category is not None else None
         ),
+        space_capacity=item.space.capacity,
+        session_participants_limit=item.session.participants_limit,
     )
 
 
@@ -82,6 +92,48 @@ class AgendaItemRepository(AgendaItemRepositoryProtocol):
             return None
         return _to_dto(item)
 
+    @staticmethod
+    def list_calendar_entries(
+        event_pk: int, participant_id: int | None = None
+    ) -> list[CalendarEntryDTO]:
+        """List the event's agenda for calendar feeds, in start time order.
+
+        With ``participant_id`` only sessions the user or one of their
+        connected users is confirmed in are listed.
+
+        Returns:
+            One entry per agenda item.
+        """
+        items = AgendaItem.objects.filter(space__area__venue__event_id=event_pk)
+        if participant_id is not None:
+            enrolled = SessionParticipation.objects.filter(
+                Q(user_id=participant_id) | Q(user__manager_id=participant_id),
+                status=SessionParticipationStatus.CONFIRMED,
+            ).values("session_id")
+            items = items.filter(session_id__in=enrolled)
+        items = items.select_related("session", "space__area__venue")
+        return [
+            CalendarEntryDTO(
+                description=item.session.description,
+                end_time=item.end_time,
+                host_name=item.session.display_name,
+                location=", ".join(
+                    name
+                    for name in (
+                        item.space.name,
+                        item.space.area.name,
+                        item.space.area.venue.name,
+                    )
+                    if name
+                ),
+                modification_time=item.session.modification_time,
+                session_pk=item.session_id,
+                start_time=item.start_time,
+                title=item.session.title,
+            )
+            for item in items.order_by("start_time", "pk")
+        ]
+
     @staticmethod
     def list_overlapping_in_space(
         space_pk: int,
@@ -114,7 +166,11 @@ class AgendaItemRepository(AgendaItemRepositoryProtocol):
 
     @staticmethod
     def update(pk: int, data: AgendaItemUpdateData) -> None:
-        AgendaItem.objects.filter(pk=pk).update(**data)
+        items = AgendaItem.objects.filter(pk=pk)
+        items.update(**data)
+        bump_event_page_version(
+            items.values_list("space__area__venue__event_id", flat=True).first()
+        )
 
     @staticmethod
     def delete(pk: int) -> None:
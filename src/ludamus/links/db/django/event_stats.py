@@ -0,0 +1,88 @@
+"""Version-stamped cache for the panel header statistics.
+
+Every panel page shows proposal, scheduling, host and room counts for the
+current event. They are cached per event under a version stamp. Saving or
+deleting a session, agenda item or space bumps its event's version once
+the transaction commits; bulk writes that bypass model signals call
+``bump_event_stats_version`` themselves or are picked up when the entry
+expires after ``EVENT_STATS_TIMEOUT`` seconds.
+"""
+
+from __future__ import annotations
+
+from secrets import token_hex
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ludamus.adapters.db.django.models import (
+    AgendaItem,
+    Area,
+    ProposalCategory,
+    Session,
+    Space,
+)
+from ludamus.pacts import EventStatsData
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+EVENT_STATS_TIMEOUT = 300
+
+
+def _version_key(event_id: int) -> str:
+    return f"panel:stats-version:{event_id}"
+
+
+def read_event_stats(
+    event_id: int, load: Callable[[], EventStatsData]
+) -> EventStatsData:
+    version_key = _version_key(event_id)
+    if not isinstance(version := cache.get(version_key), str):
+        version = token_hex(8)
+        cache.set(version_key, version, None)
+    stats_key = f"panel:stats:{event_id}:{version}"
+    if isinstance(stats := cache.get(stats_key), EventStatsData):
+        return stats
+    stats = load()
+    cache.set(stats_key, stats, EVENT_STATS_TIMEOUT)
+    return stats
+
+
+def bump_event_stats_version(event_id: int | None) -> None:
+    if event_id is None:
+        return
+    key = _version_key(event_id)
+    transaction.on_commit(lambda: cache.set(key, token_hex(8), None))
+
+
+@receiver((post_save, post_delete), sender=Session)
+def _session_changed(instance: Session, **_kwargs: object) -> None:
+    if instance.category_id is None:
+        return
+    bump_event_stats_version(
+        ProposalCategory.objects.filter(pk=instance.category_id)
+        .values_list("event_id", flat=True)
+        .first()
+    )
+
+
+@receiver((post_save, post_delete), sender=AgendaItem)
+def _agenda_item_changed(instance: AgendaItem, **_kwargs: object) -> None:
+    bump_event_stats_version(
+        Space.objects.filter(pk=instance.space_id)
+        .values_list("area__venue__event_id", flat=True)
+        .first()
+    )
+
+
+@receiver((post_save, post_delete), sender=Space)
+def _space_changed(instance: Space, **_kwargs: object) -> None:
+    bump_event_stats_version(
+        Area.objects.filter(pk=instance.area_id)
+        .values_list("venue__event_id", flat=True)
+        .first()
+    )
@@ -0,0 +1,41 @@
+"""Request-scoped identity map for unit-of-work repositories.
+
+A single request often reads the same user (or the same user's connected
+users) several times. Repositories created with an ``IdentityMap`` memoize
+those reads by key; any write through the same unit of work clears the
+map, so a read after a write always goes to the database again.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+
+class IdentityMap:
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, object] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load[T](self, key: Hashable, load: Callable[[], T]) -> T:
+        if key in self._entries:
+            self.hits += 1
+            return cast("T", self._entries[key])
+        self.misses += 1
+        value = load()
+        self._entries[key] = value
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def memoize[T](
+    identity_map: IdentityMap | None, key: Hashable, load: Callable[[], T]
+) -> T:
+    if identity_map is None:
+        return load()
+    return identity_map.get_or_load(key, load)
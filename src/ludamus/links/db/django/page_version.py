@@ -0,0 +1,262 @@
+"""Version stamps that let the public event page answer conditional GETs.
+
+The event page and the schedule API are rebuilt from the event's venue
+layout, agenda, sessions, session fields, participations and enrollment
+configs, and part of the page depends on who is looking. The panel's schedule
+snapshot also keys on the event stamp, so time slots, tracks, facilitators
+and proposal categories bump it too. Each event and each user carries a stamp
+in the cache: a random token plus the time it was set. Saving or deleting
+anything the page shows replaces the stamp of its event, and saving a user
+(or a user they manage) replaces the user's, once the transaction commits.
+Repository writes that bypass model signals call ``bump_event_page_version``
+or ``bump_session_page_versions`` themselves.
+
+Per-user enrollment allowances are re-checked against the membership API
+while the page renders, so they do not bump the event; callers fold a
+coarse time window into their validators to pick those up, together with
+sessions that start or end.
+
+A missing stamp is recreated with the current time, so a cache flush only
+costs clients one full response.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from secrets import token_hex
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from ludamus.adapters.db.django.models import (
+    AgendaItem,
+    Area,
+    DomainEnrollmentConfig,
+    EnrollmentConfig,
+    Event,
+    Facilitator,
+    ProposalCategory,
+    Session,
+    SessionField,
+    SessionFieldValue,
+    SessionParticipation,
+    Space,
+    Sphere,
+    TimeSlot,
+    Track,
+    User,
+    Venue,
+)
+from ludamus.pacts import PageVersionDTO
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+_M2M_CHANGED = frozenset({"post_add", "post_remove", "post_clear"})
+
+
+def _event_key(event_id: int) -> str:
+    return f"page-version:event:{event_id}"
+
+
+def _user_key(user_id: int) -> str:
+    return f"page-version:user:{user_id}"
+
+
+def _new_stamp() -> tuple[str, datetime]:
+    return token_hex(8), datetime.now(tz=UTC)
+
+
+def read_page_version(event_id: int, user_id: int | None) -> PageVersionDTO:
+    keys = [_event_key(event_id)]
+    if user_id is not None:
+        keys.append(_user_key(user_id))
+    found = cache.get_many(keys)
+    stamps = {key: found[key] for key in keys if isinstance(found.get(key), tuple)}
+    if missing := {key: _new_stamp() for key in keys if key not in stamps}:
+        cache.set_many(missing, None)
+        stamps |= missing
+    ordered = [stamps[key] for key in keys]
+    return PageVersionDTO(
+        tag="-".join(token for token, _ in ordered),
+        modified_at=max(changed_at for _, changed_at in ordered),
+    )
+
+
+def _bump(key: str) -> None:
+    transaction.on_commit(lambda: cache.set(key, _new_stamp(), None))
+
+
+def bump_event_page_version(event_id: int | None) -> None:
+    if event_id is not None:
+        _bump(_event_key(event_id))
+
+
+def bump_user_page_version(user_id: int | None) -> None:
+    if user_id is not None:
+        _bump(_user_key(user_id))
+
+
+def bump_session_page_versions(session_ids: Iterable[int]) -> None:
+    """Bump the events the sessions are proposed to or scheduled in."""
+    rows = Session.objects.filter(pk__in=list(session_ids)).values_list(
+        "category__event_id", "agenda_item__space__area__venue__event_id"
+    )
+    for event_id in {event_id for row in rows for event_id in row}:
+        bump_event_page_version(event_id)
+
+
+@receiver(post_save, sender=Session)
+def _session_saved(instance: Session, **_kwargs: object) -> None:
+    bump_session_page_versions([instance.pk])
+
+
+@receiver(post_delete, sender=Session)
+def _session_deleted(instance: Session, **_kwargs: object) -> None:
+    # The scheduled copy is covered by its agenda item's own delete signal
+    if instance.category_id is None:
+        return
+    bump_event_page_version(
+        ProposalCategory.objects.filter(pk=instance.category_id)
+        .values_list("event_id", flat=True)
+        .first()
+    )
+
+
+@receiver((post_save, post_delete), sender=AgendaItem)
+def _agenda_item_changed(instance: AgendaItem, **_kwargs: object) -> None:
+    bump_event_page_version(
+        Space.objects.filter(pk=instance.space_id)
+        .values_list("area__venue__event_id", flat=True)
+        .first()
+    )
+
+
+@receiver((post_save, post_delete), sender=SessionParticipation)
+def _participation_changed(instance: SessionParticipation, **_kwargs: object) -> None:
+    bump_session_page_versions([instance.session_id])
+
+
+@receiver((post_save, post_delete), sender=SessionFieldValue)
+def _field_value_changed(instance: SessionFieldValue, **_kwargs: object) -> None:
+    bump_session_page_versions([instance.session_id])
+
+
+@receiver((post_save, post_delete), sender=SessionField)
+def _field_changed(instance: SessionField, **_kwargs: object) -> None:
+    # Which values are served depends on the field's is_public flag
+    bump_event_page_version(instance.event_id)
+
+
+@receiver(m2m_changed, sender=Session.facilitators.through)
+@receiver(m2m_changed, sender=Session.tracks.through)
+@receiver(m2m_changed, sender=Session.time_slots.through)
+def _session_links_changed(
+    *,
+    instance: Session | Facilitator | Track | TimeSlot,
+    action: str,
+    **_kwargs: object,
+) -> None:
+    if action not in _M2M_CHANGED:
+        return
+    if isinstance(instance, Session):
+        bump_session_page_versions([instance.pk])
+    else:
+        bump_event_page_version(instance.event_id)
+
+
+@receiver((post_save, post_delete), sender=Facilitator)
+@receiver((post_save, post_delete), sender=ProposalCategory)
+@receiver((post_save, post_delete), sender=TimeSlot)
+@receiver((post_save, post_delete), sender=Track)
+def _event_part_changed(
+    instance: Facilitator | ProposalCategory | TimeSlot | Track, **_kwargs: object
+) -> None:
+    bump_event_page_version(instance.event_id)
+
+
+@receiver(m2m_changed, sender=Track.spaces.through)
+def _track_spaces_changed(
+    *, instance: Track | Space, action: str, **_kwargs: object
+) -> None:
+    if action not in _M2M_CHANGED:
+        return
+    if isinstance(instance, Track):
+        bump_event_page_version(instance.event_id)
+    else:
+        _space_changed(instance)
+
+
+@receiver((post_save, post_delete), sender=Space)
+def _space_changed(instance: Space, **_kwargs: object) -> None:
+    bump_event_page_version(
+        Area.objects.filter(pk=instance.area_id)
+        .values_list("venue__event_id", flat=True)
+        .first()
+    )
+
+
+@receiver((post_save, post_delete), sender=Area)
+def _area_changed(instance: Area, **_kwargs: object) -> None:
+    bump_event_page_version(
+        Venue.objects.filter(pk=instance.venue_id)
+        .values_list("event_id", flat=True)
+        .first()
+    )
+
+
+@receiver((post_save, post_delete), sender=Venue)
+def _venue_changed(instance: Venue, **_kwargs: object) -> None:
+    bump_event_page_version(instance.event_id)
+
+
+@receiver(post_save, sender=Event)
+def _event_saved(instance: Event, **_kwargs: object) -> None:
+    bump_event_page_version(instance.pk)
+
+
+@receiver((post_save, post_delete), sender=EnrollmentConfig)
+def _enrollment_config_changed(instance: EnrollmentConfig, **_kwargs: object) -> None:
+    bump_event_page_version(instance.event_id)
+
+
+@receiver((post_save, post_delete), sender=DomainEnrollmentConfig)
+def _domain_config_changed(instance: DomainEnrollmentConfig, **_kwargs: object) -> None:
+    bump_event_page_version(
+        EnrollmentConfig.objects.filter(pk=instance.enrollment_config_id)
+        .values_list("event_id", flat=True)
+        .first()
+    )
+
+
+@receiver((post_save, post_delete), sender=User)
+def _user_changed(instance: User, **_kwargs: object) -> None:
+    # Connected users are listed on their manager's view of the page
+    bump_user_page_version(instance.pk)
+    bump_user_page_version(instance.manager_id)
+
+
+@receiver(m2m_changed, sender=Sphere.managers.through)
+def _sphere_managers_changed(
+    *,
+    instance: Sphere | User,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    **_kwargs: object,
+) -> None:
+    if reverse:
+        if action in _M2M_CHANGED:
+            bump_user_page_version(instance.pk)
+    elif action in {"post_add", "post_remove"} and pk_set:
+        for user_id in pk_set:
+            bump_user_page_version(user_id)
+    elif action == "pre_clear":
+        for user_id in Sphere.managers.through.objects.filter(
+            sphere_id=instance.pk
+        ).values_list("user_id", flat=True):
+            bump_user_page_version(user_id)
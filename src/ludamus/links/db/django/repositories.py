@@ -1,14 +1,15 @@
-import json
-import re
+from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 from secrets import token_urlsafe
-from typing import TYPE_CHECKING, Literal, cast  # pylint: disable=unused-import
+from typing import TYPE_CHECKING, Any, Literal, cast  # pylint: disable=unused-import
 
 from django.db import transaction
-from django.db.models import Count, Max, Q
+from django.db.models import Case, Count, Max, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, NullIf
 from django.utils.text import slugify
 
 from ludamus.adapters.db.django.models import (
+    DEFAULT_NAME,
     AgendaItem,
     Area,
     Connection,
@@ -39,8 +40,26 @@ from ludamus.adapters.db.django.models import (
     Track,
     UserEnrollmentConfig,
     Venue,
+    duration_to_minutes,
 )
+from ludamus.links.db.django.event_stats import (
+    bump_event_stats_version,
+    read_event_stats,
+)
+from ludamus.links.db.django.identity_map import IdentityMap, memoize
+from ludamus.links.db.django.page_version import (
+    bump_event_page_version,
+    bump_session_page_versions,
+    bump_user_page_version,
+    read_page_version,
+)
+from ludamus.links.db.django.session_search import (
+    schedule_search_refresh,
+    search_session_ids,
+)
+from ludamus.links.db.django.sphere_cache import sphere_domain_cache
 from ludamus.pacts import (
+    ENCOUNTER_PAST_PAGE_SIZE,
     UNSCHEDULED_LIST_LIMIT,
     AreaDTO,
     AreaRepositoryProtocol,
@@ -52,6 +71,7 @@ from ludamus.pacts import (
     EncounterRepositoryProtocol,
     EncounterRSVPDTO,
     EncounterRSVPRepositoryProtocol,
+    EncounterSummaryDTO,
     EnrollmentConfigDTO,
     EnrollmentConfigRepositoryProtocol,
     EventDTO,
@@ -70,6 +90,7 @@ from ludamus.pacts import (
     HostPersonalDataEntry,
     HostPersonalDataRepositoryProtocol,
     NotFoundError,
+    PageVersionDTO,
     PendingSessionDTO,
     PendingSessionTagDTO,
     PendingSessionTimeSlotDTO,
@@ -106,6 +127,7 @@ from ludamus.pacts import (
     TimeSlotDTO,
     TimeSlotRepositoryProtocol,
     TimeSlotRequirementDTO,
+    TrackAttributionDTO,
     TrackCreateData,
     TrackDTO,
     TrackRepositoryProtocol,
@@ -118,6 +140,7 @@ from ludamus.pacts import (
     UserRepositoryProtocol,
     UserType,
     VenueDTO,
+    VenueLayoutCopyDTO,
     VenueRepositoryProtocol,
 )
 from ludamus.pacts.chronology import (
@@ -133,22 +156,14 @@ from ludamus.pacts.multiverse import ConnectionDTO, ConnectionsRepositoryProtoco
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from django.db.models import QuerySet
+
     from ludamus.adapters.db.django.models import User
 else:
     from django.contrib.auth import get_user_model
 
     User = get_user_model()
 
-_ISO8601_DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?")
-
-
-def _parse_iso8601_duration_minutes(duration: str) -> int:
-    if not (m := _ISO8601_DURATION_RE.match(duration)):
-        return 0
-    hours = int(m.group(1) or 0)
-    minutes = int(m.group(2) or 0)
-    return hours * 60 + minutes
-
 
 class SphereRepository(SphereRepositoryProtocol):
     @staticmethod
@@ -160,6 +175,20 @@ class SphereRepository(SphereRepositoryProtocol):
 
         return SphereDTO.model_validate(sphere)
 
+    @staticmethod
+    def resolve_domain(domain: str) -> tuple[SphereDTO, SiteDTO]:
+        if (resolved := sphere_domain_cache.get(domain)) is not None:
+            return resolved
+        try:
+            sphere = Sphere.objects.select_related("site").get(site__domain=domain)
+        except Sphere.DoesNotExist as exception:
+            raise NotFoundError from exception
+
+        sphere_dto = SphereDTO.model_validate(sphere)
+        site_dto = SiteDTO.model_validate(sphere.site)
+        sphere_domain_cache.set(domain, sphere_dto, site_dto)
+        return sphere_dto, site_dto
+
     @staticmethod
     def read(pk: int) -> SphereDTO:
         try:
@@ -188,38 +217,56 @@ class SphereRepository(SphereRepositoryProtocol):
 
 
 class UserRepository(UserRepositoryProtocol):
-    def __init__(self, user_type: UserType) -> None:
+    def __init__(
+        self, user_type: UserType, identity_map: IdentityMap | None = None
+    ) -> None:
         self._user_type = user_type
+        self._identity_map = identity_map
 
-    @staticmethod
-    def create(user_data: UserData) -> None:
+    def create(self, user_data: UserData) -> None:
         User.objects.create(**user_data)
+        self._invalidate()
 
     def read(self, slug: str) -> UserDTO:
-        try:
-            user = User.objects.get(slug=slug, user_type=self._user_type)
-        except User.DoesNotExist as exception:
-            raise NotFoundError from exception
-
-        return UserDTO.model_validate(user)
+        return memoize(
+            self._identity_map,
+            ("user", self._user_type, "slug", slug),
+            lambda: self._get(slug=slug),
+        )
 
     def read_by_id(self, pk: int) -> UserDTO:
-        try:
-            user = User.objects.get(pk=pk, user_type=self._user_type)
-        except User.DoesNotExist as exception:
-            raise NotFoundError from exception
-        return UserDTO.model_validate(user)
+        return memoize(
+            self._identity_map,
+            ("user", self._user_type, "pk", pk),
+            lambda: self._get(pk=pk),
+        )
 
     def read_by_username(self, username: str) -> UserDTO:
+        return memoize(
+            self._identity_map,
+            ("user", self._user_type, "username", username),
+            lambda: self._get(username=username),
+        )
+
+    def update(self, user_slug: str, user_data: UserData) -> None:
+        users = User.objects.filter(slug=user_slug)
+        changed = list(users.values_list("pk", "manager_id"))
+        users.update(**user_data)
+        for pk, manager_id in changed:
+            bump_user_page_version(pk)
+            bump_user_page_version(manager_id)
+        self._invalidate()
+
+    def _get(self, **lookup: str | int) -> UserDTO:
         try:
-            user = User.objects.get(username=username, user_type=self._user_type)
+            user = User.objects.get(user_type=self._user_type, **lookup)
         except User.DoesNotExist as exception:
             raise NotFoundError from exception
         return UserDTO.model_validate(user)
 
-    @staticmethod
-    def update(user_slug: str, user_data: UserData) -> None:
-        User.objects.filter(slug=user_slug).update(**user_data)
+    def _invalidate(self) -> None:
+        if self._identity_map is not None:
+            self._identity_map.clear()
 
     @staticmethod
     def email_exists(email: str, exclude_slug: str | None = None) -> bool:
@@ -259,7 +306,18 @@ class SessionRepository(SessionRepositoryProtocol):  # noqa: PLR0904
 
     @staticmethod
     def update(pk: int, data: SessionUpdateData) -> None:
-        Session.objects.filter(id=pk).update(**data)
+        updates: dict[str, Any] = {**data}
+        if "duration" in data:
+            updates["duration_minutes"] = duration_to_minutes(data["duration"])
+        # QuerySet.update() skips auto_now; calendar feeds key on it
+        updates["modification_time"] = datetime.now(tz=UTC)
+        sessions = Session.objects.filter(id=pk)
+        sessions.update(**updates)
+        schedule_search_refresh([pk])
+        bump_session_page_versions([pk])
+        bump_event_stats_version(
+            sessions.values_list("category__event_id", flat=True).first()
+        )
 
     @staticmethod
     def read_event(session_id: int) -> EventDTO:
@@ -427,6 +485,14 @@ class SessionRepository(SessionRepositoryProtocol):  # noqa: PLR0904
     def slug_exists(sphere_id: int, slug: str) -> bool:
         return Session.objects.filter(sphere_id=sphere_id, slug=slug).exists()
 
+    @staticmethod
+    def read_taken_slugs(sphere_id: int, base_slug: str) -> set[str]:
+        return set(
+            Session.objects.filter(sphere_id=sphere_id)
+            .filter(Q(slug=base_slug) | Q(slug__startswith=f"{base_slug}-"))
+            .values_list("slug", flat=True)
+        )
+
     @staticmethod
     def save_field_values(session_id: int, values: list[SessionFieldValueData]) -> None:
         SessionFieldValue.objects.bulk_create(
@@ -437,6 +503,8 @@ class SessionRepository(SessionRepositoryProtocol):  # noqa: PLR0904
                 for v in values
             ]
         )
+        schedule_search_refresh([session_id])
+        bump_session_page_versions([session_id])
 
     @staticmethod
     def read_field_values(session_id: int) -> list[SessionFieldValueDTO]:
@@ -479,22 +547,18 @@ class SessionRepository(SessionRepositoryProtocol):  # noqa: PLR0904
                     field_values__field_id=field_id, field_values__value=value
                 )
 
+        ranked_ids: list[int] = []
         if search:
-            # SessionFieldValue.value is a JSONField. SQLite stores strings
-            # JSON-encoded with ensure_ascii=True, so non-ASCII chars are
-            # escaped (e.g. "przekleństwa"); Postgres jsonb cast to text keeps
-            # literal Unicode. OR both forms so the lookup works on both.
-            encoded = json.dumps(search)[1:-1]
-            qs = qs.filter(
-                Q(display_name__icontains=search)
-                | Q(presenter__name__icontains=search)
-                | Q(field_values__value__icontains=search)
-                | Q(field_values__value__icontains=encoded)
-            ).distinct()
+            ranked_ids = search_session_ids(event_id, search)
+            qs = qs.filter(pk__in=ranked_ids)
 
         if track_pk is not None:
             qs = qs.filter(tracks__pk=track_pk)
 
+        sessions = list(qs.order_by("-creation_time"))
+        if ranked_ids:
+            rank = {pk: position for position, pk in enumerate(ranked_ids)}
+            sessions.sort(key=lambda s: rank[s.pk])
         return [
             SessionListItemDTO(
                 pk=s.pk,
@@ -504,7 +568,7 @@ class SessionRepository(SessionRepositoryProtocol):  # noqa: PLR0904
                 status=SessionStatus(s.status),
                 creation_time=s.creation_time,
             )
-            for s in qs.order_by("-creation_time")
+            for s in sessions
         ]
 
     @staticmethod
@@ -525,6 +589,24 @@ class SessionRepository(SessionRepositoryProtocol):  # noqa: PLR0904
             raise NotFoundError(msg) from err
         return [FacilitatorDTO.model_validate(f) for f in session.facilitators.all()]
 
+    @staticmethod
+    def read_facilitators_by_sessions(
+        session_ids: Iterable[int],
+    ) -> dict[int, list[FacilitatorDTO]]:
+        if not (ids := list(session_ids)):
+            return {}
+        links = (
+            Session.facilitators.through.objects.filter(session_id__in=ids)
+            .select_related("facilitator")
+            .order_by("facilitator_id")
+        )
+        result: dict[int, list[FacilitatorDTO]] = {sid: [] for sid in ids}
+        for link in links:
+            result[link.session_id].append(
+                FacilitatorDTO.model_validate(link.facilitator)
+            )
+        return result
+
     @staticmethod
     def set_facilitators(session_id: int, facilitator_ids: list[int]) -> None:
         try:
@@ -536,18 +618,30 @@ class SessionRepository(SessionRepositoryProtocol):  # noqa: PLR0904
 
     @staticmethod
     def replace_facilitators_in_sessions(source_ids: list[int], target_id: int) -> None:
-        for session in Session.objects.filter(facilitators__in=source_ids).distinct():
-            session.facilitators.add(target_id)
-            session.facilitators.remove(*source_ids)
+        through = Session.facilitators.through
+        source_links = through.objects.filter(facilitator_id__in=source_ids)
+        session_ids = set(source_links.values_list("session_id", flat=True))
+        # Sessions already listing the target keep their existing link
+        through.objects.bulk_create(
+            (
+                through(session_id=session_id, facilitator_id=target_id)
+                for session_id in session_ids
+            ),
+            ignore_conflicts=True,
+        )
+        source_links.delete()
+        schedule_search_refresh(session_ids)
+        bump_session_page_versions(session_ids)
 
     @staticmethod
-    def list_unscheduled_by_event(
+    def list_unscheduled_by_event(  # noqa: PLR0913
         event_pk: int,
         *,
         track_pk: int | None = None,
         search: str | None = None,
         max_duration_minutes: int | None = None,
         category_pk: int | None = None,
+        after: tuple[str, int] | None = None,
     ) -> tuple[list[UnscheduledSessionDTO], bool]:
         qs = (
             Session.objects.filter(category__event_id=event_pk)
@@ -559,56 +653,88 @@ class SessionRepository(SessionRepositoryProtocol):  # noqa: PLR0904
             qs = qs.filter(tracks__pk=track_pk)
         if category_pk is not None:
             qs = qs.filter(category__pk=category_pk)
+        if max_duration_minutes is not None:
+            qs = qs.filter(duration_minutes__lte=max_duration_minutes)
         if search:
             qs = qs.filter(
                 Q(title__icontains=search) | Q(display_name__icontains=search)
             ).distinct()
-        results: list[UnscheduledSessionDTO] = []
-        has_more = False
-        for s in qs.order_by("title").iterator():
-            duration_minutes = _parse_iso8601_duration_minutes(s.duration)
-            if (
-                max_duration_minutes is not None
-                and duration_minutes > max_duration_minutes
-            ):
-                continue
-            if len(results) >= UNSCHEDULED_LIST_LIMIT:
-                has_more = True
-                break
-            results.append(
-                UnscheduledSessionDTO(
-                    pk=s.pk,
-                    title=s.title,
-                    display_name=s.display_name,
-                    category_name=s.category.name if s.category else "",
-                    category_pk=s.category_id,
-                    duration_minutes=duration_minutes,
-                    participants_limit=s.participants_limit,
-                )
+        if after is not None:
+            after_title, after_pk = after
+            qs = qs.filter(
+                Q(title__gt=after_title) | Q(title=after_title, pk__gt=after_pk)
             )
-        return results, has_more
+        sessions = list(qs.order_by("title", "pk")[: UNSCHEDULED_LIST_LIMIT + 1])
+        results = [
+            UnscheduledSessionDTO(
+                pk=s.pk,
+                title=s.title,
+                display_name=s.display_name,
+                category_name=s.category.name if s.category else "",
+                category_pk=s.category_id,
+                duration_minutes=s.duration_minutes,
+                participants_limit=s.participants_limit,
+            )
+            for s in sessions[:UNSCHEDULED_LIST_LIMIT]
+        ]
+        return results, len(sessions) > UNSCHEDULED_LIST_LIMIT
 
 
 class ConnectedUserRepository(ConnectedUserRepositoryProtocol):
+    def __init__(self, identity_map: IdentityMap | None = None) -> None:
+        self._identity_map = identity_map
+
+    def read_all(self, manager_slug: str) -> list[UserDTO]:
+        connected_users = memoize(
+            self._identity_map,
+            ("connected_users", manager_slug),
+            lambda: self._read_all(manager_slug),
+        )
+        return list(connected_users)
+
+    def create(self, manager_slug: str, user_data: UserData) -> None:
+        manager = User.objects.get(user_type=UserType.ACTIVE, slug=manager_slug)
+        User.objects.create(manager=manager, **user_data)
+        self._invalidate()
+
+    def read(self, manager_slug: str, user_slug: str) -> UserDTO:
+        return memoize(
+            self._identity_map,
+            ("connected_user", manager_slug, user_slug),
+            lambda: self._read(manager_slug, user_slug),
+        )
+
+    def update(self, manager_slug: str, user_slug: str, user_data: UserData) -> None:
+        users = User.objects.filter(slug=user_slug, manager__slug=manager_slug)
+        changed = list(users.values_list("pk", "manager_id"))
+        users.update(**user_data)
+        for pk, manager_id in changed:
+            bump_user_page_version(pk)
+            bump_user_page_version(manager_id)
+        self._invalidate()
+
+    def delete(self, manager_slug: str, user_slug: str) -> None:
+        try:
+            user = User.objects.get(slug=user_slug, manager__slug=manager_slug)
+        except User.DoesNotExist as exception:
+            raise NotFoundError from exception
+        user.delete()
+        self._invalidate()
+
     @staticmethod
-    def read_all(manager_slug: str) -> list[UserDTO]:
+    def _read_all(manager_slug: str) -> tuple[UserDTO, ...]:
         try:
             manager = User.objects.get(user_type=UserType.ACTIVE, slug=manager_slug)
         except User.DoesNotExist as exception:
             raise NotFoundError from exception
 
-        return [
+        return tuple(
             UserDTO.model_validate(connected_user)
             for connected_user in manager.connected.all()
-        ]
-
-    @staticmethod
-    def create(manager_slug: str, user_data: UserData) -> None:
-        manager = User.objects.get(user_type=UserType.ACTIVE, slug=manager_slug)
-        User.objects.create(manager=manager, **user_data)
+        )
 
     @staticmethod
-    def read(manager_slug: str, user_slug: str) -> UserDTO:
+    def _read(manager_slug: str, user_slug: str) -> UserDTO:
         try:
             connected_user = User.objects.get(
                 slug=user_slug, manager__slug=manager_slug
@@ -617,19 +743,9 @@ class ConnectedUserRepository(ConnectedUserRepositoryProtocol):
             raise NotFoundError from exception
         return UserDTO.model_validate(connected_user)
 
-    @staticmethod
-    def update(manager_slug: str, user_slug: str, user_data: UserData) -> None:
-        User.objects.filter(slug=user_slug, manager__slug=manager_slug).update(
-            **user_data
-        )
-
-    @staticmethod
-    def delete(manager_slug: str, user_slug: str) -> None:
-        try:
-            user = User.objects.get(slug=user_slug, manager__slug=manager_slug)
-        except User.DoesNotExist as exception:
-            raise NotFoundError from exception
-        user.delete()
+    def _invalidate(self) -> None:
+        if self._identity_map is not None:
+            self._identity_map.clear()
 
 
 def _event_dto(event: Event) -> EventDTO:
@@ -692,27 +808,45 @@ class EventRepository(EventRepositoryProtocol):
     def get_stats_data(event_id: int) -> EventStatsData:
         """Get raw statistics data for an event.
 
+        All counts come from one query of correlated subqueries; the result
+        is cached until a session, agenda item or space of the event changes.
+
         Returns:
-            EventStatsData with raw counts and IDs for business logic processing.
+            EventStatsData with raw counts for business logic processing.
         """
-        # Ensure event is cached in storage
-        sessions = Session.objects.filter(category__event_id=event_id)
-        scheduled = Session.objects.filter(
-            agenda_item__space__area__venue__event_id=event_id
-        )
-        spaces = Space.objects.filter(area__venue__event_id=event_id)
-
-        return EventStatsData(
-            pending_proposals=sessions.filter(status=SessionStatus.PENDING).count(),
-            scheduled_sessions=scheduled.count(),
-            total_proposals=sessions.count(),
-            unique_host_ids=set(
-                sessions.exclude(presenter_id__isnull=True).values_list(
-                    "presenter_id", flat=True
-                )
-            ),
-            rooms_count=spaces.count(),
+        return read_event_stats(event_id, lambda: _load_event_stats(event_id))
+
+    @staticmethod
+    def read_page_version(
+        slug: str, sphere_id: int, user_id: int | None
+    ) -> PageVersionDTO | None:
+        """Get the version of a published event's page as one user sees it.
+
+        Returns:
+            The combined event and user version, or None if the event does
+            not exist or is not published.
+        """
+        event_id = (
+            Event.objects.filter(
+                slug=slug,
+                sphere_id=sphere_id,
+                publication_time__lte=datetime.now(tz=UTC),
+            )
+            .values_list("pk", flat=True)
+            .first()
         )
+        if event_id is None:
+            return None
+        return read_page_version(event_id, user_id)
+
+    @staticmethod
+    def read_version(pk: int) -> str:
+        """Get the version of everything an event's schedule is built from.
+
+        Returns:
+            A token that changes whenever the event's page version does.
+        """
+        return read_page_version(pk, None).tag
 
     @staticmethod
     def update(event_id: int, data: EventUpdateData) -> None:
@@ -732,6 +866,50 @@ class EventRepository(EventRepositoryProtocol):
         )
 
 
+def _count_per_event(
+    queryset: QuerySet[Any], event_path: str, field: str = "pk"
+) -> Coalesce:
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{event_path: OuterRef("pk")})
+            .order_by()
+            .values(event_path)
+            .annotate(count=Count(field, distinct=True))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def _load_event_stats(event_id: int) -> EventStatsData:
+    proposals = "category__event_id"
+    counts = (
+        Event.objects.filter(pk=event_id)
+        .annotate(
+            pending_proposals=_count_per_event(
+                Session.objects.filter(status=SessionStatus.PENDING), proposals
+            ),
+            scheduled_sessions=_count_per_event(
+                Session.objects.all(), "agenda_item__space__area__venue__event_id"
+            ),
+            total_proposals=_count_per_event(Session.objects.all(), proposals),
+            hosts_count=_count_per_event(
+                Session.objects.all(), proposals, "presenter_id"
+            ),
+            rooms_count=_count_per_event(Space.objects.all(), "area__venue__event_id"),
+        )
+        .values(
+            "pending_proposals",
+            "scheduled_sessions",
+            "total_proposals",
+            "hosts_count",
+            "rooms_count",
+        )
+        .first()
+    )
+    return EventStatsData.model_validate(counts or {})
+
+
 class EventProposalSettingsRepository(EventProposalSettingsRepositoryProtocol):
     @staticmethod
     def read_or_create_by_event(event_id: int) -> EventProposalSettingsDTO:
@@ -756,6 +934,116 @@ class EventSettingsRepository(EventSettingsRepositoryProtocol):
         settings.displayed_session_fields.set(field_ids)
 
 
+def _claim_slug(base_slug: str, taken: set[str]) -> str:
+    # In-memory counterpart of generate_unique_slug for bulk clones: checks
+    # against slugs fetched once up front and reserves the one it returns.
+    slug = base_slug
+    for _ in range(4):
+        if slug not in taken:
+            break
+        slug = f"{base_slug}-{token_urlsafe(3)}"
+    taken.add(slug)
+    return slug
+
+
+def _venue_slugs_and_next_order(event_id: int) -> tuple[set[str], int]:
+    rows = list(Venue.objects.filter(event_id=event_id).values_list("slug", "order"))
+    next_order = max((order for _, order in rows), default=-1) + 1
+    return {slug for slug, _ in rows}, next_order
+
+
+def _clone_venue_contents(
+    venue_map: dict[int, int],
+) -> tuple[dict[int, int], dict[int, int]]:
+    """Bulk-copy the areas and spaces of source venues into new venues.
+
+    The new venues are empty, so the source slugs (unique per parent) are
+    kept as they are.
+
+    Returns:
+        Old to new primary keys of the copied areas and of the copied spaces.
+    """
+    areas = list(
+        Area.objects.filter(venue_id__in=venue_map).order_by("venue_id", "order", "pk")
+    )
+    new_areas = Area.objects.bulk_create(
+        Area(
+            venue_id=venue_map[area.venue_id],
+            name=area.name,
+            slug=area.slug,
+            description=area.description,
+            order=area.order,
+        )
+        for area in areas
+    )
+    area_map = {old.pk: new.pk for old, new in zip(areas, new_areas, strict=True)}
+
+    spaces = list(
+        Space.objects.filter(area_id__in=area_map).order_by("area_id", "order", "pk")
+    )
+    new_spaces = Space.objects.bulk_create(
+        Space(
+            area_id=area_map[space.area_id],
+            name=space.name,
+            slug=space.slug,
+            capacity=space.capacity,
+            order=space.order,
+        )
+        for space in spaces
+    )
+    space_map = {old.pk: new.pk for old, new in zip(spaces, new_spaces, strict=True)}
+    return area_map, space_map
+
+
+def _copy_time_slots(source: Event, target: Event) -> int:
+    offset = target.start_time - source.start_time
+    booked = list(
+        TimeSlot.objects.filter(event=target).values_list("start_time", "end_time")
+    )
+    new_slots: list[TimeSlot] = []
+    for slot in TimeSlot.objects.filter(event=source).order_by("start_time"):
+        start, end = slot.start_time + offset, slot.end_time + offset
+        if any(start < b_end and b_start < end for b_start, b_end in booked):
+            continue
+        booked.append((start, end))
+        new_slots.append(TimeSlot(event=target, start_time=start, end_time=end))
+    return len(TimeSlot.objects.bulk_create(new_slots))
+
+
+def _copy_tracks(
+    source_event_id: int, target_event_id: int, space_map: dict[int, int]
+) -> int:
+    tracks = list(Track.objects.filter(event_id=source_event_id).order_by("pk"))
+    taken = set(
+        Track.objects.filter(event_id=target_event_id).values_list("slug", flat=True)
+    )
+    new_tracks = Track.objects.bulk_create(
+        Track(
+            event_id=target_event_id,
+            name=track.name,
+            slug=_claim_slug(track.slug, taken),
+            is_public=track.is_public,
+        )
+        for track in tracks
+    )
+    track_map = {old.pk: new.pk for old, new in zip(tracks, new_tracks, strict=True)}
+
+    track_spaces = Track.spaces.through
+    track_spaces.objects.bulk_create(
+        track_spaces(
+            track_id=track_map[link.track_id], space_id=space_map[link.space_id]
+        )
+        for link in track_spaces.objects.filter(track_id__in=track_map)
+        if link.space_id in space_map
+    )
+    track_managers = Track.managers.through
+    track_managers.objects.bulk_create(
+        track_managers(track_id=track_map[link.track_id], user_id=link.user_id)
+        for link in track_managers.objects.filter(track_id__in=track_map)
+    )
+    return len(new_tracks)
+
+
 class VenueRepository(VenueRepositoryProtocol):
     @transaction.atomic
     def create(self, event_id: int, name: str, address: str = "") -> VenueDTO:
@@ -934,6 +1222,28 @@ class VenueRepository(VenueRepositoryProtocol):
 
         return slug
 
+    @staticmethod
+    def _clone(venue: Venue, event_id: int, name: str) -> Venue:
+        """Bulk-copy a venue with its areas and spaces into an event.
+
+        Expects the caller to hold the target event lock.
+
+        Returns:
+            The new venue.
+        """
+        taken, next_order = _venue_slugs_and_next_order(event_id)
+        new_venue = Venue.objects.create(
+            event_id=event_id,
+            name=name,
+            slug=_claim_slug(slugify(name), taken),
+            address=venue.address,
+            order=next_order,
+        )
+        _clone_venue_contents({venue.pk: new_venue.pk})
+        bump_event_stats_version(event_id)
+        bump_event_page_version(event_id)
+        return new_venue
+
     @transaction.atomic
     def duplicate(self, pk: int, new_name: str) -> VenueDTO:
         """Duplicate a venue within the same event.
@@ -959,51 +1269,7 @@ class VenueRepository(VenueRepositoryProtocol):
         # Lock event to serialize slug generation for all new entities
         Event.objects.select_for_update().get(pk=venue.event_id)
 
-        # Create new venue
-        base_slug = slugify(new_name)
-        new_slug = self.generate_unique_slug(venue.event_id, base_slug)
-
-        max_order = (
-            Venue.objects.filter(event_id=venue.event_id).aggregate(
-                max_order=Max("order")
-            )["max_order"]
-            or -1
-        )
-
-        new_venue = Venue.objects.create(
-            event_id=venue.event_id,
-            name=new_name,
-            slug=new_slug,
-            address=venue.address,
-            order=max_order + 1,
-        )
-
-        # Copy areas and spaces (event lock serializes all slug generation)
-        areas = Area.objects.filter(venue_id=pk).order_by("order")
-        for area in areas:
-            area_slug = AreaRepository.generate_unique_slug(new_venue.pk, area.slug)
-            new_area = Area.objects.create(
-                venue_id=new_venue.pk,
-                name=area.name,
-                slug=area_slug,
-                description=area.description,
-                order=area.order,
-            )
-
-            # Copy spaces for this area
-            spaces = Space.objects.filter(area_id=area.pk).order_by("order")
-            for space in spaces:
-                space_slug = SpaceRepository.generate_unique_slug(
-                    new_area.pk, space.slug
-                )
-                Space.objects.create(
-                    area_id=new_area.pk,
-                    name=space.name,
-                    slug=space_slug,
-                    capacity=space.capacity,
-                    order=space.order,
-                )
-
+        new_venue = self._clone(venue, venue.event_id, new_name)
         return VenueDTO.model_validate(new_venue)
 
     @transaction.atomic
@@ -1031,52 +1297,69 @@ class VenueRepository(VenueRepositoryProtocol):
         # Lock target event to serialize slug generation for all new entities
         Event.objects.select_for_update().get(pk=target_event_id)
 
-        # Create new venue in target event
-        base_slug = slugify(venue.name)
-        new_slug = self.generate_unique_slug(target_event_id, base_slug)
+        new_venue = self._clone(venue, target_event_id, venue.name)
+        return VenueDTO.model_validate(new_venue)
 
-        max_order = (
-            Venue.objects.filter(event_id=target_event_id).aggregate(
-                max_order=Max("order")
-            )["max_order"]
-            or -1
-        )
+    @transaction.atomic
+    def copy_layout_from_event(  # noqa: PLR6301
+        self, source_event_id: int, target_event_id: int
+    ) -> VenueLayoutCopyDTO:
+        """Copy all venues, areas, spaces, time slots and tracks of an event.
 
-        new_venue = Venue.objects.create(
-            event_id=target_event_id,
-            name=venue.name,
-            slug=new_slug,
-            address=venue.address,
-            order=max_order + 1,
-        )
+        The query count does not depend on the size of the layout. Slugs
+        already taken in the target event get a random suffix, time slots
+        are shifted by the offset between the events' start times (skipping
+        any that would overlap an existing slot) and tracks keep their
+        spaces and managers.
 
-        # Copy areas and spaces (event lock serializes all slug generation)
-        areas = Area.objects.filter(venue_id=pk).order_by("order")
-        for area in areas:
-            area_slug = AreaRepository.generate_unique_slug(new_venue.pk, area.slug)
-            new_area = Area.objects.create(
-                venue_id=new_venue.pk,
-                name=area.name,
-                slug=area_slug,
-                description=area.description,
-                order=area.order,
-            )
+        Args:
+            source_event_id: The event to copy from.
+            target_event_id: The event to copy into.
 
-            # Copy spaces for this area
-            spaces = Space.objects.filter(area_id=area.pk).order_by("order")
-            for space in spaces:
-                space_slug = SpaceRepository.generate_unique_slug(
-                    new_area.pk, space.slug
-                )
-                Space.objects.create(
-                    area_id=new_area.pk,
-                    name=space.name,
-                    slug=space_slug,
-                    capacity=space.capacity,
-                    order=space.order,
-                )
+        Returns:
+            Number of copied rows of each kind.
 
-        return VenueDTO.model_validate(new_venue)
+        Raises:
+            NotFoundError: If either event is not found.
+        """
+        events = Event.objects.select_for_update().in_bulk(
+            [source_event_id, target_event_id]
+        )
+        if source_event_id not in events or target_event_id not in events:
+            msg = f"Event '{source_event_id}' or '{target_event_id}' not found"
+            raise NotFoundError(msg)
+
+        taken, next_order = _venue_slugs_and_next_order(target_event_id)
+        venues = list(
+            Venue.objects.filter(event_id=source_event_id).order_by(
+                "order", "name", "pk"
+            )
+        )
+        new_venues = Venue.objects.bulk_create(
+            Venue(
+                event_id=target_event_id,
+                name=venue.name,
+                slug=_claim_slug(venue.slug, taken),
+                address=venue.address,
+                order=next_order + index,
+            )
+            for index, venue in enumerate(venues)
+        )
+        area_map, space_map = _clone_venue_contents(
+            {old.pk: new.pk for old, new in zip(venues, new_venues, strict=True)}
+        )
+        time_slots = _copy_time_slots(events[source_event_id], events[target_event_id])
+        tracks = _copy_tracks(source_event_id, target_event_id, space_map)
+        bump_event_stats_version(target_event_id)
+        bump_event_page_version(target_event_id)
+
+        return VenueLayoutCopyDTO(
+            venues=len(new_venues),
+            areas=len(area_map),
+            spaces=len(space_map),
+            time_slots=time_slots,
+            tracks=tracks,
+        )
 
 
 class AreaRepository(AreaRepositoryProtocol):
@@ -1991,6 +2274,11 @@ class PersonalDataFieldRepository(PersonalDataFieldRepositoryProtocol):
 
         return self._to_dto(field)
 
+    @staticmethod
+    def read_pks_by_slug(event_id: int) -> dict[str, int]:
+        fields = PersonalDataField.objects.filter(event_id=event_id)
+        return dict(fields.values_list("slug", "pk"))
+
     def update(
         self, pk: int, data: PersonalDataFieldUpdateData
     ) -> PersonalDataFieldDTO:
@@ -2136,6 +2424,11 @@ class SessionFieldRepository(SessionFieldRepositoryProtocol):
 
         return self._to_dto(field)
 
+    @staticmethod
+    def read_pks_by_slug(event_id: int) -> dict[str, int]:
+        fields = SessionField.objects.filter(event_id=event_id)
+        return dict(fields.values_list("slug", "pk"))
+
     def update(self, pk: int, data: SessionFieldUpdateData) -> SessionFieldDTO:
         try:
             field = SessionField.objects.prefetch_related("options").get(pk=pk)
@@ -2249,14 +2542,33 @@ class FacilitatorRepository(FacilitatorRepositoryProtocol):
         )
         return [FacilitatorListItemDTO.model_validate(f) for f in qs]
 
+    @staticmethod
+    def read_by_pks(pks: Iterable[int]) -> dict[int, FacilitatorDTO]:
+        return {
+            facilitator.pk: FacilitatorDTO.model_validate(facilitator)
+            for facilitator in Facilitator.objects.filter(pk__in=list(pks))
+        }
+
     @staticmethod
     def delete(pk: int) -> None:
         Facilitator.objects.filter(pk=pk).delete()
 
+    @staticmethod
+    def delete_by_pks(pks: list[int]) -> None:
+        Facilitator.objects.filter(pk__in=pks).delete()
+
     @staticmethod
     def slug_exists(event_id: int, slug: str) -> bool:
         return Facilitator.objects.filter(event_id=event_id, slug=slug).exists()
 
+    @staticmethod
+    def read_taken_slugs(event_id: int, base_slug: str) -> set[str]:
+        return set(
+            Facilitator.objects.filter(event_id=event_id)
+            .filter(Q(slug=base_slug) | Q(slug__startswith=f"{base_slug}-"))
+            .values_list("slug", flat=True)
+        )
+
 
 class HostPersonalDataRepository(HostPersonalDataRepositoryProtocol):
     @staticmethod
@@ -2316,6 +2628,30 @@ class EnrollmentConfigRepository(EnrollmentConfigRepositoryProtocol):
             UserEnrollmentConfigDTO.model_validate(user_config) if user_config else None
         )
 
+    @staticmethod
+    def read_user_configs(
+        config: EnrollmentConfigDTO, user_emails: Iterable[str]
+    ) -> dict[str, UserEnrollmentConfigDTO]:
+        return {
+            user_config.user_email: UserEnrollmentConfigDTO.model_validate(user_config)
+            for user_config in UserEnrollmentConfig.objects.filter(
+                enrollment_config_id=config.pk, user_email__in=list(user_emails)
+            )
+        }
+
+    @staticmethod
+    def create_user_configs(
+        user_enrollment_configs: Iterable[UserEnrollmentConfigData],
+    ) -> None:
+        # A row created meanwhile by a request for the same user wins
+        UserEnrollmentConfig.objects.bulk_create(
+            (
+                UserEnrollmentConfig(**user_enrollment_config)
+                for user_enrollment_config in user_enrollment_configs
+            ),
+            ignore_conflicts=True,
+        )
+
     @staticmethod
     def update_user_config(user_enrollment_config: UserEnrollmentConfigDTO) -> None:
         update_dict = user_enrollment_config.model_dump()
@@ -2388,6 +2724,35 @@ class TimeSlotRepository(TimeSlotRepositoryProtocol):
         return TimeSlotDTO.model_validate(time_slot)
 
 
+def _involves_user(user_id: int) -> Q:
+    # A subquery rather than a join on rsvps keeps one row per encounter, so
+    # the RSVP count below needs no DISTINCT.
+    return Q(creator_id=user_id) | Q(
+        pk__in=EncounterRSVP.objects.filter(user_id=user_id).values("encounter_id")
+    )
+
+
+def _with_encounter_summary(encounters: QuerySet[Encounter]) -> QuerySet[Encounter]:
+    return encounters.annotate(
+        rsvp_count=Count("rsvps"),
+        creator_name=Case(
+            When(
+                creator__user_type=UserType.ACTIVE,
+                then=Coalesce(NullIf("creator__name", Value("")), Value(DEFAULT_NAME)),
+            ),
+            default=Value(""),
+        ),
+    )
+
+
+def _encounter_summary(encounter: Encounter) -> EncounterSummaryDTO:
+    return EncounterSummaryDTO(
+        encounter=EncounterDTO.model_validate(encounter),
+        rsvp_count=encounter.rsvp_count,  # type: ignore[attr-defined]
+        creator_name=encounter.creator_name,  # type: ignore[attr-defined]
+    )
+
+
 class EncounterRepository(EncounterRepositoryProtocol):
     @staticmethod
     def create(data: EncounterData) -> EncounterDTO:
@@ -2418,38 +2783,46 @@ class EncounterRepository(EncounterRepositoryProtocol):
         return [EncounterDTO.model_validate(e) for e in encounters]
 
     @staticmethod
-    def list_upcoming_by_creator(sphere_id: int, creator_id: int) -> list[EncounterDTO]:
-        now = datetime.now(tz=UTC)
-        encounters = Encounter.objects.filter(
-            sphere_id=sphere_id, creator_id=creator_id, start_time__gte=now
-        ).order_by("start_time")
-        return [EncounterDTO.model_validate(e) for e in encounters]
-
-    @staticmethod
-    def list_upcoming_rsvpd(sphere_id: int, user_id: int) -> list[EncounterDTO]:
+    def list_upcoming_summaries(
+        sphere_id: int, user_id: int
+    ) -> list[EncounterSummaryDTO]:
         now = datetime.now(tz=UTC)
-        encounters = (
+        encounters = _with_encounter_summary(
             Encounter.objects.filter(
-                sphere_id=sphere_id, rsvps__user_id=user_id, start_time__gte=now
+                _involves_user(user_id), sphere_id=sphere_id, start_time__gte=now
             )
-            .exclude(creator_id=user_id)
-            .order_by("start_time")
-        )
-        return [EncounterDTO.model_validate(e) for e in encounters]
+        ).order_by("start_time", "pk")
+        return [_encounter_summary(e) for e in encounters]
 
     @staticmethod
-    def list_past(sphere_id: int, user_id: int) -> list[EncounterDTO]:
+    def list_past_summaries(
+        sphere_id: int,
+        user_id: int,
+        *,
+        before_pk: int | None = None,
+        limit: int = ENCOUNTER_PAST_PAGE_SIZE,
+    ) -> tuple[list[EncounterSummaryDTO], bool]:
         now = datetime.now(tz=UTC)
-        encounters = (
-            Encounter.objects.filter(
-                Q(creator_id=user_id) | Q(rsvps__user_id=user_id),
-                sphere_id=sphere_id,
-                start_time__lt=now,
+        encounters = Encounter.objects.filter(
+            _involves_user(user_id), sphere_id=sphere_id, start_time__lt=now
+        )
+        before = (
+            Encounter.objects.filter(pk=before_pk)
+            .values_list("start_time", flat=True)
+            .first()
+            if before_pk is not None
+            else None
+        )
+        if before is not None:
+            encounters = encounters.filter(
+                Q(start_time__lt=before) | Q(start_time=before, pk__lt=before_pk)
             )
-            .distinct()
-            .order_by("-start_time")
+        rows = list(
+            _with_encounter_summary(encounters).order_by("-start_time", "-pk")[
+                : limit + 1
+            ]
         )
-        return [EncounterDTO.model_validate(e) for e in encounters]
+        return [_encounter_summary(e) for e in rows[:limit]], len(rows) > limit
 
     @staticmethod
     def update(pk: int, data: EncounterData) -> None:
@@ -2602,6 +2975,28 @@ class TrackRepository(TrackRepositoryProtocol):
     def list_space_pks(pk: int) -> list[int]:
         return list(Space.objects.filter(tracks__pk=pk).values_list("pk", flat=True))
 
+    @staticmethod
+    def read_space_pks_by_event(event_pk: int) -> dict[int, list[int]]:
+        tracks = Track.objects.filter(event_id=event_pk)
+        result: dict[int, list[int]] = {
+            pk: [] for pk in tracks.values_list("pk", flat=True)
+        }
+        links = Track.spaces.through.objects.filter(track__event_id=event_pk)
+        for track_id, space_id in links.values_list("track_id", "space_id"):
+            result[track_id].append(space_id)
+        return result
+
+    @staticmethod
+    def read_session_pks_by_event(event_pk: int) -> dict[int, list[int]]:
+        tracks = Track.objects.filter(event_id=event_pk)
+        result: dict[int, list[int]] = {
+            pk: [] for pk in tracks.values_list("pk", flat=True)
+        }
+        links = Track.sessions.through.objects.filter(track__event_id=event_pk)
+        for track_id, session_id in links.values_list("track_id", "session_id"):
+            result[track_id].append(session_id)
+        return result
+
     @staticmethod
     def list_manager_pks(pk: int) -> list[int]:
         return list(
@@ -2609,17 +3004,64 @@ class TrackRepository(TrackRepositoryProtocol):
         )
 
     @staticmethod
-    def list_by_session(session_pk: int) -> list[TrackDTO]:
-        tracks = Track.objects.filter(sessions__pk=session_pk).order_by("name")
-        return [TrackDTO.model_validate(t) for t in tracks]
+    def get_progress_counts(event_pk: int) -> dict[int, dict[str, int]]:
+        in_event = Q(sessions__category__event_id=event_pk)
+        accepted = (SessionStatus.PENDING, SessionStatus.SCHEDULED)
+        rows = (
+            Track.objects.filter(event_id=event_pk)
+            .values("pk")
+            .annotate(
+                accepted=Count(
+                    "sessions", filter=in_event & Q(sessions__status__in=accepted)
+                ),
+                scheduled=Count(
+                    "sessions",
+                    filter=in_event & Q(sessions__status=SessionStatus.SCHEDULED),
+                ),
+            )
+            .order_by()
+        )
+        return {
+            row["pk"]: {"accepted": row["accepted"], "scheduled": row["scheduled"]}
+            for row in rows
+        }
 
     @staticmethod
-    def list_manager_names(track_pk: int) -> list[str]:
-        return list(
-            User.objects.filter(managed_tracks__pk=track_pk)
-            .order_by("name")
-            .values_list("name", flat=True)
+    def read_manager_names_by_event(event_pk: int) -> dict[int, list[str]]:
+        result: dict[int, list[str]] = defaultdict(list)
+        links = Track.managers.through.objects.filter(
+            track__event_id=event_pk
+        ).order_by("user__name")
+        for track_id, name in links.values_list("track_id", "user__name"):
+            result[track_id].append(name)
+        return dict(result)
+
+    @staticmethod
+    def read_attributions_by_sessions(
+        session_pks: Iterable[int],
+    ) -> dict[int, list[TrackAttributionDTO]]:
+        links = list(
+            Track.sessions.through.objects.filter(session_id__in=list(session_pks))
+            .order_by("track__name", "track_id")
+            .values_list("session_id", "track_id", "track__name")
         )
+        manager_names: dict[int, list[str]] = defaultdict(list)
+        managers = Track.managers.through.objects.filter(
+            track_id__in={track_id for _, track_id, _ in links}
+        ).order_by("user__name")
+        for track_id, name in managers.values_list("track_id", "user__name"):
+            manager_names[track_id].append(name)
+
+        result: dict[int, list[TrackAttributionDTO]] = defaultdict(list)
+        for session_id, track_id, track_name in links:
+            result[session_id].append(
+                TrackAttributionDTO(
+                    track_pk=track_id,
+                    track_name=track_name,
+                    manager_names=manager_names[track_id],
+                )
+            )
+        return dict(result)
 
 
 class ConnectionsRepository(ConnectionsRepositoryProtocol):
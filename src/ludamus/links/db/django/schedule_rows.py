@@ -0,0 +1,122 @@
+"""Plain rows of the public schedule for the read-only JSON API.
+
+Rows come straight from ``values_list`` and are zipped with the API's field
+names, so a page of ten thousand sessions builds no model instances and no
+DTOs. Pages are keyset-ordered on the primary key: a page costs an index
+range scan however deep the client has read, and rows inserted behind the
+cursor never shift the ones ahead of it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.utils import timezone
+
+from ludamus.adapters.db.django.models import (
+    AgendaItem,
+    Event,
+    Session,
+    SessionFieldValue,
+    Space,
+)
+from ludamus.pacts import ScheduleResource, ScheduleRowsRepositoryProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from django.db.models import QuerySet
+
+# API field name -> ORM lookup. Session ``field_values`` is not a column; it is
+# filled from one extra query per page.
+_PATHS: dict[ScheduleResource, dict[str, str]] = {
+    ScheduleResource.EVENTS: {
+        "id": "pk",
+        "slug": "slug",
+        "name": "name",
+        "description": "description",
+        "start_time": "start_time",
+        "end_time": "end_time",
+    },
+    ScheduleResource.SPACES: {
+        "id": "pk",
+        "slug": "slug",
+        "name": "name",
+        "capacity": "capacity",
+        "area": "area__name",
+        "venue": "area__venue__name",
+    },
+    ScheduleResource.AGENDA: {
+        "id": "pk",
+        "session_id": "session_id",
+        "space_id": "space_id",
+        "start_time": "start_time",
+        "end_time": "end_time",
+    },
+    ScheduleResource.SESSIONS: {
+        "id": "pk",
+        "slug": "slug",
+        "title": "title",
+        "host": "display_name",
+        "description": "description",
+        "participants_limit": "participants_limit",
+        "min_age": "min_age",
+        "enrolled_count": "confirmed_participants_count",
+        "waiting_count": "waiting_participants_count",
+    },
+}
+
+
+def _scoped(resource: ScheduleResource, scope_pk: int) -> QuerySet[object]:
+    match resource:
+        case ScheduleResource.EVENTS:
+            return Event.objects.filter(
+                sphere_id=scope_pk, publication_time__lte=timezone.now()
+            )
+        case ScheduleResource.SPACES:
+            return Space.objects.filter(area__venue__event_id=scope_pk)
+        case ScheduleResource.AGENDA:
+            return AgendaItem.objects.filter(space__area__venue__event_id=scope_pk)
+        case ScheduleResource.SESSIONS:
+            return Session.objects.filter(
+                agenda_item__space__area__venue__event_id=scope_pk
+            )
+
+
+def _attach_field_values(rows: list[dict[str, object]]) -> None:
+    by_session: dict[object, dict[str, object]] = {}
+    for row in rows:
+        row["field_values"] = by_session[row["id"]] = {}
+    values = (
+        SessionFieldValue.objects.filter(
+            session_id__in=list(by_session), field__is_public=True
+        )
+        .order_by("field__order", "field_id")
+        .values_list("session_id", "field__slug", "value")
+    )
+    for session_id, slug, value in values:
+        by_session[session_id][slug] = value
+
+
+class ScheduleRowsRepository(ScheduleRowsRepositoryProtocol):
+    @staticmethod
+    def read_page(
+        resource: ScheduleResource,
+        scope_pk: int,
+        fields: Sequence[str],
+        *,
+        after: int | None,
+        limit: int,
+    ) -> list[dict[str, object]]:
+        paths = _PATHS[resource]
+        names = ["id", *(name for name in fields if name != "id" and name in paths)]
+        query = _scoped(resource, scope_pk).order_by("pk")
+        if after is not None:
+            query = query.filter(pk__gt=after)
+        rows = [
+            dict(zip(names, values, strict=True))
+            for values in query.values_list(*(paths[name] for name in names))[:limit]
+        ]
+        if "field_values" in fields and rows:
+            _attach_field_values(rows)
+        return rows
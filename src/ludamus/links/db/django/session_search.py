@@ -0,0 +1,179 @@
+"""Full-text search over maintained per-session search documents.
+
+Each session has a ``SessionSearchDocument``: its title, host names,
+facilitators, track names and field values flattened into one lower-cased
+text. The signal handlers below rebuild the documents of affected sessions
+once the surrounding transaction commits; repository writes that bypass
+model signals (``QuerySet.update``, ``bulk_create``) call
+``schedule_search_refresh`` themselves.
+
+Every search term must occur in the document (substring match, like the
+``icontains`` filter this replaces). On Postgres the match is served by a
+trigram GIN index and ranked with ``ts_rank``; on SQLite an FTS5 table with
+the trigram tokenizer serves terms of three or more characters and ranks
+with bm25.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from django.db import connection, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from ludamus.adapters.db.django.models import (
+    Facilitator,
+    Session,
+    SessionFieldValue,
+    SessionSearchDocument,
+    Track,
+    User,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+TABLE = "session_search_document"
+FTS_TABLE = "session_search_document_fts"
+MIN_TRIGRAM_TERM_LENGTH = 3
+
+_local = threading.local()
+
+
+def search_session_ids(event_id: int, search: str) -> list[int]:
+    """Find the event's sessions whose document contains every search term.
+
+    Returns:
+        Matching session ids, best match first.
+    """
+    if not (terms := search.lower().split()):
+        return []
+    if connection.vendor == "sqlite":
+        sql, params = _sqlite_query(event_id, terms)
+    else:
+        sql, params = _postgres_query(event_id, search.lower(), terms)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _like(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _like_clauses(column: str, terms: Iterable[str]) -> tuple[str, list[object]]:
+    terms = list(terms)
+    sql = "".join(f" AND {column} LIKE %s ESCAPE '\\'" for _ in terms)
+    return sql, [_like(term) for term in terms]
+
+
+def _postgres_query(
+    event_id: int, search: str, terms: list[str]
+) -> tuple[str, list[object]]:
+    likes, like_params = _like_clauses("document", terms)
+    sql = (
+        f"SELECT session_id FROM {TABLE} WHERE event_id = %s{likes} "  # noqa: S608
+        "ORDER BY ts_rank(to_tsvector('simple', document), "
+        "plainto_tsquery('simple', %s)) DESC, session_id DESC"
+    )
+    return sql, [event_id, *like_params, search]
+
+
+def _sqlite_query(event_id: int, terms: list[str]) -> tuple[str, list[object]]:
+    indexed = [t for t in terms if len(t) >= MIN_TRIGRAM_TERM_LENGTH]
+    short = [t for t in terms if len(t) < MIN_TRIGRAM_TERM_LENGTH]
+    likes, like_params = _like_clauses("d.document", short)
+    if not indexed:
+        sql = (
+            f"SELECT d.session_id FROM {TABLE} d "  # noqa: S608
+            f"WHERE d.event_id = %s{likes} ORDER BY d.session_id DESC"
+        )
+        return sql, [event_id, *like_params]
+    match = " AND ".join('"{}"'.format(t.replace('"', '""')) for t in indexed)
+    sql = (
+        f"SELECT d.session_id FROM {FTS_TABLE} "  # noqa: S608
+        f"JOIN {TABLE} d ON d.session_id = {FTS_TABLE}.rowid "
+        f"WHERE {FTS_TABLE} MATCH %s AND d.event_id = %s{likes} "
+        f"ORDER BY {FTS_TABLE}.rank, d.session_id DESC"
+    )
+    return sql, [match, event_id, *like_params]
+
+
+def _pending() -> set[int]:
+    if not hasattr(_local, "session_ids"):
+        _local.session_ids = set()
+    pending: set[int] = _local.session_ids
+    return pending
+
+
+def schedule_search_refresh(session_ids: Iterable[int]) -> None:
+    """Rebuild the sessions' search documents once the transaction commits.
+
+    Ids collected during one transaction are refreshed together by the
+    first commit callback that runs.
+    """
+    _pending().update(session_ids)
+    transaction.on_commit(_flush)
+
+
+def _flush() -> None:
+    if not (pending := _pending()):
+        return
+    session_ids = set(pending)
+    pending.clear()
+    SessionSearchDocument.objects.refresh(session_ids)
+
+
+@receiver(post_save, sender=Session)
+def _session_saved(instance: Session, **_kwargs: object) -> None:
+    schedule_search_refresh([instance.pk])
+
+
+@receiver((post_save, post_delete), sender=SessionFieldValue)
+def _field_value_changed(instance: SessionFieldValue, **_kwargs: object) -> None:
+    schedule_search_refresh([instance.session_id])
+
+
+@receiver(m2m_changed, sender=Session.facilitators.through)
+@receiver(m2m_changed, sender=Session.tracks.through)
+def _session_links_changed(
+    *,
+    instance: Session | Facilitator | Track,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    **_kwargs: object,
+) -> None:
+    if not reverse:
+        if action in {"post_add", "post_remove", "post_clear"}:
+            schedule_search_refresh([instance.pk])
+    elif action in {"post_add", "post_remove"} and pk_set:
+        schedule_search_refresh(pk_set)
+    elif action == "pre_clear":
+        schedule_search_refresh(instance.sessions.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Facilitator)
+@receiver(post_save, sender=Track)
+@receiver(pre_delete, sender=Facilitator)
+@receiver(pre_delete, sender=Track)
+def _session_label_changed(instance: Facilitator | Track, **_kwargs: object) -> None:
+    schedule_search_refresh(instance.sessions.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=User)
+def _presenter_saved(
+    *,
+    instance: User,
+    created: bool,
+    update_fields: frozenset[str] | None,
+    **_kwargs: object,
+) -> None:
+    if created or (update_fields is not None and "name" not in update_fields):
+        return
+    schedule_search_refresh(
+        Session.objects.filter(presenter=instance).values_list("pk", flat=True)
+    )
@@ -0,0 +1,68 @@
+"""Process-local cache of domain → sphere/site resolution.
+
+Every request resolves the root and the current sphere by domain. Spheres
+and sites change rarely, so resolved DTOs are kept in memory for
+``SPHERE_CACHE_TIMEOUT`` seconds. Saving or deleting a ``Sphere`` or
+``Site`` clears this process's map once the transaction commits; other
+processes pick the change up when their entries expire.
+"""
+
+from __future__ import annotations
+
+import threading
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from django.contrib.sites.models import Site
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ludamus.adapters.db.django.models import Sphere
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ludamus.pacts import SiteDTO, SphereDTO
+
+SPHERE_CACHE_TIMEOUT = 60
+
+
+class SphereDomainCache:
+    def __init__(
+        self,
+        timeout: float = SPHERE_CACHE_TIMEOUT,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.timeout = timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, SphereDTO, SiteDTO]] = {}
+
+    def get(self, domain: str) -> tuple[SphereDTO, SiteDTO] | None:
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry is None:
+                return None
+            expires_at, sphere, site = entry
+            if expires_at <= self._clock():
+                del self._entries[domain]
+                return None
+            return sphere, site
+
+    def set(self, domain: str, sphere: SphereDTO, site: SiteDTO) -> None:
+        with self._lock:
+            self._entries[domain] = (self._clock() + self.timeout, sphere, site)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+sphere_domain_cache = SphereDomainCache()
+
+
+@receiver((post_save, post_delete), sender=Sphere)
+@receiver((post_save, post_delete), sender=Site)
+def _invalidate_sphere_domain_cache(**kwargs: object) -> None:  # noqa: ARG001
+    transaction.on_commit(sphere_domain_cache.clear)
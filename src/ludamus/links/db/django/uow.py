@@ -7,20 +7,31 @@ from django.db import transaction
 from ludamus.adapters.db.django.models import User
 from ludamus.links.db.django import repositories
 from ludamus.links.db.django.agenda_item import AgendaItemRepository
+from ludamus.links.db.django.identity_map import IdentityMap
 from ludamus.links.db.django.schedule_change_log import ScheduleChangeLogRepository
+from ludamus.links.db.django.schedule_rows import ScheduleRowsRepository
 from ludamus.pacts import UnitOfWorkProtocol, UserType
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from contextlib import AbstractContextManager
 
     from django.http import HttpRequest
 
 
 class UnitOfWork(UnitOfWorkProtocol):  # noqa: PLR0904
+    def __init__(self, *, identity_map: bool = False) -> None:
+        # Opt-in: memoize user reads for the lifetime of this unit of work
+        self.identity_map = IdentityMap() if identity_map else None
+
     @staticmethod
     def atomic() -> AbstractContextManager[None]:
         return transaction.atomic()
 
+    @staticmethod
+    def on_commit(callback: Callable[[], None]) -> None:
+        transaction.on_commit(callback)
+
     @staticmethod
     def login_user(request: HttpRequest, user_slug: str) -> None:
         user = User.objects.get(slug=user_slug)
@@ -28,7 +39,9 @@ class UnitOfWork(UnitOfWorkProtocol):  # noqa: PLR0904
 
     @cached_property
     def active_users(self) -> repositories.UserRepository:
-        return repositories.UserRepository(user_type=UserType.ACTIVE)
+        return repositories.UserRepository(
+            user_type=UserType.ACTIVE, identity_map=self.identity_map
+        )
 
     @cached_property
     def agenda_items(self) -> AgendaItemRepository:
@@ -36,7 +49,9 @@ class UnitOfWork(UnitOfWorkProtocol):  # noqa: PLR0904
 
     @cached_property
     def anonymous_users(self) -> repositories.UserRepository:
-        return repositories.UserRepository(user_type=UserType.ANONYMOUS)
+        return repositories.UserRepository(
+            user_type=UserType.ANONYMOUS, identity_map=self.identity_map
+        )
 
     @cached_property
     def areas(self) -> repositories.AreaRepository:
@@ -44,7 +59,7 @@ class UnitOfWork(UnitOfWorkProtocol):  # noqa: PLR0904
 
     @cached_property
     def connected_users(self) -> repositories.ConnectedUserRepository:
-        return repositories.ConnectedUserRepository()
+        return repositories.ConnectedUserRepository(identity_map=self.identity_map)
 
     @cached_property
     def event_proposal_settings(self) -> repositories.EventProposalSettingsRepository:
@@ -117,3 +132,7 @@ class UnitOfWork(UnitOfWorkProtocol):  # noqa: PLR0904
     @cached_property
     def schedule_change_logs(self) -> ScheduleChangeLogRepository:
         return ScheduleChangeLogRepository()
+
+    @cached_property
+    def schedule_rows(self) -> ScheduleRowsRepository:
+        return ScheduleRowsRepository()
@@ -11,6 +11,7 @@ from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
 from pydantic import BaseModel
 
+from ludamus.links.outbound import get_outbound_http
 from ludamus.pacts.chronology import CheckOutcome, CheckResult, IntegrationKind
 
 if TYPE_CHECKING:
@@ -81,6 +82,7 @@ class GoogleDocsProposalImporter:
         session: AuthorizedSession = AuthorizedSession(
             credentials
         )  # type: ignore[no-untyped-call]
+        get_outbound_http().mount(session)
         sheet_outcome = self._probe(
             session, SHEETS_API_URL.format(sheet_id=config.sheet_id), "spreadsheet"
         )
@@ -93,7 +95,7 @@ class GoogleDocsProposalImporter:
     @staticmethod
     def _probe(session: AuthorizedSession, url: str, what: str) -> CheckResult:
         try:
-            response = session.get(url, timeout=10)
+            response = get_outbound_http().get(url, session=session)
         except (requests.RequestException, GoogleAuthError) as exc:
             return CheckResult(
                 outcome=CheckOutcome.AUTH_FAILED,
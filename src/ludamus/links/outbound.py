@@ -0,0 +1,218 @@
+"""Shared outbound HTTP layer for external integrations.
+
+One pooled ``requests`` adapter is shared by every integration so TCP/TLS
+connections are kept alive across requests. Each upstream host gets a
+concurrency limit, a circuit breaker and latency/error counters.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, replace
+from functools import cache
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+SERVER_ERROR = 500
+
+
+class CircuitOpenError(requests.RequestException):
+    """The host failed repeatedly; requests are rejected until it cools down."""
+
+
+class HostBusyError(requests.RequestException):
+    """Too many requests to the host are already in flight."""
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    failures: int = 0
+    rejected: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    circuit_open: bool = False
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.requests if self.requests else 0.0
+
+
+class _Host:
+    def __init__(self, name: str, max_concurrency: int) -> None:
+        self.name = name
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.stats = HostStats()
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+        self.trial_in_flight = False
+
+
+class OutboundHttp:
+    """Pooled HTTP client with per-host limits and circuit breakers.
+
+    A host's circuit opens after ``failure_threshold`` consecutive failures
+    (connection errors, timeouts or 5xx responses). While open, requests fail
+    immediately with ``CircuitOpenError``; after ``reset_timeout`` seconds a
+    single trial request is let through and its outcome closes or reopens
+    the circuit.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        connect_timeout: float,
+        read_timeout: float,
+        max_per_host: int,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_per_host = max_per_host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _Host] = {}
+        self.adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max_per_host)
+        self.session = requests.Session()
+        self.mount(self.session)
+
+    def mount(self, session: requests.Session) -> None:
+        """Route a (possibly authorized) session through the shared pool."""
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+
+    def get(
+        self, url: str, *, session: requests.Session | None = None, **kwargs: Any
+    ) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        host = self._host(urlsplit(url).netloc)
+        trial = self._admit(host)
+        if not host.slots.acquire(timeout=self.timeout[0]):
+            with host.lock:
+                host.stats.rejected += 1
+                if trial:
+                    host.trial_in_flight = False
+            msg = f"Too many concurrent requests to {host.name}"
+            raise HostBusyError(msg)
+
+        started = perf_counter()
+        try:
+            response = (session or self.session).get(url, **kwargs)
+        except requests.RequestException:
+            self._record(host, perf_counter() - started, failed=True)
+            raise
+        except BaseException:
+            # Not an upstream failure (e.g. a credential refresh error), but
+            # the trial slot must not stay taken
+            if trial:
+                with host.lock:
+                    host.trial_in_flight = False
+            raise
+        finally:
+            host.slots.release()
+        self._record(
+            host, perf_counter() - started, failed=response.status_code >= SERVER_ERROR
+        )
+        return response
+
+    def stats(self) -> dict[str, HostStats]:
+        """Snapshot of the per-host counters.
+
+        Returns:
+            Counters keyed by host (``netloc``).
+        """
+        with self._lock:
+            hosts = dict(self._hosts)
+        snapshot = {}
+        for name, host in hosts.items():
+            with host.lock:
+                snapshot[name] = replace(host.stats)
+        return snapshot
+
+    def reset(self) -> None:
+        """Forget all hosts, closing every circuit and zeroing counters."""
+        with self._lock:
+            self._hosts.clear()
+
+    def _host(self, name: str) -> _Host:
+        with self._lock:
+            if (host := self._hosts.get(name)) is None:
+                host = self._hosts[name] = _Host(name, self.max_per_host)
+            return host
+
+    def _admit(self, host: _Host) -> bool:
+        """Reject the request if the host's circuit is open.
+
+        Returns:
+            Whether the request is the half-open trial.
+
+        Raises:
+            CircuitOpenError: If the host is cooling down or its trial is
+                still in flight.
+        """
+        with host.lock:
+            if host.opened_at is None:
+                return False
+            cooling = self._clock() - host.opened_at < self.reset_timeout
+            if cooling or host.trial_in_flight:
+                host.stats.rejected += 1
+                msg = f"Circuit open for {host.name}"
+                raise CircuitOpenError(msg)
+            # Half-open: let a single trial request through
+            host.trial_in_flight = True
+            return True
+
+    def _record(self, host: _Host, seconds: float, *, failed: bool) -> None:
+        with host.lock:
+            stats = host.stats
+            stats.requests += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            host.trial_in_flight = False
+            if not failed:
+                host.consecutive_failures = 0
+                host.opened_at = None
+                stats.circuit_open = False
+                return
+            stats.failures += 1
+            host.consecutive_failures += 1
+            if host.consecutive_failures >= self.failure_threshold:
+                if host.opened_at is None:
+                    logger.warning(
+                        "Opening circuit for %s after %d consecutive failures",
+                        host.name,
+                        host.consecutive_failures,
+                    )
+                host.opened_at = self._clock()
+                stats.circuit_open = True
+
+
+@cache
+def get_outbound_http() -> OutboundHttp:
+    """Process-wide outbound HTTP client configured from settings.
+
+    Returns:
+        The shared client.
+    """
+    return OutboundHttp(
+        connect_timeout=settings.OUTBOUND_HTTP_CONNECT_TIMEOUT,
+        read_timeout=settings.OUTBOUND_HTTP_READ_TIMEOUT,
+        max_per_host=settings.OUTBOUND_HTTP_MAX_PER_HOST,
+        failure_threshold=settings.OUTBOUND_HTTP_FAILURE_THRESHOLD,
+        reset_timeout=settings.OUTBOUND_HTTP_RESET_TIMEOUT,
+    )
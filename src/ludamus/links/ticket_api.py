@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+from typing import TYPE_CHECKING
 
 import requests
 from django.conf import settings
 
-from ludamus.pacts import MembershipAPIError
+from ludamus.links.outbound import CircuitOpenError, HostBusyError, get_outbound_http
+from ludamus.pacts import MembershipAPIBusyError, MembershipAPIError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ludamus.pacts import CacheProtocol, TicketAPIProtocol
 
 logger = logging.getLogger(__name__)
 
+MEMBERSHIP_CACHE_PREFIX = "membership:count"
+_FAILED = "failed"
+
 
 class MembershipApiClient:
     """Client for external membership API integration."""
@@ -18,11 +30,12 @@ class MembershipApiClient:
     def __init__(self) -> None:
         self.base_url = settings.MEMBERSHIP_API_BASE_URL
         self.token = settings.MEMBERSHIP_API_TOKEN
-        self.timeout = settings.MEMBERSHIP_API_TIMEOUT
+        self.http = get_outbound_http()
+        self.timeout = (self.http.timeout[0], settings.MEMBERSHIP_API_TIMEOUT)
 
     def fetch_membership_count(self, email: str) -> int:
         try:
-            response = requests.get(
+            response = self.http.get(
                 self.base_url,
                 params={"email": email},
                 headers={"Authorization": f"Token {self.token}"},
@@ -36,6 +49,12 @@ class MembershipApiClient:
             logger.info(
                 "Fetched membership count %d for user %s", membership_count, email
             )
+        except HostBusyError as exception:
+            logger.warning("Membership API busy, skipped lookup for %s", email)
+            raise MembershipAPIBusyError from exception
+        except CircuitOpenError as exception:
+            logger.warning("Membership API unavailable, skipped lookup for %s", email)
+            raise MembershipAPIError from exception
         except requests.RequestException as exception:
             logger.exception("Failed to fetch membership for %s", email)
             raise MembershipAPIError from exception
@@ -44,3 +63,108 @@ class MembershipApiClient:
             raise MembershipAPIError from exception
 
         return membership_count
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = 0
+        self.error: BaseException | None = None
+
+
+class _SingleFlight:
+    """Collapse concurrent calls for the same key into one.
+
+    The first caller runs the lookup; callers arriving while it is in flight
+    wait for it and share its result (or its error).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], int]) -> int:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+# Shared by every request handled by this process
+_in_flight = _SingleFlight()
+
+
+class CachedMembershipApiClient:
+    """Membership lookups through the shared cache.
+
+    Counts are cached for ``MEMBERSHIP_API_CACHE_TIMEOUT`` seconds. Zero
+    counts and failed lookups are cached for the shorter
+    ``MEMBERSHIP_API_NEGATIVE_CACHE_TIMEOUT`` so that a user who just bought a
+    membership, or a recovering API, is picked up soon. Lookups refused
+    because this process already has too many requests in flight are not
+    cached. Concurrent lookups of
+    the same email within a process share a single API call.
+    """
+
+    def __init__(self, client: TicketAPIProtocol, cache: CacheProtocol) -> None:
+        self.client = client
+        self.cache = cache
+        self.timeout = settings.MEMBERSHIP_API_CACHE_TIMEOUT
+        self.negative_timeout = settings.MEMBERSHIP_API_NEGATIVE_CACHE_TIMEOUT
+
+    @staticmethod
+    def cache_key(email: str) -> str:
+        digest = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        return f"{MEMBERSHIP_CACHE_PREFIX}:{digest}"
+
+    def fetch_membership_count(self, email: str) -> int:
+        key = self.cache_key(email)
+        cached = self.cache.get(key)
+        if cached == _FAILED:
+            raise MembershipAPIError
+        if isinstance(cached, int):
+            return cached
+
+        return _in_flight.do(key, lambda: self._fetch_and_store(key, email))
+
+    def _fetch_and_store(self, key: str, email: str) -> int:
+        # Another process (or a just finished flight) may have filled the key
+        cached = self.cache.get(key)
+        if cached == _FAILED:
+            raise MembershipAPIError
+        if isinstance(cached, int):
+            return cached
+
+        try:
+            membership_count = self.client.fetch_membership_count(email)
+        except MembershipAPIBusyError:
+            # Local contention says nothing about the user or the API
+            raise
+        except MembershipAPIError:
+            self.cache.set(key, _FAILED, self.negative_timeout)
+            raise
+
+        self.cache.set(
+            key,
+            membership_count,
+            self.timeout if membership_count else self.negative_timeout,
+        )
+        return membership_count
@@ -5,9 +5,12 @@ field management) bounded contexts. Split per `plans/hex_refactor.md` if
 the file grows past ~12 top-level members or 1000 lines.
 """
 
+import hashlib
 import math
+from bisect import bisect_left
 from collections import defaultdict
-from datetime import date, datetime, timedelta, tzinfo
+from datetime import UTC, date, datetime, timedelta, tzinfo
+from itertools import starmap
 from typing import TYPE_CHECKING
 
 from pydantic import ValidationError
@@ -20,6 +23,9 @@ from ludamus.pacts import (
     SessionStatus,
 )
 from ludamus.pacts.chronology import (
+    CALENDAR_ENTRY_TIMEOUT,
+    CALENDAR_FEED_TIMEOUT,
+    SCHEDULE_SNAPSHOT_TIMEOUT,
     TIMETABLE_ROOM_PAGE_SIZE,
     TIMETABLE_SLOT_MINUTES,
     AreaGroupDTO,
@@ -45,6 +51,7 @@ from ludamus.pacts.chronology import (
     PersonalDataFieldFormContextDTO,
     PreferredSlotRangeDTO,
     PreferredSlotViolationDTO,
+    ScheduleSnapshot,
     SessionPlacement,
     SessionPositionDTO,
     SpaceColumnDTO,
@@ -55,9 +62,14 @@ from ludamus.pacts.chronology import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from ludamus.pacts import (
         AgendaItemDTO,
         AreaDTO,
+        CacheProtocol,
+        CalendarEntryDTO,
+        EventDTO,
         PersonalDataFieldCreateData,
         PersonalDataFieldDTO,
         PersonalDataFieldRepositoryProtocol,
@@ -65,6 +77,7 @@ if TYPE_CHECKING:
         ProposalCategoryRepositoryProtocol,
         SpaceDTO,
         TimeSlotDTO,
+        TrackAttributionDTO,
         UnitOfWorkProtocol,
     )
     from ludamus.pacts.multiverse import (
@@ -140,9 +153,152 @@ def _position_sessions(
     return positions
 
 
+def _overlapping_pairs(
+    items: Iterable[AgendaItemDTO],
+) -> Iterator[tuple[AgendaItemDTO, AgendaItemDTO]]:
+    # Sweep in start-time order keeping the items still running: each newcomer
+    # overlaps exactly the items left in the active set.
+    active: list[AgendaItemDTO] = []
+    for item in sorted(items, key=lambda it: (it.start_time, it.pk)):
+        active = [other for other in active if other.end_time > item.start_time]
+        for other in active:
+            if other.session_id != item.session_id:
+                yield other, item
+        active.append(item)
+
+
+def _overlap_partners[K](
+    groups: dict[K, list[AgendaItemDTO]],
+) -> dict[tuple[int, K], list[AgendaItemDTO]]:
+    # Partners of every session within each group, in agenda item pk order to
+    # match what the per-item overlap queries used to return.
+    partners: dict[tuple[int, K], list[AgendaItemDTO]] = defaultdict(list)
+    for key, items in groups.items():
+        for first, second in _overlapping_pairs(items):
+            partners[first.session_id, key].append(second)
+            partners[second.session_id, key].append(first)
+    for found in partners.values():
+        found.sort(key=lambda it: it.pk)
+    return partners
+
+
+def _heatmap_statuses(
+    slot_times: list[datetime],
+    spaces: list[SpaceDTO],
+    space_items: dict[int, list[AgendaItemDTO]],
+    conflict_session_pks: set[int],
+) -> list[list[HeatmapCellStatus]]:
+    # Dense slot x space status matrix filled item by item: each item covers
+    # the slots whose start lies in [start_time, end_time), found by bisecting
+    # the slot starts. Slots are searched by POSIX timestamp: datetimes that
+    # share a tzinfo compare by wall clock, and wall-clock steps across a DST
+    # change are not monotonic in time. Within a space the first listed item
+    # wins a cell, as the per-slot scan used to pick it.
+    instants = [slot_time.timestamp() for slot_time in slot_times]
+    slot_order = sorted(range(len(slot_times)), key=instants.__getitem__)
+    ordered_times = [instants[i] for i in slot_order]
+    statuses = [[HeatmapCellStatus.EMPTY] * len(spaces) for _ in slot_times]
+    for column, space in enumerate(spaces):
+        for item in space_items.get(space.pk, []):
+            status = (
+                HeatmapCellStatus.CONFLICT
+                if item.session_id in conflict_session_pks
+                else HeatmapCellStatus.SCHEDULED
+            )
+            first = bisect_left(ordered_times, item.start_time.timestamp())
+            last = bisect_left(ordered_times, item.end_time.timestamp(), lo=first)
+            for index in slot_order[first:last]:
+                row = statuses[index]
+                if row[column] == HeatmapCellStatus.EMPTY:
+                    row[column] = status
+    return statuses
+
+
+class ScheduleSnapshotService:
+    """Per-event schedule snapshots, cached under the event's page version.
+
+    Readers share one immutable snapshot per version. Every write the
+    snapshot is built from bumps the event's page version once its
+    transaction commits, so the next read rebuilds it. Without a cache every
+    instance builds its own snapshot once.
+    """
+
+    def __init__(
+        self, uow: UnitOfWorkProtocol, cache: CacheProtocol | None = None
+    ) -> None:
+        self._uow = uow
+        self._cache = cache
+        self._loaded: dict[int, ScheduleSnapshot] = {}
+
+    def get(self, event_pk: int) -> ScheduleSnapshot:
+        if (snapshot := self._loaded.get(event_pk)) is None:
+            snapshot = self._loaded[event_pk] = self._load(event_pk)
+        return snapshot
+
+    def forget(self, event_pk: int) -> None:
+        """Drop this instance's copy after it wrote to the event's schedule."""
+        self._loaded.pop(event_pk, None)
+
+    def _load(self, event_pk: int) -> ScheduleSnapshot:
+        if self._cache is None:
+            return self._build(event_pk, version="")
+        version = self._uow.events.read_version(event_pk)
+        snapshot_key = f"timetable:schedule:{event_pk}:{version}"
+        if isinstance(snapshot := self._cache.get(snapshot_key), ScheduleSnapshot):
+            return snapshot
+        snapshot = self._build(event_pk, version)
+        self._cache.set(snapshot_key, snapshot, SCHEDULE_SNAPSHOT_TIMEOUT)
+        return snapshot
+
+    def _build(self, event_pk: int, version: str) -> ScheduleSnapshot:
+        agenda_items = tuple(self._uow.agenda_items.list_by_event(event_pk))
+        session_pks = {item.session_id for item in agenda_items}
+        venues = tuple(self._uow.venues.list_by_event(event_pk))
+        facilitators = self._uow.sessions.read_facilitators_by_sessions(session_pks)
+        preferred = self._uow.sessions.read_preferred_time_slots_by_sessions(
+            session_pks
+        )
+        return ScheduleSnapshot(
+            event_pk=event_pk,
+            version=version,
+            spaces=tuple(self._uow.spaces.list_by_event(event_pk)),
+            venues=venues,
+            areas=tuple(
+                area
+                for venue in venues
+                for area in self._uow.areas.list_by_venue(venue.pk)
+            ),
+            time_slots=tuple(self._uow.time_slots.list_by_event(event_pk)),
+            agenda_items=agenda_items,
+            categories=tuple(self._uow.proposal_categories.list_by_event(event_pk)),
+            tracks=tuple(self._uow.tracks.list_by_event(event_pk)),
+            track_space_pks={
+                pk: frozenset(space_pks)
+                for pk, space_pks in self._uow.tracks.read_space_pks_by_event(
+                    event_pk
+                ).items()
+            },
+            track_session_pks={
+                pk: frozenset(session_pks)
+                for pk, session_pks in self._uow.tracks.read_session_pks_by_event(
+                    event_pk
+                ).items()
+            },
+            facilitators_by_session={
+                pk: tuple(found) for pk, found in facilitators.items()
+            },
+            preferred_slots_by_session={
+                pk: tuple(slots) for pk, slots in preferred.items()
+            },
+        )
+
+
 class TimetableService:
-    def __init__(self, uow: UnitOfWorkProtocol) -> None:
+    def __init__(
+        self, uow: UnitOfWorkProtocol, snapshots: ScheduleSnapshotService | None = None
+    ) -> None:
         self._uow = uow
+        self._snapshots = snapshots or ScheduleSnapshotService(uow)
 
     def build_grid(
         self,
@@ -152,10 +308,8 @@ class TimetableService:
         space_page: int = 1,
         selected_date: date | None = None,
     ) -> TimetableGridDTO:
-        all_spaces = self._uow.spaces.list_by_event(event_pk)
-        if track_pk is not None:
-            track_space_pks = set(self._uow.tracks.list_space_pks(track_pk))
-            all_spaces = [s for s in all_spaces if s.pk in track_space_pks]
+        snapshot = self._snapshots.get(event_pk)
+        all_spaces = snapshot.list_spaces(track_pk)
 
         total_spaces = len(all_spaces)
         total_pages = max(1, math.ceil(total_spaces / TIMETABLE_ROOM_PAGE_SIZE))
@@ -163,14 +317,13 @@ class TimetableService:
         start = (space_page - 1) * TIMETABLE_ROOM_PAGE_SIZE
         spaces = all_spaces[start : start + TIMETABLE_ROOM_PAGE_SIZE]
 
-        all_slots = self._uow.time_slots.list_by_event(event_pk)
-        windows_by_date = _slot_windows_by_local_date(all_slots, tz)
+        windows_by_date = _slot_windows_by_local_date(list(snapshot.time_slots), tz)
         available_dates = sorted(windows_by_date.keys())
 
         if selected_date is None or selected_date not in windows_by_date:
             selected_date = available_dates[0] if available_dates else None
 
-        venue_groups = self._build_venue_groups(event_pk, spaces)
+        venue_groups = self._build_venue_groups(snapshot, spaces)
 
         if selected_date is None:
             return TimetableGridDTO(
@@ -209,14 +362,9 @@ class TimetableService:
             for i in range(num_slots + 1)
         ]
 
-        all_items = (
-            self._uow.agenda_items.list_by_track(track_pk)
-            if track_pk is not None
-            else self._uow.agenda_items.list_by_event(event_pk)
-        )
         space_pk_set = {s.pk for s in spaces}
         space_items: dict[int, list[AgendaItemDTO]] = defaultdict(list)
-        for item in all_items:
+        for item in snapshot.list_items(track_pk):
             if (
                 item.space_id in space_pk_set
                 and item.start_time < grid_end
@@ -252,18 +400,15 @@ class TimetableService:
             selected_date=selected_date,
         )
 
+    @staticmethod
     def _build_venue_groups(
-        self, event_pk: int, spaces: list[SpaceDTO]
+        snapshot: ScheduleSnapshot, spaces: list[SpaceDTO]
     ) -> list[VenueGroupDTO]:
         if not (area_ids := [s.area_id for s in spaces if s.area_id is not None]):
             return []
 
-        venues_by_pk = {v.pk: v for v in self._uow.venues.list_by_event(event_pk)}
-        areas_by_pk: dict[int, AreaDTO] = {
-            area.pk: area
-            for venue_pk in venues_by_pk
-            for area in self._uow.areas.list_by_venue(venue_pk)
-        }
+        venues_by_pk = {v.pk: v for v in snapshot.venues}
+        areas_by_pk: dict[int, AreaDTO] = {area.pk: area for area in snapshot.areas}
 
         venue_groups: list[VenueGroupDTO] = []
         for area_id in area_ids:
@@ -340,6 +485,7 @@ class TimetableService:
             "new_end_time": placement.end_time,
         }
         self._uow.schedule_change_logs.create(log_data)
+        self._snapshots.forget(event_pk)
 
     def unassign_session(
         self, session_pk: int, event_pk: int, user_pk: int | None = None
@@ -360,6 +506,7 @@ class TimetableService:
             "old_end_time": agenda_item.end_time,
         }
         self._uow.schedule_change_logs.create(log_data)
+        self._snapshots.forget(event_pk)
 
     def revert_change(
         self, log_pk: int, event_pk: int, user_pk: int | None = None
@@ -417,11 +564,18 @@ class TimetableService:
             revert_log["new_start_time"] = log.old_start_time
             revert_log["new_end_time"] = log.old_end_time
         self._uow.schedule_change_logs.create(revert_log)
+        self._snapshots.forget(event_pk)
 
 
 class ConflictDetectionService:
-    def __init__(self, uow: UnitOfWorkProtocol) -> None:
+    def __init__(
+        self, uow: UnitOfWorkProtocol, snapshots: ScheduleSnapshotService | None = None
+    ) -> None:
         self._uow = uow
+        self._snapshots = snapshots or ScheduleSnapshotService(uow)
+        # session pk -> its tracks with manager names, filled in bulk and
+        # shared by conflict and slot violation attribution.
+        self._attributions: dict[int, list[TrackAttributionDTO]] = {}
 
     def detect_for_assignment(
         self, session_pk: int, placement: SessionPlacement
@@ -488,82 +642,137 @@ class ConflictDetectionService:
     def list_all_for_track(
         self, event_pk: int, track_pk: int | None
     ) -> list[ConflictDTO]:
-        scheduled = (
-            self._uow.agenda_items.list_by_event(event_pk)
-            if track_pk is None
-            else self._uow.agenda_items.list_by_track(track_pk)
-        )
+        # Bulk counterpart of calling `detect_for_assignment` per scheduled
+        # item: overlaps are found in memory over the event's schedule snapshot,
+        # so the query count no longer grows with the number of agenda items.
+        snapshot = self._snapshots.get(event_pk)
+        event_items = snapshot.list_items()
+        scheduled = event_items if track_pk is None else snapshot.list_items(track_pk)
+        if not scheduled:
+            return []
+
+        facilitators_by_session = snapshot.facilitators_by_session
+        items_by_space: dict[int, list[AgendaItemDTO]] = defaultdict(list)
+        items_by_facilitator: dict[int, list[AgendaItemDTO]] = defaultdict(list)
+        for item in event_items:
+            items_by_space[item.space_id].append(item)
+            for facilitator in facilitators_by_session.get(item.session_id, ()):
+                items_by_facilitator[facilitator.pk].append(item)
+        space_partners = _overlap_partners(items_by_space)
+        facilitator_partners = _overlap_partners(items_by_facilitator)
 
         all_conflicts: list[ConflictDTO] = []
         seen: set[tuple[int, int]] = set()
         for item in scheduled:
-            conflicts = self.detect_for_assignment(
-                session_pk=item.session_id,
-                placement=SessionPlacement(
-                    space_pk=item.space_id,
-                    start_time=item.start_time,
-                    end_time=item.end_time,
-                ),
-            )
+            conflicts = [
+                ConflictDTO(
+                    type=ConflictType.SPACE_OVERLAP,
+                    severity=ConflictSeverity.ERROR,
+                    session_title=other.session_title,
+                    session_pk=other.session_id,
+                )
+                for other in space_partners.get((item.session_id, item.space_id), [])
+            ]
+            if (
+                item.space_capacity is not None
+                and item.space_capacity < item.session_participants_limit
+            ):
+                conflicts.append(
+                    ConflictDTO(
+                        type=ConflictType.CAPACITY_EXCEEDED,
+                        severity=ConflictSeverity.WARNING,
+                        session_title=item.session_title,
+                        session_pk=item.session_id,
+                        space_capacity=item.space_capacity,
+                        session_limit=item.session_participants_limit,
+                    )
+                )
+            for facilitator in facilitators_by_session.get(item.session_id, ()):
+                conflicts.extend(
+                    ConflictDTO(
+                        type=ConflictType.FACILITATOR_OVERLAP,
+                        severity=ConflictSeverity.ERROR,
+                        session_title=other.session_title,
+                        session_pk=other.session_id,
+                        facilitator_name=facilitator.display_name,
+                    )
+                    for other in facilitator_partners.get(
+                        (item.session_id, facilitator.pk), []
+                    )
+                )
             for conflict in conflicts:
                 key = (item.session_id, conflict.session_pk)
                 reverse_key = (conflict.session_pk, item.session_id)
                 if key not in seen and reverse_key not in seen:
                     seen.add(key)
-                    all_conflicts.append(
-                        self._add_track_attribution(conflict, track_pk)
-                    )
+                    all_conflicts.append(conflict)
+
+        self._load_attributions(
+            c.session_pk
+            for c in all_conflicts
+            if c.type == ConflictType.FACILITATOR_OVERLAP
+        )
+        return [self._add_track_attribution(c, track_pk) for c in all_conflicts]
 
-        return all_conflicts
+    def _load_attributions(self, session_pks: Iterable[int]) -> None:
+        if missing := set(session_pks) - self._attributions.keys():
+            loaded = self._uow.tracks.read_attributions_by_sessions(missing)
+            for session_pk in missing:
+                self._attributions[session_pk] = loaded.get(session_pk, [])
+
+    def _attribution(
+        self, session_pk: int, current_track_pk: int | None
+    ) -> TrackAttributionDTO | None:
+        return next(
+            (
+                attribution
+                for attribution in self._attributions.get(session_pk, ())
+                if attribution.track_pk != current_track_pk
+            ),
+            None,
+        )
 
     def _add_track_attribution(
         self, conflict: ConflictDTO, current_track_pk: int | None
     ) -> ConflictDTO:
         if conflict.type != ConflictType.FACILITATOR_OVERLAP:
             return conflict
-        other_tracks = self._uow.tracks.list_by_session(conflict.session_pk)
-        if current_track_pk is not None:
-            other_tracks = [t for t in other_tracks if t.pk != current_track_pk]
-        if not other_tracks:
+        attribution = self._attribution(conflict.session_pk, current_track_pk)
+        if attribution is None:
             return conflict
-        track = other_tracks[0]
         return ConflictDTO(
             type=conflict.type,
             severity=conflict.severity,
             session_title=conflict.session_title,
             session_pk=conflict.session_pk,
             facilitator_name=conflict.facilitator_name,
-            track_name=track.name,
-            manager_names=self._uow.tracks.list_manager_names(track.pk),
+            track_name=attribution.track_name,
+            manager_names=attribution.manager_names,
         )
 
     def list_preferred_slot_violations(
         self, event_pk: int, track_pk: int | None
     ) -> list[PreferredSlotViolationDTO]:
-        scheduled = (
-            self._uow.agenda_items.list_by_event(event_pk)
-            if track_pk is None
-            else self._uow.agenda_items.list_by_track(track_pk)
-        )
-        if not scheduled:
+        snapshot = self._snapshots.get(event_pk)
+        if not (scheduled := snapshot.list_items(track_pk)):
             return []
 
-        preferred_by_session = self._uow.sessions.read_preferred_time_slots_by_sessions(
-            {item.session_id for item in scheduled}
-        )
+        preferred_by_session = snapshot.preferred_slots_by_session
 
-        violations: list[PreferredSlotViolationDTO] = []
-        for item in scheduled:
-            if not (preferred := preferred_by_session.get(item.session_id, [])):
-                continue
-            if any(
+        violating = [
+            (item, preferred)
+            for item in scheduled
+            if (preferred := preferred_by_session.get(item.session_id, ()))
+            and not any(
                 slot.start_time <= item.start_time and slot.end_time >= item.end_time
                 for slot in preferred
-            ):
-                continue
-            track_name, manager_names = self._slot_violation_track_attribution(
-                item.session_id, track_pk
             )
+        ]
+        self._load_attributions(item.session_id for item, _ in violating)
+
+        violations: list[PreferredSlotViolationDTO] = []
+        for item, preferred in violating:
+            attribution = self._attribution(item.session_id, track_pk)
             violations.append(
                 PreferredSlotViolationDTO(
                     session_pk=item.session_id,
@@ -576,39 +785,32 @@ class ConflictDetectionService:
                         )
                         for slot in preferred
                     ],
-                    track_name=track_name,
-                    manager_names=manager_names,
+                    track_name=attribution.track_name if attribution else None,
+                    manager_names=attribution.manager_names if attribution else [],
                 )
             )
 
         return violations
 
-    def _slot_violation_track_attribution(
-        self, session_pk: int, current_track_pk: int | None
-    ) -> tuple[str | None, list[str]]:
-        tracks = self._uow.tracks.list_by_session(session_pk)
-        if current_track_pk is not None:
-            tracks = [t for t in tracks if t.pk != current_track_pk]
-        if not tracks:
-            return None, []
-        track = tracks[0]
-        return track.name, self._uow.tracks.list_manager_names(track.pk)
-
 
 class TimetableOverviewService:
-    def __init__(self, uow: UnitOfWorkProtocol) -> None:
+    def __init__(
+        self, uow: UnitOfWorkProtocol, snapshots: ScheduleSnapshotService | None = None
+    ) -> None:
         self._uow = uow
+        self._snapshots = snapshots or ScheduleSnapshotService(uow)
 
     def get_all_conflicts(self, event_pk: int) -> list[ConflictDTO]:
-        return ConflictDetectionService(self._uow).list_all_for_track(
+        return ConflictDetectionService(self._uow, self._snapshots).list_all_for_track(
             event_pk, track_pk=None
         )
 
     def build_heatmap(
         self, event_pk: int, tz: tzinfo, conflicts: list[ConflictDTO] | None = None
     ) -> HeatmapDTO:
-        spaces = self._uow.spaces.list_by_event(event_pk)
-        all_items = self._uow.agenda_items.list_by_event(event_pk)
+        snapshot = self._snapshots.get(event_pk)
+        spaces = snapshot.list_spaces()
+        all_items = snapshot.list_items()
         if conflicts is None:
             conflicts = self.get_all_conflicts(event_pk)
         conflict_session_pks = {c.session_pk for c in conflicts}
@@ -619,9 +821,7 @@ class TimetableOverviewService:
             if item.space_id in space_pk_set:
                 space_items[item.space_id].append(item)
 
-        windows_by_date = _slot_windows_by_local_date(
-            self._uow.time_slots.list_by_event(event_pk), tz
-        )
+        windows_by_date = _slot_windows_by_local_date(list(snapshot.time_slots), tz)
 
         slot_delta = timedelta(minutes=TIMETABLE_SLOT_MINUTES)
         days: list[HeatmapDayDTO] = []
@@ -640,27 +840,20 @@ class TimetableOverviewService:
             num_slots = int(
                 (day_end - day_start).total_seconds() / 60 / TIMETABLE_SLOT_MINUTES
             )
-            day_rows: list[HeatmapRowDTO] = []
-            for i in range(num_slots):
-                slot_time = day_start + slot_delta * i
-                cells = []
-                for space in spaces:
-                    overlapping = next(
-                        (
-                            it
-                            for it in space_items.get(space.pk, [])
-                            if it.start_time <= slot_time < it.end_time
-                        ),
-                        None,
-                    )
-                    if overlapping is None:
-                        status = HeatmapCellStatus.EMPTY
-                    elif overlapping.session_id in conflict_session_pks:
-                        status = HeatmapCellStatus.CONFLICT
-                    else:
-                        status = HeatmapCellStatus.SCHEDULED
-                    cells.append(HeatmapCellDTO(space_pk=space.pk, status=status))
-                day_rows.append(HeatmapRowDTO(time=slot_time, cells=cells))
+            slot_times = [day_start + slot_delta * i for i in range(num_slots)]
+            statuses = _heatmap_statuses(
+                slot_times, spaces, space_items, conflict_session_pks
+            )
+            day_rows = [
+                HeatmapRowDTO(
+                    time=slot_time,
+                    cells=[
+                        HeatmapCellDTO(space_pk=space.pk, status=status)
+                        for space, status in zip(spaces, row, strict=True)
+                    ],
+                )
+                for slot_time, row in zip(slot_times, statuses, strict=True)
+            ]
 
             days.append(HeatmapDayDTO(date=day_date, rows=day_rows))
             all_rows.extend(day_rows)
@@ -681,28 +874,21 @@ class TimetableOverviewService:
 
     def track_progress(self, event_pk: int) -> list[TrackProgressDTO]:
         tracks = self._uow.tracks.list_by_event(event_pk)
+        counts = self._uow.tracks.get_progress_counts(event_pk)
+        manager_names = self._uow.tracks.read_manager_names_by_event(event_pk)
         result = []
         for track in tracks:
-            sessions = self._uow.sessions.list_sessions_by_event(
-                event_pk, track_pk=track.pk
-            )
-            accepted = [
-                s
-                for s in sessions
-                if s.status in {SessionStatus.PENDING, SessionStatus.SCHEDULED}
-            ]
-            scheduled = [s for s in sessions if s.status == SessionStatus.SCHEDULED]
-            accepted_count = len(accepted)
-            scheduled_count = len(scheduled)
+            track_counts = counts.get(track.pk, {})
+            accepted_count = track_counts.get("accepted", 0)
+            scheduled_count = track_counts.get("scheduled", 0)
             progress_pct = (
                 round(scheduled_count * 100 / accepted_count) if accepted_count else 0
             )
-            manager_names = self._uow.tracks.list_manager_names(track.pk)
             result.append(
                 TrackProgressDTO(
                     track_pk=track.pk,
                     track_name=track.name,
-                    manager_names=manager_names,
+                    manager_names=manager_names.get(track.pk, []),
                     accepted_count=accepted_count,
                     scheduled_count=scheduled_count,
                     progress_pct=progress_pct,
@@ -711,6 +897,150 @@ class TimetableOverviewService:
         return result
 
 
+_ICS_LINE_OCTETS = 75
+
+
+def _ics_time(value: datetime) -> str:
+    return value.astimezone(UTC).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _ics_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _ics_line(name: str, value: str) -> str:
+    # Lines over 75 octets continue on lines starting with a space, which
+    # counts towards the limit; UTF-8 sequences are never split.
+    parts: list[str] = []
+    current, size = "", 0
+    for char in f"{name}:{value}":
+        width = len(char.encode())
+        if size + width > _ICS_LINE_OCTETS - bool(parts):
+            parts.append(current)
+            current, size = "", 0
+        current += char
+        size += width
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def render_calendar_entry(entry: CalendarEntryDTO, url: str) -> str:
+    """Render one agenda entry as a VEVENT block.
+
+    Returns:
+        The block, each content line folded and ended with CRLF.
+    """
+    description = "\n\n".join(
+        part for part in (entry.host_name, entry.description) if part
+    )
+    lines = [
+        ("BEGIN", "VEVENT"),
+        ("UID", f"session-{entry.session_pk}@ludamus"),
+        ("DTSTAMP", _ics_time(entry.modification_time)),
+        ("DTSTART", _ics_time(entry.start_time)),
+        ("DTEND", _ics_time(entry.end_time)),
+        ("SUMMARY", _ics_text(entry.title)),
+        ("LOCATION", _ics_text(entry.location)),
+        ("DESCRIPTION", _ics_text(description)),
+        ("URL", f"{url}#session-{entry.session_pk}"),
+        ("END", "VEVENT"),
+    ]
+    return "".join(starmap(_ics_line, lines))
+
+
+def stream_calendar(name: str, entries: Iterable[str]) -> Iterator[str]:
+    """Wrap rendered VEVENT blocks into a VCALENDAR, one chunk at a time.
+
+    Yields:
+        The calendar header, every entry and the closing line.
+    """
+    yield "".join(
+        (
+            _ics_line("BEGIN", "VCALENDAR"),
+            _ics_line("VERSION", "2.0"),
+            _ics_line("PRODID", "-//Ludamus//Chronology//EN"),
+            _ics_line("CALSCALE", "GREGORIAN"),
+            _ics_line("METHOD", "PUBLISH"),
+            _ics_line("X-WR-CALNAME", _ics_text(name)),
+        )
+    )
+    yield from entries
+    yield _ics_line("END", "VCALENDAR")
+
+
+class EventCalendarService:
+    """iCalendar feeds of an event's agenda, whole or per participant.
+
+    A rendered feed is cached under the event version it was built from, so
+    polling an unchanged event costs one cache read. VEVENT blocks are cached
+    per agenda entry under a digest of what they show; rebuilding a feed
+    after a change renders only the entries that changed and reads the rest
+    with one ``get_many``. A rebuilt feed is streamed as it renders and
+    cached once the last chunk is out.
+    """
+
+    def __init__(self, uow: UnitOfWorkProtocol, cache: CacheProtocol) -> None:
+        self._uow = uow
+        self._cache = cache
+
+    def feed(
+        self, event: EventDTO, version: str, url: str, participant_id: int | None = None
+    ) -> Iterator[str]:
+        """Return the event's calendar as a stream of text chunks.
+
+        ``url`` is the event page the entries link back to. With
+        ``participant_id`` the feed only lists that user's enrollments.
+
+        Returns:
+            An iterator over the calendar text.
+        """
+        scope = "all" if participant_id is None else f"user-{participant_id}"
+        feed_key = f"calendar:feed:{event.pk}:{scope}:{version}"
+        if isinstance(feed := self._cache.get(feed_key), str):
+            return iter((feed,))
+        entries = self._uow.agenda_items.list_calendar_entries(event.pk, participant_id)
+        return self._stream_and_store(
+            feed_key, stream_calendar(event.name, self._render_entries(entries, url))
+        )
+
+    def _stream_and_store(self, feed_key: str, chunks: Iterable[str]) -> Iterator[str]:
+        sent: list[str] = []
+        for chunk in chunks:
+            sent.append(chunk)
+            yield chunk
+        self._cache.set(feed_key, "".join(sent), CALENDAR_FEED_TIMEOUT)
+
+    def _render_entries(
+        self, entries: list[CalendarEntryDTO], url: str
+    ) -> Iterator[str]:
+        keys = [_calendar_entry_key(entry, url) for entry in entries]
+        cached = self._cache.get_many(keys)
+        rendered: dict[str, object] = {}
+        for key, entry in zip(keys, entries, strict=True):
+            if not isinstance(block := cached.get(key), str):
+                block = rendered[key] = render_calendar_entry(entry, url)
+            yield block
+        self._cache.set_many(rendered, CALENDAR_ENTRY_TIMEOUT)
+
+
+def _calendar_entry_key(entry: CalendarEntryDTO, url: str) -> str:
+    # Session edits move modification_time; the placement and room names live
+    # outside the session row, so they are part of the digest too.
+    key = (
+        f"{url}\0{entry.modification_time.isoformat()}\0"
+        f"{entry.start_time.isoformat()}\0{entry.end_time.isoformat()}\0"
+        f"{entry.location}"
+    )
+    digest = hashlib.blake2b(key.encode(), digest_size=12).hexdigest()
+    return f"calendar:vevent:{entry.session_pk}:{digest}"
+
+
 class CFPPersonalDataFieldService:
     """Backoffice operations for an event's personal-data fields."""
 
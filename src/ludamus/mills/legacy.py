@@ -1,6 +1,7 @@
 import re
 import string
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from secrets import choice as _secret_choice
 from secrets import token_urlsafe
@@ -19,6 +20,7 @@ from ludamus.pacts import (
     EncounterDTO,
     EncounterIndexItem,
     EncounterIndexResult,
+    EncounterSummaryDTO,
     EnrollmentConfigDTO,
     EnrollmentConfigRepositoryProtocol,
     EventDTO,
@@ -28,6 +30,7 @@ from ludamus.pacts import (
     FacilitatorMergeError,
     HostPersonalDataEntry,
     MembershipAPIError,
+    MembershipPrewarmResult,
     NotFoundError,
     PanelStatsDTO,
     PersonalFieldRequirementDTO,
@@ -198,59 +201,37 @@ class EncounterService:
             user_has_rsvpd=user_has_rsvpd,
         )
 
-    def _resolve_creator_name(self, creator_id: int) -> str:
-        try:
-            user = self._uow.active_users.read_by_id(creator_id)
-        except NotFoundError:
-            return ""
-        return user.full_name or user.name or user.username
-
-    def build_index(self, sphere_id: int, user_id: int) -> EncounterIndexResult:
-        my_upcoming = self._uow.encounters.list_upcoming_by_creator(sphere_id, user_id)
-        rsvpd = self._uow.encounters.list_upcoming_rsvpd(sphere_id, user_id)
-        my_ids = {e.pk for e in my_upcoming}
+    @staticmethod
+    def _index_item(summary: EncounterSummaryDTO, user_id: int) -> EncounterIndexItem:
+        is_mine = summary.encounter.creator_id == user_id
+        return EncounterIndexItem(
+            encounter=summary.encounter,
+            rsvp_count=summary.rsvp_count,
+            is_mine=is_mine,
+            organizer_name="" if is_mine else summary.creator_name,
+        )
 
+    def build_index(
+        self, sphere_id: int, user_id: int, *, past_before: int | None = None
+    ) -> EncounterIndexResult:
         upcoming = [
-            EncounterIndexItem(
-                encounter=e,
-                rsvp_count=self._uow.encounter_rsvps.count_by_encounter(e.pk),
-                is_mine=True,
-                organizer_name="",
+            self._index_item(summary, user_id)
+            for summary in self._uow.encounters.list_upcoming_summaries(
+                sphere_id, user_id
             )
-            for e in my_upcoming
         ]
-        upcoming.extend(
-            EncounterIndexItem(
-                encounter=e,
-                rsvp_count=self._uow.encounter_rsvps.count_by_encounter(e.pk),
-                is_mine=False,
-                organizer_name=self._resolve_creator_name(e.creator_id),
-            )
-            for e in rsvpd
-            if e.pk not in my_ids
+        past, has_more_past = self._uow.encounters.list_past_summaries(
+            sphere_id, user_id, before_pk=past_before
+        )
+        return EncounterIndexResult(
+            upcoming=upcoming,
+            past=[self._index_item(summary, user_id) for summary in past],
+            past_next_before=past[-1].encounter.pk if has_more_past else None,
         )
-        upcoming.sort(key=lambda x: x.encounter.start_time)
-
-        past_dtos = self._uow.encounters.list_past(sphere_id, user_id)
-        past = [
-            EncounterIndexItem(
-                encounter=e,
-                rsvp_count=self._uow.encounter_rsvps.count_by_encounter(e.pk),
-                is_mine=e.creator_id == user_id,
-                organizer_name=(
-                    ""
-                    if e.creator_id == user_id
-                    else self._resolve_creator_name(e.creator_id)
-                ),
-            )
-            for e in past_dtos
-        ]
-
-        return EncounterIndexResult(upcoming=upcoming, past=past)
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
 
 
 def is_proposal_active(event: EventDTO) -> bool:
@@ -286,13 +267,15 @@ class ProposeSessionService:
         self._context = context
 
     @staticmethod
-    def _generate_unique_slug(title: str, exists: Callable[[str], bool]) -> str:
+    def _generate_unique_slug(title: str, read_taken: Callable[[str], set[str]]) -> str:
         value = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode()
         base_slug = re.sub(r"[^\w\s-]", "", value.lower())
         base_slug = re.sub(r"[-\s]+", "-", base_slug).strip("-")
+        # One read covers the base slug and every "<base>-<suffix>" candidate
+        taken = read_taken(base_slug)
         slug = base_slug
         for _ in range(4):
-            if not exists(slug):
+            if slug not in taken:
                 break
             slug = f"{base_slug}-{token_urlsafe(3)}"
         return slug
@@ -354,7 +337,8 @@ class ProposeSessionService:
         # Anonymous submissions are never merged: each submit creates a fresh
         # Facilitator row. Organizers reconcile later if needed.
         slug = self._generate_unique_slug(
-            display_name, lambda s: self._uow.facilitators.slug_exists(event.pk, s)
+            display_name,
+            lambda base: self._uow.facilitators.read_taken_slugs(event.pk, base),
         )
         return self._uow.facilitators.create(
             FacilitatorData(
@@ -387,7 +371,8 @@ class ProposeSessionService:
 
         display_name = str(session_data.get("display_name", default_display_name))
         slug = self._generate_unique_slug(
-            title, lambda s: self._uow.sessions.slug_exists(event.sphere_id, s)
+            title,
+            lambda base: self._uow.sessions.read_taken_slugs(event.sphere_id, base),
         )
 
         with self._uow.atomic():
@@ -431,6 +416,7 @@ class ProposeSessionService:
         self, session_id: int, event_id: int, session_data: object
     ) -> None:
         data = session_data if isinstance(session_data, dict) else {}  # type: ignore [misc]
+        field_pks = self._uow.session_fields.read_pks_by_slug(event_id)
         values: list[SessionFieldValueData] = []
         for key, value in data.items():
             if not isinstance(key, str) or not key.startswith("session_"):
@@ -438,13 +424,11 @@ class ProposeSessionService:
             slug = key.removeprefix("session_")
             if slug.endswith("_custom"):
                 continue
-            try:
-                field_dto = self._uow.session_fields.read_by_slug(event_id, slug)
-            except NotFoundError:
+            if (field_id := field_pks.get(slug)) is None:
                 continue
             values.append(
                 SessionFieldValueData(
-                    session_id=session_id, field_id=field_dto.pk, value=value
+                    session_id=session_id, field_id=field_id, value=value
                 )
             )
         if values:
@@ -453,6 +437,7 @@ class ProposeSessionService:
     def _save_personal_data(
         self, event_id: int, personal_data: dict[str, str], facilitator: FacilitatorDTO
     ) -> None:
+        field_pks = self._uow.personal_data_fields.read_pks_by_slug(event_id)
         entries: list[HostPersonalDataEntry] = []
         for key, value in personal_data.items():
             if not key.startswith("personal_"):
@@ -460,15 +445,13 @@ class ProposeSessionService:
             slug = key.removeprefix("personal_")
             if slug.endswith("_custom"):
                 continue
-            try:
-                field_dto = self._uow.personal_data_fields.read_by_slug(event_id, slug)
-            except NotFoundError:
+            if (field_id := field_pks.get(slug)) is None:
                 continue
             entries.append(
                 HostPersonalDataEntry(
                     facilitator_id=facilitator.pk,
                     event_id=event_id,
-                    field_id=field_dto.pk,
+                    field_id=field_id,
                     value=value,
                 )
             )
@@ -479,14 +462,15 @@ class ProposeSessionService:
 def check_proposal_rate_limit(cache: CacheProtocol, ip: str, event_id: int) -> bool:
     """Check if an IP is rate-limited for proposal submission on an event.
 
+    Each IP holds a single token per event. The first submission takes it
+    with an atomic increment, and the key expiring refills it, so
+    concurrent submissions cannot both pass.
+
     Returns:
         True if the submission is allowed, False if rate-limited.
     """
     key = f"proposal_rate:{event_id}:{ip}"
-    if cache.get(key) is not None:
-        return False
-    cache.set(key, 1, timeout=PROPOSAL_RATE_LIMIT_SECONDS)
-    return True
+    return cache.incr(key, timeout=PROPOSAL_RATE_LIMIT_SECONDS) == 1
 
 
 class AnonymousEnrollmentService:
@@ -664,7 +648,7 @@ class PanelService:
             total_sessions=total_sessions,
             scheduled_sessions=stats_data.scheduled_sessions,
             pending_proposals=stats_data.pending_proposals,
-            hosts_count=len(stats_data.unique_host_ids),
+            hosts_count=stats_data.hosts_count,
             rooms_count=stats_data.rooms_count,
             total_proposals=stats_data.total_proposals,
         )
@@ -838,28 +822,127 @@ def get_user_enrollment_config(
     )
 
 
+def _fetch_membership_counts(
+    ticket_api: TicketAPIProtocol, user_emails: list[str], workers: int
+) -> tuple[dict[str, int], list[str]]:
+    def fetch(email: str) -> int | None:
+        try:
+            return ticket_api.fetch_membership_count(email)
+        except MembershipAPIError:
+            return None
+
+    counts: dict[str, int] = {}
+    failed: list[str] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for email, count in zip(
+            user_emails, executor.map(fetch, user_emails), strict=True
+        ):
+            if count is None:
+                failed.append(email)
+            else:
+                counts[email] = count
+    return counts, failed
+
+
+def prewarm_user_enrollment_configs(
+    *,
+    enrollment_configs: list[EnrollmentConfigDTO],
+    user_emails: Iterable[str],
+    ticket_api: TicketAPIProtocol,
+    enrollment_config_repo: EnrollmentConfigRepositoryProtocol,
+    workers: int = 8,
+) -> MembershipPrewarmResult:
+    """Create the API-backed user configs for many emails ahead of enrollment.
+
+    Each email is looked up once no matter how many configs it is missing
+    from, the lookups run concurrently, and the new rows are written with one
+    bulk insert per config.
+
+    Returns:
+        How many configs were created, already existed, and which emails
+        could not be looked up.
+    """
+    emails = list(dict.fromkeys(e.strip() for e in user_emails if e.strip()))
+    existing = {
+        config.pk: enrollment_config_repo.read_user_configs(config, emails)
+        for config in enrollment_configs
+    }
+    missing = [
+        email
+        for email in emails
+        if any(email not in existing[config.pk] for config in enrollment_configs)
+    ]
+    counts, failed = _fetch_membership_counts(ticket_api, missing, workers)
+
+    now = datetime.now(tz=UTC)
+    created = 0
+    for config in enrollment_configs:
+        new_configs = [
+            UserEnrollmentConfigData(
+                enrollment_config_id=config.pk,
+                user_email=email,
+                allowed_slots=counts[email],
+                fetched_from_api=True,
+                last_check=now,
+            )
+            for email in missing
+            if email in counts and email not in existing[config.pk]
+        ]
+        enrollment_config_repo.create_user_configs(new_configs)
+        created += len(new_configs)
+
+    return MembershipPrewarmResult(
+        created=created,
+        existing=sum(len(configs) for configs in existing.values()),
+        failed_emails=failed,
+    )
+
+
 class FacilitatorMergeService:
     def __init__(self, uow: UnitOfWorkProtocol) -> None:
         self._uow = uow
 
     def merge(self, target_id: int, source_ids: list[int]) -> None:
-        if not source_ids:
-            msg = "At least one source facilitator is required"
-            raise FacilitatorMergeError(msg)
-        if target_id in source_ids:
-            msg = "Target cannot be among source facilitators"
-            raise FacilitatorMergeError(msg)
-
-        all_ids = [target_id, *source_ids]
-        linked_count = sum(
-            1 for fid in all_ids if self._uow.facilitators.read(fid).user_id is not None
-        )
-        if linked_count > 1:
-            msg = "Cannot merge facilitators that each have a linked user account."
-            raise FacilitatorMergeError(msg)
+        self.merge_many([(target_id, source_ids)])
 
+    def merge_many(self, groups: list[tuple[int, list[int]]]) -> None:
+        """Merge several duplicate groups, each into its target, atomically.
+
+        Raises:
+            FacilitatorMergeError: If any group is invalid; nothing is merged.
+            NotFoundError: If any facilitator does not exist.
+        """
+        merged_ids: set[int] = set()
+        for target_id, source_ids in groups:
+            if not source_ids:
+                msg = "At least one source facilitator is required"
+                raise FacilitatorMergeError(msg)
+            if target_id in source_ids:
+                msg = "Target cannot be among source facilitators"
+                raise FacilitatorMergeError(msg)
+            if merged_ids & (group_ids := {target_id, *source_ids}):
+                msg = "A facilitator can only be part of one merge group"
+                raise FacilitatorMergeError(msg)
+            merged_ids |= group_ids
+
+        facilitators = self._uow.facilitators.read_by_pks(merged_ids)
+        if merged_ids - facilitators.keys():
+            raise NotFoundError
+        for target_id, source_ids in groups:
+            linked_count = sum(
+                1
+                for fid in [target_id, *source_ids]
+                if facilitators[fid].user_id is not None
+            )
+            if linked_count > 1:
+                msg = "Cannot merge facilitators that each have a linked user account."
+                raise FacilitatorMergeError(msg)
+
+        all_source_ids = [fid for _, source_ids in groups for fid in source_ids]
         with self._uow.atomic():
-            self._uow.sessions.replace_facilitators_in_sessions(source_ids, target_id)
-            self._uow.host_personal_data.delete_by_facilitators(source_ids)
-            for source_id in source_ids:
-                self._uow.facilitators.delete(source_id)
+            for target_id, source_ids in groups:
+                self._uow.sessions.replace_facilitators_in_sessions(
+                    source_ids, target_id
+                )
+            self._uow.host_personal_data.delete_by_facilitators(all_source_ids)
+            self._uow.facilitators.delete_by_pks(all_source_ids)
@@ -8,20 +8,28 @@ the file grows past ~12 top-level members or 1000 lines.
 from dataclasses import dataclass
 from datetime import date, datetime
 from enum import StrEnum, auto
-from typing import Protocol, TypedDict
+from typing import TYPE_CHECKING, Protocol, TypedDict
 
 from pydantic import BaseModel, ConfigDict
 
 from ludamus.pacts.legacy import (
     AgendaItemDTO,
+    AreaDTO,
+    FacilitatorDTO,
     FieldUsageSummary,
     PersonalDataFieldCreateData,
     PersonalDataFieldDTO,
     PersonalDataFieldUpdateData,
     ProposalCategoryDTO,
     SpaceDTO,
+    TimeSlotDTO,
+    TrackDTO,
+    VenueDTO,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 class IntegrationKind(StrEnum):
     IMPORT = "import"
@@ -129,6 +137,9 @@ class EventIntegrationsServiceProtocol(Protocol):
 
 TIMETABLE_ROOM_PAGE_SIZE = 5
 TIMETABLE_SLOT_MINUTES = 60
+SCHEDULE_SNAPSHOT_TIMEOUT = 120
+CALENDAR_FEED_TIMEOUT = 3600
+CALENDAR_ENTRY_TIMEOUT = 7 * 24 * 3600
 
 
 class SessionPositionDTO(BaseModel):
@@ -260,6 +271,41 @@ class TrackProgressDTO(BaseModel):
     progress_pct: int
 
 
+@dataclass(frozen=True)
+class ScheduleSnapshot:
+    """Everything the timetable views read about one event's schedule.
+
+    Built once per event page version and shared through the cache; writes
+    to the event bump the version instead of mutating a snapshot.
+    """
+
+    event_pk: int
+    version: str
+    spaces: tuple[SpaceDTO, ...]
+    venues: tuple[VenueDTO, ...]
+    areas: tuple[AreaDTO, ...]
+    time_slots: tuple[TimeSlotDTO, ...]
+    agenda_items: tuple[AgendaItemDTO, ...]
+    categories: tuple[ProposalCategoryDTO, ...]
+    tracks: tuple[TrackDTO, ...]
+    track_space_pks: Mapping[int, frozenset[int]]
+    track_session_pks: Mapping[int, frozenset[int]]
+    facilitators_by_session: Mapping[int, tuple[FacilitatorDTO, ...]]
+    preferred_slots_by_session: Mapping[int, tuple[TimeSlotDTO, ...]]
+
+    def list_items(self, track_pk: int | None = None) -> list[AgendaItemDTO]:
+        if track_pk is None:
+            return list(self.agenda_items)
+        session_pks = self.track_session_pks.get(track_pk, frozenset())
+        return [item for item in self.agenda_items if item.session_id in session_pks]
+
+    def list_spaces(self, track_pk: int | None = None) -> list[SpaceDTO]:
+        if track_pk is None:
+            return list(self.spaces)
+        space_pks = self.track_space_pks.get(track_pk, frozenset())
+        return [space for space in self.spaces if space.pk in space_pks]
+
+
 # --- CFP (personal-data field management) ---
 
 
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum, auto
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict
 from pydantic import BaseModel, ConfigDict, field_validator
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Mapping, Sequence
     from contextlib import AbstractContextManager
 
     from ludamus.pacts.services import ServicesProtocol
@@ -137,6 +137,21 @@ class AgendaItemDTO(BaseModel):
     session_duration_minutes: int = 0
     session_status: "SessionStatus | None" = None
     category_name: str | None = None
+    space_capacity: int | None = None
+    session_participants_limit: int = 0
+
+
+class CalendarEntryDTO(BaseModel):
+    """A scheduled session as calendar feeds list it."""
+
+    description: str
+    end_time: datetime
+    host_name: str
+    location: str
+    modification_time: datetime
+    session_pk: int
+    start_time: datetime
+    title: str
 
 
 class SessionDTO(BaseModel):
@@ -261,6 +276,14 @@ class TrackDTO(BaseModel):
     slug: str
 
 
+class TrackAttributionDTO(BaseModel):
+    """A track a session belongs to, with the track managers' names."""
+
+    track_pk: int
+    track_name: str
+    manager_names: list[str]
+
+
 class TrackCreateData(TypedDict):
     event_pk: int
     name: str
@@ -289,6 +312,16 @@ class VenueDTO(BaseModel):
     slug: str
 
 
+class VenueLayoutCopyDTO(BaseModel):
+    """Number of rows cloned by ``VenueRepository.copy_layout_from_event``."""
+
+    venues: int = 0
+    areas: int = 0
+    spaces: int = 0
+    time_slots: int = 0
+    tracks: int = 0
+
+
 class AreaDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -495,6 +528,17 @@ class EncounterDetailResult:  # pylint: disable=too-many-instance-attributes
     user_has_rsvpd: bool
 
 
+ENCOUNTER_PAST_PAGE_SIZE = 12
+
+
+class EncounterSummaryDTO(BaseModel):
+    """Encounter with its RSVP count and active creator's display name."""
+
+    encounter: EncounterDTO
+    rsvp_count: int
+    creator_name: str
+
+
 @dataclass
 class EncounterIndexItem:
     encounter: EncounterDTO
@@ -507,6 +551,8 @@ class EncounterIndexItem:
 class EncounterIndexResult:
     upcoming: list[EncounterIndexItem]
     past: list[EncounterIndexItem]
+    # ``before`` cursor of the next (older) page of past encounters, if any
+    past_next_before: int | None = None
 
 
 class EnrollmentConfigDTO(BaseModel):
@@ -701,6 +747,13 @@ class ProposeSessionResult:
     title: str
 
 
+@dataclass
+class MembershipPrewarmResult:
+    created: int
+    existing: int
+    failed_emails: list[str]
+
+
 @dataclass
 class RequestContext:
     current_site_id: int
@@ -709,6 +762,10 @@ class RequestContext:
     root_sphere_id: int
     current_user_slug: str | None = None
     current_user_id: int | None = None
+    # Resolved by the middleware so later layers need not re-read them
+    current_sphere: SphereDTO | None = field(default=None, compare=False, repr=False)
+    current_site: SiteDTO | None = field(default=None, compare=False, repr=False)
+    root_site: SiteDTO | None = field(default=None, compare=False, repr=False)
 
 
 @dataclass
@@ -755,17 +812,26 @@ class EventStatsData(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    pending_proposals: int
-    scheduled_sessions: int
-    total_proposals: int
-    unique_host_ids: set[int]
-    rooms_count: int
+    pending_proposals: int = 0
+    scheduled_sessions: int = 0
+    total_proposals: int = 0
+    hosts_count: int = 0
+    rooms_count: int = 0
+
+
+class PageVersionDTO(BaseModel):
+    """Validators of a rendered page: an opaque tag and its last change."""
+
+    tag: str
+    modified_at: datetime
 
 
 class SphereRepositoryProtocol(Protocol):
     @staticmethod
     def read_by_domain(domain: str) -> SphereDTO: ...
     @staticmethod
+    def resolve_domain(domain: str) -> tuple[SphereDTO, SiteDTO]: ...
+    @staticmethod
     def read(pk: int) -> SphereDTO: ...
     @staticmethod
     def read_site(sphere_id: int) -> SiteDTO: ...
@@ -776,13 +842,11 @@ class SphereRepositoryProtocol(Protocol):
 
 
 class UserRepositoryProtocol(Protocol):
-    @staticmethod
-    def create(user_data: UserData) -> None: ...
+    def create(self, user_data: UserData) -> None: ...
     def read(self, slug: str) -> UserDTO: ...
     def read_by_id(self, pk: int) -> UserDTO: ...
     def read_by_username(self, username: str) -> UserDTO: ...
-    @staticmethod
-    def update(user_slug: str, user_data: UserData) -> None: ...
+    def update(self, user_slug: str, user_data: UserData) -> None: ...
     @staticmethod
     def email_exists(email: str, exclude_slug: str | None = None) -> bool: ...
 
@@ -832,6 +896,8 @@ class SessionRepositoryProtocol(Protocol):  # noqa: PLR0904
     @staticmethod
     def slug_exists(sphere_id: int, slug: str) -> bool: ...
     @staticmethod
+    def read_taken_slugs(sphere_id: int, base_slug: str) -> set[str]: ...
+    @staticmethod
     def save_field_values(
         session_id: int, values: list[SessionFieldValueData]
     ) -> None: ...
@@ -850,19 +916,24 @@ class SessionRepositoryProtocol(Protocol):  # noqa: PLR0904
     @staticmethod
     def read_facilitators(session_id: int) -> list[FacilitatorDTO]: ...
     @staticmethod
+    def read_facilitators_by_sessions(
+        session_ids: Iterable[int],
+    ) -> dict[int, list[FacilitatorDTO]]: ...
+    @staticmethod
     def set_facilitators(session_id: int, facilitator_ids: list[int]) -> None: ...
     @staticmethod
     def replace_facilitators_in_sessions(
         source_ids: list[int], target_id: int
     ) -> None: ...
     @staticmethod
-    def list_unscheduled_by_event(
+    def list_unscheduled_by_event(  # noqa: PLR0913
         event_pk: int,
         *,
         track_pk: int | None = None,
         search: str | None = None,
         max_duration_minutes: int | None = None,
         category_pk: int | None = None,
+        after: tuple[str, int] | None = None,
     ) -> tuple[list[UnscheduledSessionDTO], bool]: ...
 
 
@@ -886,11 +957,19 @@ class TrackRepositoryProtocol(Protocol):
     @staticmethod
     def list_space_pks(pk: int) -> list[int]: ...
     @staticmethod
+    def read_space_pks_by_event(event_pk: int) -> dict[int, list[int]]: ...
+    @staticmethod
+    def read_session_pks_by_event(event_pk: int) -> dict[int, list[int]]: ...
+    @staticmethod
     def list_manager_pks(pk: int) -> list[int]: ...
     @staticmethod
-    def list_by_session(session_pk: int) -> list[TrackDTO]: ...
+    def get_progress_counts(event_pk: int) -> dict[int, dict[str, int]]: ...
+    @staticmethod
+    def read_manager_names_by_event(event_pk: int) -> dict[int, list[str]]: ...
     @staticmethod
-    def list_manager_names(track_pk: int) -> list[str]: ...
+    def read_attributions_by_sessions(
+        session_pks: Iterable[int],
+    ) -> dict[int, list[TrackAttributionDTO]]: ...
 
 
 class AgendaItemRepositoryProtocol(Protocol):
@@ -907,6 +986,10 @@ class AgendaItemRepositoryProtocol(Protocol):
     @staticmethod
     def read_by_session(session_pk: int) -> AgendaItemDTO | None: ...
     @staticmethod
+    def list_calendar_entries(
+        event_pk: int, participant_id: int | None = None
+    ) -> list[CalendarEntryDTO]: ...
+    @staticmethod
     def list_overlapping_in_space(
         space_pk: int,
         start_time: datetime,
@@ -927,16 +1010,13 @@ class AgendaItemRepositoryProtocol(Protocol):
 
 
 class ConnectedUserRepositoryProtocol(Protocol):
-    @staticmethod
-    def create(manager_slug: str, user_data: UserData) -> None: ...
-    @staticmethod
-    def read_all(manager_slug: str) -> list[UserDTO]: ...
-    @staticmethod
-    def read(manager_slug: str, user_slug: str) -> UserDTO: ...
-    @staticmethod
-    def delete(manager_slug: str, user_slug: str) -> None: ...
-    @staticmethod
-    def update(manager_slug: str, user_slug: str, user_data: UserData) -> None: ...
+    def create(self, manager_slug: str, user_data: UserData) -> None: ...
+    def read_all(self, manager_slug: str) -> list[UserDTO]: ...
+    def read(self, manager_slug: str, user_slug: str) -> UserDTO: ...
+    def delete(self, manager_slug: str, user_slug: str) -> None: ...
+    def update(
+        self, manager_slug: str, user_slug: str, user_data: UserData
+    ) -> None: ...
 
 
 class EventRepositoryProtocol(Protocol):
@@ -949,6 +1029,12 @@ class EventRepositoryProtocol(Protocol):
     @staticmethod
     def get_stats_data(event_id: int) -> EventStatsData: ...
     @staticmethod
+    def read_page_version(
+        slug: str, sphere_id: int, user_id: int | None
+    ) -> PageVersionDTO | None: ...
+    @staticmethod
+    def read_version(pk: int) -> str: ...
+    @staticmethod
     def update(event_id: int, data: EventUpdateData) -> None: ...
     @staticmethod
     def update_proposal_description(event_id: int, description: str) -> None: ...
@@ -956,6 +1042,9 @@ class EventRepositoryProtocol(Protocol):
 
 class VenueRepositoryProtocol(Protocol):
     def copy_to_event(self, pk: int, target_event_id: int) -> VenueDTO: ...
+    def copy_layout_from_event(
+        self, source_event_id: int, target_event_id: int
+    ) -> VenueLayoutCopyDTO: ...
     def create(self, event_id: int, name: str, address: str = "") -> VenueDTO: ...
     @staticmethod
     def delete(pk: int) -> None: ...
@@ -1134,6 +1223,8 @@ class PersonalDataFieldRepositoryProtocol(Protocol):
     def get_usage_counts(event_id: int) -> dict[int, dict[str, int]]: ...
     def list_by_event(self, event_id: int) -> list[PersonalDataFieldDTO]: ...
     def read_by_slug(self, event_id: int, slug: str) -> PersonalDataFieldDTO: ...
+    @staticmethod
+    def read_pks_by_slug(event_id: int) -> dict[str, int]: ...
     def update(
         self, pk: int, data: PersonalDataFieldUpdateData
     ) -> PersonalDataFieldDTO: ...
@@ -1151,6 +1242,8 @@ class SessionFieldRepositoryProtocol(Protocol):
     def get_usage_counts(event_id: int) -> dict[int, dict[str, int]]: ...
     def list_by_event(self, event_id: int) -> list[SessionFieldDTO]: ...
     def read_by_slug(self, event_id: int, slug: str) -> SessionFieldDTO: ...
+    @staticmethod
+    def read_pks_by_slug(event_id: int) -> dict[str, int]: ...
     def update(self, pk: int, data: SessionFieldUpdateData) -> SessionFieldDTO: ...
 
 
@@ -1199,6 +1292,14 @@ class EnrollmentConfigRepositoryProtocol(Protocol):
         config: EnrollmentConfigDTO, user_email: str
     ) -> UserEnrollmentConfigDTO | None: ...
     @staticmethod
+    def read_user_configs(
+        config: EnrollmentConfigDTO, user_emails: Iterable[str]
+    ) -> dict[str, UserEnrollmentConfigDTO]: ...
+    @staticmethod
+    def create_user_configs(
+        user_enrollment_configs: Iterable[UserEnrollmentConfigData],
+    ) -> None: ...
+    @staticmethod
     def update_user_config(user_enrollment_config: UserEnrollmentConfigDTO) -> None: ...
     @staticmethod
     def read_domain_config(
@@ -1216,13 +1317,17 @@ class EncounterRepositoryProtocol(Protocol):
     @staticmethod
     def list_by_creator(sphere_id: int, creator_id: int) -> list[EncounterDTO]: ...
     @staticmethod
-    def list_upcoming_by_creator(
-        sphere_id: int, creator_id: int
-    ) -> list[EncounterDTO]: ...
-    @staticmethod
-    def list_upcoming_rsvpd(sphere_id: int, user_id: int) -> list[EncounterDTO]: ...
+    def list_upcoming_summaries(
+        sphere_id: int, user_id: int
+    ) -> list[EncounterSummaryDTO]: ...
     @staticmethod
-    def list_past(sphere_id: int, user_id: int) -> list[EncounterDTO]: ...
+    def list_past_summaries(
+        sphere_id: int,
+        user_id: int,
+        *,
+        before_pk: int | None = None,
+        limit: int = ENCOUNTER_PAST_PAGE_SIZE,
+    ) -> tuple[list[EncounterSummaryDTO], bool]: ...
     @staticmethod
     def update(pk: int, data: EncounterData) -> None: ...
     @staticmethod
@@ -1260,9 +1365,15 @@ class FacilitatorRepositoryProtocol(Protocol):
     @staticmethod
     def list_by_event(event_id: int) -> list[FacilitatorListItemDTO]: ...
     @staticmethod
+    def read_by_pks(pks: Iterable[int]) -> dict[int, FacilitatorDTO]: ...
+    @staticmethod
     def delete(pk: int) -> None: ...
     @staticmethod
+    def delete_by_pks(pks: list[int]) -> None: ...
+    @staticmethod
     def slug_exists(event_id: int, slug: str) -> bool: ...
+    @staticmethod
+    def read_taken_slugs(event_id: int, base_slug: str) -> set[str]: ...
 
 
 class HostPersonalDataRepositoryProtocol(Protocol):
@@ -1329,10 +1440,67 @@ class ScheduleChangeLogRepositoryProtocol(Protocol):
     ) -> list[ScheduleChangeLogDTO]: ...
 
 
+class ScheduleResource(StrEnum):
+    EVENTS = auto()
+    SPACES = auto()
+    AGENDA = auto()
+    SESSIONS = auto()
+
+
+# Every row carries its ``id``; the API pages on it and clients key on it
+SCHEDULE_API_FIELDS: dict[ScheduleResource, tuple[str, ...]] = {
+    ScheduleResource.EVENTS: (
+        "id",
+        "slug",
+        "name",
+        "description",
+        "start_time",
+        "end_time",
+    ),
+    ScheduleResource.SPACES: ("id", "slug", "name", "capacity", "area", "venue"),
+    ScheduleResource.AGENDA: ("id", "session_id", "space_id", "start_time", "end_time"),
+    ScheduleResource.SESSIONS: (
+        "id",
+        "slug",
+        "title",
+        "host",
+        "description",
+        "participants_limit",
+        "min_age",
+        "enrolled_count",
+        "waiting_count",
+        "field_values",
+    ),
+}
+SCHEDULE_API_PAGE_SIZE = 100
+SCHEDULE_API_MAX_PAGE_SIZE = 500
+
+
+class ScheduleRowsRepositoryProtocol(Protocol):
+    """Plain rows of the public schedule, one page at a time.
+
+    Rows are dicts keyed by the names in ``SCHEDULE_API_FIELDS`` and ordered
+    by ``id``; a page holds the rows after ``after`` (exclusive), at most
+    ``limit`` of them.
+    """
+
+    @staticmethod
+    def read_page(
+        resource: ScheduleResource,
+        scope_pk: int,
+        fields: Sequence[str],
+        *,
+        after: int | None,
+        limit: int,
+    ) -> list[dict[str, object]]: ...
+
+
 class UnitOfWorkProtocol(Protocol):  # noqa: PLR0904
     @staticmethod
     def atomic() -> AbstractContextManager[None]: ...
     @staticmethod
+    def on_commit(callback: Callable[[], None]) -> None: ...
+    @staticmethod
     def login_user(  # type: ignore [explicit-any]
         request: Any, user_slug: str  # noqa: ANN401
     ) -> None: ...
@@ -1382,6 +1550,8 @@ class UnitOfWorkProtocol(Protocol):  # noqa: PLR0904
     def host_personal_data(self) -> HostPersonalDataRepositoryProtocol: ...
     @property
     def schedule_change_logs(self) -> ScheduleChangeLogRepositoryProtocol: ...
+    @property
+    def schedule_rows(self) -> ScheduleRowsRepositoryProtocol: ...
 
 
 class TicketAPIProtocol(Protocol):
@@ -1396,6 +1566,12 @@ class CacheProtocol(Protocol):
     def get(key: str) -> object: ...
     @staticmethod
     def set(key: str, value: object, timeout: int | None = None) -> None: ...
+    @staticmethod
+    def get_many(keys: Iterable[str]) -> dict[str, object]: ...
+    @staticmethod
+    def set_many(values: Mapping[str, object], timeout: int | None = None) -> None: ...
+    @staticmethod
+    def incr(key: str, delta: int = 1, timeout: int | None = None) -> int: ...
 
 
 class DependencyInjectorProtocol(Protocol):
@@ -1427,6 +1603,10 @@ class MembershipAPIError(Exception):
     pass
 
 
+class MembershipAPIBusyError(MembershipAPIError):
+    """The lookup was refused locally because the API host is saturated."""
+
+
 class UserEnrollmentConfigData(TypedDict):
     allowed_slots: int
     enrollment_config_id: int
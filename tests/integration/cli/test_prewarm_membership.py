@@ -0,0 +1,76 @@
+"""Integration tests for prewarm_membership management command."""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from ludamus.adapters.db.django.models import UserEnrollmentConfig
+
+_SLOTS = 2
+
+
+@pytest.fixture(name="emails")
+def emails_fixture(membership_api, enrollment_config):
+    membership_api.counts["member@example.com"] = _SLOTS
+    membership_api.failing.add("broken@example.com")
+    UserEnrollmentConfig.objects.create(
+        enrollment_config=enrollment_config,
+        user_email="known@example.com",
+        allowed_slots=1,
+    )
+    return [
+        "member@example.com",
+        "nobody@example.com",
+        "broken@example.com",
+        "known@example.com",
+    ]
+
+
+def _slots_by_email(enrollment_config):
+    return dict(
+        UserEnrollmentConfig.objects.filter(
+            enrollment_config=enrollment_config
+        ).values_list("user_email", "allowed_slots")
+    )
+
+
+class TestPrewarmMembership:
+    def test_creates_missing_configs(
+        self, emails, enrollment_config, event, membership_api
+    ):
+        out = StringIO()
+
+        call_command("prewarm_membership", str(event.pk), *emails, stdout=out)
+
+        assert _slots_by_email(enrollment_config) == {
+            "member@example.com": _SLOTS,
+            "nobody@example.com": 0,
+            "known@example.com": 1,
+        }
+        assert sorted(membership_api.hits) == [
+            "broken@example.com",
+            "member@example.com",
+            "nobody@example.com",
+        ]
+        assert "Summary: 2 created, 1 already existed, 1 failed" in out.getvalue()
+        assert "Lookup failed: broken@example.com" in out.getvalue()
+
+    def test_reads_emails_from_file(self, emails, enrollment_config, event, tmp_path):
+        path = tmp_path / "emails.txt"
+        path.write_text("\n".join(emails[:2]), encoding="utf-8")
+
+        call_command(
+            "prewarm_membership", str(event.pk), "--file", str(path), stdout=StringIO()
+        )
+
+        assert set(_slots_by_email(enrollment_config)) == {
+            "member@example.com",
+            "nobody@example.com",
+            "known@example.com",
+        }
+
+    def test_unknown_event(self):
+        with pytest.raises(CommandError, match=r"Event 0 does not exist\."):
+            call_command("prewarm_membership", "0", "member@example.com")
@@ -0,0 +1,30 @@
+"""Integration tests for rebuild_session_search management command."""
+
+from io import StringIO
+
+from django.core.management import call_command
+
+from ludamus.adapters.db.django.models import SessionSearchDocument
+
+
+class TestRebuildSessionSearch:
+    def test_rebuilds_documents(self, session):
+        SessionSearchDocument.objects.all().delete()
+        out = StringIO()
+
+        call_command("rebuild_session_search", stdout=out)
+
+        assert SessionSearchDocument.objects.filter(session=session).exists()
+        assert "Rebuilt 1 session search document(s)." in out.getvalue()
+
+    def test_limits_to_given_sessions(self, session, pending_session):
+        SessionSearchDocument.objects.all().delete()
+
+        call_command(
+            "rebuild_session_search", "--session", str(session.pk), stdout=StringIO()
+        )
+
+        assert SessionSearchDocument.objects.filter(session=session).exists()
+        assert not SessionSearchDocument.objects.filter(
+            session=pending_session
+        ).exists()
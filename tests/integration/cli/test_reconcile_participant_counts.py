@@ -0,0 +1,74 @@
+"""Integration tests for reconcile_participant_counts management command."""
+
+from io import StringIO
+
+from django.core.management import call_command
+
+from ludamus.adapters.db.django.models import (
+    Session,
+    SessionParticipation,
+    SessionParticipationStatus,
+)
+from tests.integration.conftest import UserFactory
+
+_DRIFTED_COUNT = 7
+
+
+def _drift(session):
+    SessionParticipation.objects.bulk_create(
+        (
+            SessionParticipation(
+                session=session,
+                user=UserFactory(),
+                status=SessionParticipationStatus.CONFIRMED,
+            ),
+            SessionParticipation(
+                session=session,
+                user=UserFactory(),
+                status=SessionParticipationStatus.WAITING,
+            ),
+        )
+    )
+    Session.objects.filter(pk=session.pk).update(
+        confirmed_participants_count=_DRIFTED_COUNT
+    )
+
+
+class TestReconcileParticipantCounts:
+    def test_fixes_drifted_counters(self, session):
+        _drift(session)
+        out = StringIO()
+
+        call_command("reconcile_participant_counts", stdout=out)
+
+        session.refresh_from_db()
+        assert (session.enrolled_count, session.waiting_count) == (1, 1)
+        assert "Corrected counters of 1 session(s)." in out.getvalue()
+
+    def test_reports_clean_state(self, session):
+        SessionParticipation.objects.create(
+            session=session,
+            user=UserFactory(),
+            status=SessionParticipationStatus.CONFIRMED,
+        )
+        out = StringIO()
+
+        call_command("reconcile_participant_counts", stdout=out)
+
+        assert "All participant counters match." in out.getvalue()
+
+    def test_limits_to_given_sessions(self, session, pending_session):
+        _drift(session)
+        _drift(pending_session)
+
+        call_command(
+            "reconcile_participant_counts",
+            "--session",
+            str(session.pk),
+            stdout=StringIO(),
+        )
+
+        session.refresh_from_db()
+        pending_session.refresh_from_db()
+        assert session.enrolled_count == 1
+        assert pending_session.enrolled_count == _DRIFTED_COUNT
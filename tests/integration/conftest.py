@@ -1,3 +1,4 @@
+import threading
 from datetime import UTC, datetime, timedelta
 from secrets import token_urlsafe
 
@@ -5,6 +6,7 @@ import pytest
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import make_password
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 from factory import Faker, LazyAttribute, SubFactory
 from factory.django import DjangoModelFactory
 from pytest_factoryboy import register
@@ -27,7 +29,10 @@ from ludamus.adapters.db.django.models import (
     TimeSlot,
     Venue,
 )
+from ludamus.links.db.django.sphere_cache import sphere_domain_cache
+from ludamus.links.outbound import get_outbound_http
 from tests.integration.factories import AnonymousUserFactory, CompleteUserFactory
+from tests.integration.utils import MembershipStubServer
 
 User = get_user_model()
 
@@ -43,6 +48,28 @@ def _django_db(transactional_db):
     pass
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    sphere_domain_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_outbound_http():
+    get_outbound_http().reset()
+
+
+@pytest.fixture(name="membership_api")
+def membership_api_fixture(settings):
+    server = MembershipStubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    settings.MEMBERSHIP_API_BASE_URL = server.url
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
 class UserFactory(DjangoModelFactory):
     class Meta:
         model = User
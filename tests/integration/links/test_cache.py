@@ -0,0 +1,100 @@
+"""Integration tests for the cache adapter on a Redis-protocol backend.
+
+Django's Redis cache talks to an in-process fakeredis server, so the real
+client, serializer and atomic commands run without a Redis service.
+"""
+
+import threading
+
+import pytest
+from django.core.cache import cache
+from fakeredis import FakeConnection, FakeServer, FakeStrictRedis
+
+from ludamus.links.cache import DjangoCache
+from ludamus.mills import check_proposal_rate_limit
+
+_STEP = 2
+_THREADS = 8
+_TIMEOUT = 60
+
+
+@pytest.fixture(name="redis_server")
+def redis_server_fixture(settings):
+    server = FakeServer()
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": "redis://localhost:6379/0",
+            "OPTIONS": {"connection_class": FakeConnection, "server": server},
+        }
+    }
+    return server
+
+
+@pytest.mark.usefixtures("redis_server")
+class TestDjangoCacheBulk:
+    def test_set_many_then_get_many(self):
+        DjangoCache.set_many({"a": 1, "b": "two"}, timeout=_TIMEOUT)
+
+        assert DjangoCache.get_many(["a", "b", "missing"]) == {"a": 1, "b": "two"}
+
+    def test_empty_bulk_calls_do_not_reach_the_server(self):
+        DjangoCache.set_many({})
+
+        assert not DjangoCache.get_many([])
+
+
+class TestDjangoCacheIncr:
+    @pytest.mark.usefixtures("redis_server")
+    def test_counts_from_delta(self):
+        assert DjangoCache.incr("counter", timeout=_TIMEOUT) == 1
+        assert DjangoCache.incr("counter", _STEP) == 1 + _STEP
+        assert DjangoCache.get("counter") == 1 + _STEP
+
+    def test_keeps_expiry_of_first_increment(self, redis_server):
+        DjangoCache.incr("counter", timeout=_TIMEOUT)
+        DjangoCache.incr("counter", timeout=_TIMEOUT * 10)
+
+        ttl = FakeStrictRedis(server=redis_server).ttl(cache.make_key("counter"))
+        assert 0 < ttl <= _TIMEOUT
+
+    @pytest.mark.usefixtures("redis_server")
+    def test_concurrent_increments_are_not_lost(self):
+        barrier = threading.Barrier(_THREADS)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(DjangoCache.incr("counter", timeout=_TIMEOUT))
+
+        threads = [threading.Thread(target=worker) for _ in range(_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(results) == list(range(1, _THREADS + 1))
+
+
+@pytest.mark.usefixtures("redis_server")
+class TestProposalRateLimit:
+    def test_admits_one_of_concurrent_submissions(self):
+        barrier = threading.Barrier(_THREADS)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(check_proposal_rate_limit(DjangoCache(), "1.2.3.4", 1))
+
+        threads = [threading.Thread(target=worker) for _ in range(_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results.count(True) == 1
+
+    def test_limits_each_event_separately(self):
+        assert check_proposal_rate_limit(DjangoCache(), "1.2.3.4", event_id=1)
+        assert not check_proposal_rate_limit(DjangoCache(), "1.2.3.4", event_id=1)
+        assert check_proposal_rate_limit(DjangoCache(), "1.2.3.4", event_id=2)
@@ -0,0 +1,85 @@
+"""Integration tests for the cached, single-query panel header statistics."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ludamus.links.db.django.repositories import EventRepository
+from ludamus.pacts import EventStatsData
+from tests.integration.conftest import AgendaItemFactory, SessionFactory, UserFactory
+
+
+def _stats(event):
+    return EventRepository.get_stats_data(event.pk)
+
+
+class TestEventStats:
+    def test_counts_in_one_query(
+        self, event, proposal_category, sphere, space, active_user
+    ):
+        scheduled = SessionFactory(
+            category=proposal_category,
+            sphere=sphere,
+            presenter=active_user,
+            status="scheduled",
+        )
+        AgendaItemFactory(session=scheduled, space=space)
+        SessionFactory(
+            category=proposal_category,
+            sphere=sphere,
+            presenter=active_user,
+            status="pending",
+        )
+        SessionFactory(
+            category=proposal_category,
+            sphere=sphere,
+            presenter=UserFactory(),
+            status="pending",
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            stats = _stats(event)
+
+        assert len(ctx.captured_queries) == 1
+        assert stats == EventStatsData(
+            pending_proposals=2,
+            scheduled_sessions=1,
+            total_proposals=3,
+            hosts_count=2,
+            rooms_count=1,
+        )
+
+    def test_missing_event_has_zero_counts(self):
+        assert EventRepository.get_stats_data(99_999_999) == EventStatsData()
+
+    @pytest.mark.usefixtures("pending_session")
+    def test_repeated_reads_are_cached(self, event):
+        _stats(event)
+
+        with CaptureQueriesContext(connection) as ctx:
+            stats = _stats(event)
+
+        assert not ctx.captured_queries
+        assert stats.pending_proposals == 1
+
+    def test_session_write_invalidates_cache(self, event, pending_session):
+        assert _stats(event).pending_proposals == 1
+
+        pending_session.status = "rejected"
+        pending_session.save()
+
+        assert _stats(event).pending_proposals == 0
+
+    def test_agenda_write_invalidates_cache(self, event, pending_session, space):
+        assert _stats(event).scheduled_sessions == 0
+
+        AgendaItemFactory(session=pending_session, space=space)
+
+        assert _stats(event).scheduled_sessions == 1
+
+    def test_space_delete_invalidates_cache(self, event, space):
+        assert _stats(event).rooms_count == 1
+
+        space.delete()
+
+        assert _stats(event).rooms_count == 0
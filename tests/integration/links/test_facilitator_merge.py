@@ -0,0 +1,124 @@
+"""Integration tests for the set-based facilitator merge."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ludamus.adapters.db.django.models import Facilitator, SessionSearchDocument
+from ludamus.links.db.django.uow import UnitOfWork
+from ludamus.mills import FacilitatorMergeService
+from ludamus.pacts import FacilitatorMergeError, NotFoundError
+from tests.integration.conftest import SessionFactory, UserFactory
+
+_FEW_SESSIONS = 2
+_MANY_SESSIONS = 40
+
+
+def _facilitator(event, slug, **kwargs):
+    return Facilitator.objects.create(
+        event=event, display_name=slug.title(), slug=slug, **kwargs
+    )
+
+
+def _sessions(count, proposal_category, sphere, *facilitators):
+    sessions = SessionFactory.create_batch(
+        count, category=proposal_category, sphere=sphere
+    )
+    for session in sessions:
+        session.facilitators.add(*facilitators)
+    return sessions
+
+
+def _facilitator_pks(session):
+    return set(session.facilitators.values_list("pk", flat=True))
+
+
+class TestFacilitatorMerge:
+    def test_moves_sessions_to_target(self, event, proposal_category, sphere):
+        target = _facilitator(event, "alice")
+        source = _facilitator(event, "alice-dup")
+        only_source = _sessions(_FEW_SESSIONS, proposal_category, sphere, source)
+        (both,) = _sessions(1, proposal_category, sphere, target, source)
+
+        FacilitatorMergeService(UnitOfWork()).merge(target.pk, [source.pk])
+
+        assert not Facilitator.objects.filter(pk=source.pk).exists()
+        for session in [*only_source, both]:
+            assert _facilitator_pks(session) == {target.pk}
+
+    def test_refreshes_search_documents(self, event, proposal_category, sphere):
+        target = _facilitator(event, "alice")
+        source = _facilitator(event, "alice-dup")
+        (session,) = _sessions(1, proposal_category, sphere, source)
+
+        FacilitatorMergeService(UnitOfWork()).merge(target.pk, [source.pk])
+
+        document = SessionSearchDocument.objects.get(session=session).document
+        assert "alice-dup" not in document
+        assert "alice" in document
+
+    def test_queries_do_not_grow_with_sessions(self, event, proposal_category, sphere):
+        def merge_queries(count, prefix):
+            target = _facilitator(event, f"{prefix}-target")
+            source = _facilitator(event, f"{prefix}-source")
+            _sessions(count, proposal_category, sphere, source)
+            with CaptureQueriesContext(connection) as ctx:
+                FacilitatorMergeService(UnitOfWork()).merge(target.pk, [source.pk])
+            return len(ctx.captured_queries)
+
+        few = merge_queries(_FEW_SESSIONS, "few")
+        many = merge_queries(_MANY_SESSIONS, "many")
+
+        assert many == few
+
+
+class TestFacilitatorMergeMany:
+    def test_merges_every_group(self, event, proposal_category, sphere):
+        alice = _facilitator(event, "alice")
+        alice_dup = _facilitator(event, "alice-dup")
+        bob = _facilitator(event, "bob")
+        bob_dups = [_facilitator(event, f"bob-dup-{idx}") for idx in range(2)]
+        (alice_session,) = _sessions(1, proposal_category, sphere, alice_dup)
+        (bob_session,) = _sessions(1, proposal_category, sphere, *bob_dups)
+
+        FacilitatorMergeService(UnitOfWork()).merge_many(
+            [(alice.pk, [alice_dup.pk]), (bob.pk, [f.pk for f in bob_dups])]
+        )
+
+        remaining = set(Facilitator.objects.values_list("pk", flat=True))
+        assert remaining == {alice.pk, bob.pk}
+        assert _facilitator_pks(alice_session) == {alice.pk}
+        assert _facilitator_pks(bob_session) == {bob.pk}
+
+    def test_invalid_group_merges_nothing(self, event, proposal_category, sphere):
+        alice = _facilitator(event, "alice", user=UserFactory())
+        alice_dup = _facilitator(event, "alice-dup")
+        bob = _facilitator(event, "bob", user=UserFactory())
+        bob_dup = _facilitator(event, "bob-dup", user=UserFactory())
+        (session,) = _sessions(1, proposal_category, sphere, alice_dup)
+
+        with pytest.raises(FacilitatorMergeError):
+            FacilitatorMergeService(UnitOfWork()).merge_many(
+                [(alice.pk, [alice_dup.pk]), (bob.pk, [bob_dup.pk])]
+            )
+
+        assert Facilitator.objects.count() == len([alice, alice_dup, bob, bob_dup])
+        assert _facilitator_pks(session) == {alice_dup.pk}
+
+    def test_rejects_facilitator_in_two_groups(self, event):
+        alice = _facilitator(event, "alice")
+        alice_dup = _facilitator(event, "alice-dup")
+        bob = _facilitator(event, "bob")
+
+        with pytest.raises(FacilitatorMergeError):
+            FacilitatorMergeService(UnitOfWork()).merge_many(
+                [(alice.pk, [alice_dup.pk]), (bob.pk, [alice_dup.pk])]
+            )
+
+    def test_missing_facilitator_raises_not_found(self, event):
+        alice = _facilitator(event, "alice")
+
+        with pytest.raises(NotFoundError):
+            FacilitatorMergeService(UnitOfWork()).merge_many([(alice.pk, [99_999_999])])
+
+        assert Facilitator.objects.filter(pk=alice.pk).exists()
@@ -20,6 +20,7 @@ from ludamus.links.google_docs import (
     GoogleDocsProposalConfig,
     GoogleDocsProposalImporter,
 )
+from ludamus.links.outbound import get_outbound_http
 from ludamus.pacts.chronology import CheckOutcome
 
 SECRET = b'{"type": "service_account"}'
@@ -97,10 +98,11 @@ class TestGoogleDocsProposalImporterProbe:
         assert not result.hint
         assert google.session.get.call_count == 1 + 1  # spreadsheet + form
         google.session.get.assert_any_call(
-            SHEETS_API_URL.format(sheet_id="sheet-1"), timeout=10
+            SHEETS_API_URL.format(sheet_id="sheet-1"),
+            timeout=get_outbound_http().timeout,
         )
         google.session.get.assert_any_call(
-            FORMS_API_URL.format(form_id="form-1"), timeout=10
+            FORMS_API_URL.format(form_id="form-1"), timeout=get_outbound_http().timeout
         )
 
     def test_form_probe_failure_after_sheet_ok(self, google):
@@ -122,7 +124,8 @@ class TestGoogleDocsProposalImporterProbe:
         assert result.outcome == CheckOutcome.AUTH_FAILED
         assert result.hint == "nope"
         google.session.get.assert_called_once_with(
-            SHEETS_API_URL.format(sheet_id="sheet-1"), timeout=10
+            SHEETS_API_URL.format(sheet_id="sheet-1"),
+            timeout=get_outbound_http().timeout,
         )
 
     def test_forbidden(self, google):
@@ -0,0 +1,69 @@
+"""Integration tests for the unit of work's request-scoped identity map."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ludamus.links.db.django.uow import UnitOfWork
+from ludamus.pacts import NotFoundError, UserData
+from tests.integration.conftest import UserFactory
+
+_READS = 3
+
+
+class TestIdentityMap:
+    def test_repeated_reads_hit_the_database_once(self, active_user):
+        uow = UnitOfWork(identity_map=True)
+
+        with CaptureQueriesContext(connection) as ctx:
+            users = [uow.active_users.read(active_user.slug) for _ in range(_READS)]
+
+        assert len(ctx.captured_queries) == 1
+        assert {user.pk for user in users} == {active_user.pk}
+        assert uow.identity_map.hits == _READS - 1
+        assert uow.identity_map.misses == 1
+
+    def test_disabled_by_default(self, active_user):
+        uow = UnitOfWork()
+
+        with CaptureQueriesContext(connection) as ctx:
+            uow.active_users.read(active_user.slug)
+            uow.active_users.read(active_user.slug)
+
+        assert uow.identity_map is None
+        assert len(ctx.captured_queries) == 1 + 1
+
+    def test_write_invalidates_cached_reads(self, active_user):
+        uow = UnitOfWork(identity_map=True)
+        uow.active_users.read(active_user.slug)
+
+        uow.active_users.update(active_user.slug, UserData(name="Renamed"))
+
+        assert uow.active_users.read(active_user.slug).name == "Renamed"
+
+    def test_connected_user_writes_invalidate_read_all(
+        self, active_user, connected_user
+    ):
+        uow = UnitOfWork(identity_map=True)
+        assert len(uow.connected_users.read_all(active_user.slug)) == 1
+
+        uow.connected_users.delete(active_user.slug, connected_user.slug)
+
+        assert not uow.connected_users.read_all(active_user.slug)
+
+    @pytest.mark.usefixtures("connected_user")
+    def test_read_all_returns_a_fresh_list(self, active_user):
+        uow = UnitOfWork(identity_map=True)
+
+        uow.connected_users.read_all(active_user.slug).clear()
+
+        assert uow.connected_users.read_all(active_user.slug)
+
+    def test_missing_reads_are_not_cached(self):
+        uow = UnitOfWork(identity_map=True)
+
+        with pytest.raises(NotFoundError):
+            uow.active_users.read("missing")
+
+        UserFactory(slug="missing", user_type="active")
+        assert uow.active_users.read("missing").slug == "missing"
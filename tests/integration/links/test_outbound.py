@@ -0,0 +1,219 @@
+"""Integration tests for the shared outbound HTTP client.
+
+Requests go to the local membership stub server; the breaker clock is faked
+so cool-down periods elapse instantly.
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from ludamus.links.outbound import CircuitOpenError, HostBusyError, OutboundHttp
+from ludamus.links.ticket_api import MembershipApiClient
+from ludamus.pacts import MembershipAPIBusyError, MembershipAPIError
+
+_THRESHOLD = 3
+_RESET_TIMEOUT = 30
+_COUNT = 2
+_SLOW_RESPONSE = 1.5
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def clock_fixture():
+    return _Clock()
+
+
+@pytest.fixture(name="http")
+def http_fixture(clock):
+    return OutboundHttp(
+        connect_timeout=1,
+        read_timeout=2,
+        max_per_host=1,
+        failure_threshold=_THRESHOLD,
+        reset_timeout=_RESET_TIMEOUT,
+        clock=clock,
+    )
+
+
+class _RefreshError(Exception):
+    pass
+
+
+class _RefreshFailingSession(requests.Session):
+    def get(self, *_args, **_kwargs):
+        raise _RefreshError
+
+
+def _get(http, server, email):
+    return http.get(server.url, params={"email": email})
+
+
+def _host(server):
+    return urlsplit(server.url).netloc
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, http, membership_api):
+        membership_api.failing.add("broken@example.com")
+
+        for _ in range(_THRESHOLD):
+            _get(http, membership_api, "broken@example.com")
+        with pytest.raises(CircuitOpenError):
+            _get(http, membership_api, "ok@example.com")
+
+        assert membership_api.hits == ["broken@example.com"] * _THRESHOLD
+        stats = http.stats()[_host(membership_api)]
+        assert stats.requests == stats.failures == _THRESHOLD
+        assert stats.rejected == 1
+        assert stats.circuit_open
+
+    def test_success_resets_failure_streak(self, http, membership_api):
+        membership_api.failing.add("broken@example.com")
+
+        for _ in range(_THRESHOLD - 1):
+            _get(http, membership_api, "broken@example.com")
+        _get(http, membership_api, "ok@example.com")
+        _get(http, membership_api, "broken@example.com")
+
+        assert not http.stats()[_host(membership_api)].circuit_open
+
+    def test_trial_request_closes_circuit(self, http, clock, membership_api):
+        membership_api.failing.add("broken@example.com")
+        for _ in range(_THRESHOLD):
+            _get(http, membership_api, "broken@example.com")
+
+        clock.now += _RESET_TIMEOUT
+        response = _get(http, membership_api, "ok@example.com")
+
+        assert response.ok
+        assert not http.stats()[_host(membership_api)].circuit_open
+        assert _get(http, membership_api, "ok@example.com").ok
+
+    def test_failed_trial_reopens_circuit(self, http, clock, membership_api):
+        membership_api.failing.add("broken@example.com")
+        for _ in range(_THRESHOLD):
+            _get(http, membership_api, "broken@example.com")
+
+        clock.now += _RESET_TIMEOUT
+        _get(http, membership_api, "broken@example.com")
+
+        with pytest.raises(CircuitOpenError):
+            _get(http, membership_api, "ok@example.com")
+
+    def test_trial_raising_other_errors_frees_the_trial(
+        self, http, clock, membership_api
+    ):
+        membership_api.failing.add("broken@example.com")
+        for _ in range(_THRESHOLD):
+            _get(http, membership_api, "broken@example.com")
+
+        clock.now += _RESET_TIMEOUT
+        with pytest.raises(_RefreshError):
+            http.get(membership_api.url, session=_RefreshFailingSession())
+
+        assert _get(http, membership_api, "ok@example.com").ok
+
+    def test_connection_errors_count_as_failures(self, http, membership_api):
+        url = membership_api.url
+        membership_api.shutdown()
+        membership_api.server_close()
+
+        for _ in range(_THRESHOLD):
+            with pytest.raises(requests.ConnectionError):
+                http.get(url)
+
+        with pytest.raises(CircuitOpenError):
+            http.get(url)
+
+    def test_reset_closes_circuits(self, http, membership_api):
+        membership_api.failing.add("broken@example.com")
+        for _ in range(_THRESHOLD):
+            _get(http, membership_api, "broken@example.com")
+
+        http.reset()
+
+        assert _get(http, membership_api, "ok@example.com").ok
+        assert http.stats()[_host(membership_api)].requests == 1
+
+
+class TestHostConcurrency:
+    def test_rejects_when_host_slots_are_taken(self, http, membership_api):
+        membership_api.delay = _SLOW_RESPONSE
+        thread = threading.Thread(
+            target=_get, args=(http, membership_api, "slow@example.com")
+        )
+        thread.start()
+        while not membership_api.hits:
+            time.sleep(0.01)
+        try:
+            with pytest.raises(HostBusyError):
+                _get(http, membership_api, "ok@example.com")
+        finally:
+            thread.join()
+
+        assert http.stats()[_host(membership_api)].rejected == 1
+
+    def test_busy_rejection_keeps_another_requests_trial(self, http, membership_api):
+        membership_api.delay = _SLOW_RESPONSE
+        thread = threading.Thread(
+            target=_get, args=(http, membership_api, "slow@example.com")
+        )
+        thread.start()
+        while not membership_api.hits:
+            time.sleep(0.01)
+        # Another request became the half-open trial after this one was admitted
+        host = http._host(_host(membership_api))  # noqa: SLF001
+        host.trial_in_flight = True
+        try:
+            with pytest.raises(HostBusyError):
+                _get(http, membership_api, "ok@example.com")
+        finally:
+            thread.join()
+
+        assert host.trial_in_flight
+
+
+class TestMembershipApiClientOutbound:
+    def test_open_circuit_fails_fast(self, membership_api, monkeypatch):
+        membership_api.counts["member@example.com"] = _COUNT
+        membership_api.failing.add("broken@example.com")
+        client = MembershipApiClient()
+        monkeypatch.setattr(client.http, "failure_threshold", _THRESHOLD)
+
+        for _ in range(_THRESHOLD):
+            with pytest.raises(MembershipAPIError):
+                client.fetch_membership_count("broken@example.com")
+        with pytest.raises(MembershipAPIError):
+            client.fetch_membership_count("member@example.com")
+
+        assert "member@example.com" not in membership_api.hits
+
+    def test_busy_host_is_reported_separately(self, membership_api, monkeypatch):
+        client = MembershipApiClient()
+
+        def busy(*_args, **_kwargs):
+            raise HostBusyError
+
+        monkeypatch.setattr(client.http, "get", busy)
+
+        with pytest.raises(MembershipAPIBusyError):
+            client.fetch_membership_count("member@example.com")
+        assert not membership_api.hits
+
+    def test_uses_tight_timeouts(self, settings):
+        settings.MEMBERSHIP_API_TIMEOUT = _COUNT
+
+        client = MembershipApiClient()
+
+        assert client.timeout == (client.http.timeout[0], _COUNT)
@@ -79,15 +79,15 @@ class TestSessionRepositoryNotFound:
 class TestConnectedUserRepositoryNotFound:
     def test_read_all_raises_when_manager_missing(self):
         with pytest.raises(NotFoundError):
-            ConnectedUserRepository.read_all("does-not-exist")
+            ConnectedUserRepository().read_all("does-not-exist")
 
     def test_read_raises_when_user_missing(self):
         with pytest.raises(NotFoundError):
-            ConnectedUserRepository.read("missing-mgr", "missing-user")
+            ConnectedUserRepository().read("missing-mgr", "missing-user")
 
     def test_delete_raises_when_user_missing(self):
         with pytest.raises(NotFoundError):
-            ConnectedUserRepository.delete("missing-mgr", "missing-user")
+            ConnectedUserRepository().delete("missing-mgr", "missing-user")
 
 
 class TestEventRepositoryNotFound:
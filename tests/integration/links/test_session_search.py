@@ -0,0 +1,107 @@
+"""Integration tests for the maintained session full-text search documents."""
+
+from ludamus.adapters.db.django.models import (
+    Facilitator,
+    SessionField,
+    SessionFieldValue,
+    SessionSearchDocument,
+    Track,
+)
+from ludamus.links.db.django.session_search import search_session_ids
+from tests.integration.conftest import SessionFactory
+
+
+def _session(proposal_category, sphere, **kwargs):
+    return SessionFactory(category=proposal_category, sphere=sphere, **kwargs)
+
+
+class TestSearchSessionIds:
+    def test_requires_every_term(self, event, proposal_category, sphere):
+        both = _session(proposal_category, sphere, title="Dragon heist quest")
+        _session(proposal_category, sphere, title="Dragon tea party")
+
+        assert search_session_ids(event.pk, "heist DRAGON") == [both.pk]
+
+    def test_ranks_better_matches_first(self, event, proposal_category, sphere):
+        once = _session(proposal_category, sphere, title="Zephyr night")
+        twice = _session(proposal_category, sphere, title="Zephyr zephyr zephyr")
+
+        assert search_session_ids(event.pk, "zephyr") == [twice.pk, once.pk]
+
+    def test_matches_short_terms(self, event, proposal_category, sphere):
+        session = _session(proposal_category, sphere, title="Qx D&D one-shot")
+
+        assert search_session_ids(event.pk, "d&d qx") == [session.pk]
+
+    def test_scoped_to_event(self, event, proposal_category, sphere):
+        _session(proposal_category, sphere, title="Lonely unicorn")
+
+        assert not search_session_ids(event.pk + 1, "unicorn")
+
+    def test_blank_search_matches_nothing(self, event):
+        assert not search_session_ids(event.pk, "   ")
+
+
+class TestSearchDocumentMaintenance:
+    def test_title_update(self, event, proposal_category, sphere):
+        session = _session(proposal_category, sphere, title="Old title")
+
+        session.title = "Brand new kraken"
+        session.save()
+
+        assert search_session_ids(event.pk, "kraken") == [session.pk]
+
+    def test_field_value(self, event, proposal_category, sphere):
+        session = _session(proposal_category, sphere)
+        field = SessionField.objects.create(
+            event=event, name="Genre", question="Genre?", slug="genre"
+        )
+
+        value = SessionFieldValue.objects.create(
+            session=session, field=field, value=["Cyberpunk", "Noir"]
+        )
+        assert search_session_ids(event.pk, "noir cyberpunk") == [session.pk]
+
+        value.delete()
+        assert not search_session_ids(event.pk, "noir")
+
+    def test_facilitator(self, event, proposal_category, sphere):
+        session = _session(proposal_category, sphere)
+        facilitator = Facilitator.objects.create(
+            event=event, display_name="Grimbold", slug="grimbold"
+        )
+
+        session.facilitators.add(facilitator)
+        assert search_session_ids(event.pk, "grimbold") == [session.pk]
+
+        facilitator.display_name = "Thornwick"
+        facilitator.save()
+        assert search_session_ids(event.pk, "thornwick") == [session.pk]
+
+        facilitator.sessions.clear()
+        assert not search_session_ids(event.pk, "thornwick")
+
+    def test_track(self, event, proposal_category, sphere):
+        session = _session(proposal_category, sphere)
+        track = Track.objects.create(event=event, name="Larpwave", slug="larpwave")
+
+        track.sessions.add(session)
+        assert search_session_ids(event.pk, "larpwave") == [session.pk]
+
+        track.delete()
+        assert not search_session_ids(event.pk, "larpwave")
+
+    def test_presenter_rename(self, event, proposal_category, sphere, active_user):
+        session = _session(proposal_category, sphere, presenter=active_user)
+
+        active_user.name = "Quillon"
+        active_user.save()
+
+        assert search_session_ids(event.pk, "quillon") == [session.pk]
+
+    def test_refresh_repairs_documents(self, event, proposal_category, sphere):
+        session = _session(proposal_category, sphere, title="Mimic chest")
+        SessionSearchDocument.objects.all().delete()
+
+        assert SessionSearchDocument.objects.refresh() == 1
+        assert search_session_ids(event.pk, "mimic") == [session.pk]
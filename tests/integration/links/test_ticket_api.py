@@ -0,0 +1,141 @@
+"""Integration tests for the cached membership API client.
+
+Requests go to a local stub HTTP server, so the real ``requests`` transport,
+timeouts and error mapping are exercised.
+"""
+
+import threading
+
+import pytest
+
+from ludamus.links.cache import DjangoCache
+from ludamus.links.ticket_api import CachedMembershipApiClient, MembershipApiClient
+from ludamus.pacts import MembershipAPIBusyError, MembershipAPIError
+
+_COUNT = 3
+_THREADS = 8
+_TIMEOUT = 600
+_NEGATIVE_TIMEOUT = 30
+
+
+class _RecordingCache:
+    def __init__(self):
+        self.data = {}
+        self.timeouts = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, timeout=None):
+        self.data[key] = value
+        self.timeouts[key] = timeout
+
+
+class _CacheDownError(Exception):
+    pass
+
+
+class _BrokenCache(_RecordingCache):
+    def set(self, key, value, timeout=None):  # noqa: ARG002 - protocol shape
+        raise _CacheDownError
+
+
+class _BusyClient:
+    @staticmethod
+    def fetch_membership_count(_email):
+        raise MembershipAPIBusyError
+
+
+def _client(cache=None):
+    return CachedMembershipApiClient(MembershipApiClient(), cache or DjangoCache())
+
+
+class TestCachedMembershipApiClient:
+    def test_caches_membership_count(self, membership_api):
+        membership_api.counts["member@example.com"] = _COUNT
+        client = _client()
+
+        assert client.fetch_membership_count("member@example.com") == _COUNT
+        assert _client().fetch_membership_count("Member@Example.com ") == _COUNT
+        assert membership_api.hits == ["member@example.com"]
+
+    def test_zero_count_uses_negative_timeout(self, membership_api, settings):
+        settings.MEMBERSHIP_API_CACHE_TIMEOUT = _TIMEOUT
+        settings.MEMBERSHIP_API_NEGATIVE_CACHE_TIMEOUT = _NEGATIVE_TIMEOUT
+        membership_api.counts["member@example.com"] = _COUNT
+        cache = _RecordingCache()
+        client = _client(cache)
+
+        client.fetch_membership_count("member@example.com")
+        client.fetch_membership_count("nobody@example.com")
+        client.fetch_membership_count("nobody@example.com")
+
+        assert cache.timeouts == {
+            client.cache_key("member@example.com"): _TIMEOUT,
+            client.cache_key("nobody@example.com"): _NEGATIVE_TIMEOUT,
+        }
+        assert membership_api.hits == ["member@example.com", "nobody@example.com"]
+
+    def test_caches_failures(self, membership_api):
+        membership_api.failing.add("member@example.com")
+        client = _client()
+
+        for _ in range(2):
+            with pytest.raises(MembershipAPIError):
+                client.fetch_membership_count("member@example.com")
+
+        assert membership_api.hits == ["member@example.com"]
+
+    def test_busy_host_is_not_cached(self, membership_api):
+        membership_api.counts["member@example.com"] = _COUNT
+        cache = _RecordingCache()
+        client = CachedMembershipApiClient(_BusyClient(), cache)
+
+        with pytest.raises(MembershipAPIBusyError):
+            client.fetch_membership_count("member@example.com")
+
+        assert not cache.data
+        assert _client(cache).fetch_membership_count("member@example.com") == _COUNT
+
+    def test_concurrent_lookups_share_one_request(self, membership_api):
+        membership_api.counts["member@example.com"] = _COUNT
+        membership_api.delay = 0.2
+        client = _client(_RecordingCache())
+        barrier = threading.Barrier(_THREADS)
+        results = []
+
+        def lookup():
+            barrier.wait()
+            results.append(client.fetch_membership_count("member@example.com"))
+
+        threads = [threading.Thread(target=lookup) for _ in range(_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [_COUNT] * _THREADS
+        assert membership_api.hits == ["member@example.com"]
+
+    def test_concurrent_lookups_share_other_errors(self, membership_api):
+        membership_api.counts["member@example.com"] = _COUNT
+        membership_api.delay = 0.2
+        client = _client(_BrokenCache())
+        barrier = threading.Barrier(_THREADS)
+        errors = []
+
+        def lookup():
+            barrier.wait()
+            try:
+                client.fetch_membership_count("member@example.com")
+            except _CacheDownError as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=lookup) for _ in range(_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(errors) == _THREADS
+        assert membership_api.hits == ["member@example.com"]
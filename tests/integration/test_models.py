@@ -3,8 +3,19 @@ from datetime import UTC, datetime, timedelta
 import pytest
 from django.core.exceptions import ValidationError
 
-from ludamus.adapters.db.django.models import TimeSlot
-from tests.integration.conftest import EventFactory
+from ludamus.adapters.db.django.models import (
+    Session,
+    SessionParticipation,
+    SessionParticipationStatus,
+    TimeSlot,
+    get_enrollment_eligibility,
+)
+from tests.integration.conftest import (
+    AgendaItemFactory,
+    EventFactory,
+    SessionFactory,
+    UserFactory,
+)
 
 
 class TestEventIsPublished:
@@ -25,6 +36,97 @@ class TestEventIsPublished:
         assert event.is_published is False
 
 
+class TestSessionParticipantCounters:
+    @staticmethod
+    def _counts(session):
+        session.refresh_from_db()
+        return session.enrolled_count, session.waiting_count
+
+    def test_create_increments_counter(self, session):
+        SessionParticipation.objects.create(
+            session=session,
+            user=UserFactory(),
+            status=SessionParticipationStatus.CONFIRMED,
+        )
+        SessionParticipation.objects.create(
+            session=session,
+            user=UserFactory(),
+            status=SessionParticipationStatus.WAITING,
+        )
+
+        assert self._counts(session) == (1, 1)
+
+    def test_promotion_moves_between_counters(self, session):
+        SessionParticipation.objects.create(
+            session=session,
+            user=UserFactory(),
+            status=SessionParticipationStatus.WAITING,
+        )
+        participation = SessionParticipation.objects.get(session=session)
+
+        participation.status = SessionParticipationStatus.CONFIRMED
+        participation.save()
+
+        assert self._counts(session) == (1, 0)
+
+    def test_delete_decrements_counter(self, session):
+        SessionParticipation.objects.create(
+            session=session,
+            user=UserFactory(),
+            status=SessionParticipationStatus.CONFIRMED,
+        )
+
+        SessionParticipation.objects.get(session=session).delete()
+
+        assert self._counts(session) == (0, 0)
+
+    def test_reconcile_repairs_drift(self, session):
+        SessionParticipation.objects.bulk_create(
+            SessionParticipation(
+                session=session,
+                user=UserFactory(),
+                status=SessionParticipationStatus.CONFIRMED,
+            )
+            for _ in range(2)
+        )
+
+        assert Session.objects.reconcile_participant_counts() == 1
+        assert self._counts(session) == (2, 0)
+        assert Session.objects.reconcile_participant_counts() == 0
+
+
+class TestEnrollmentEligibility:
+    def test_own_participation_is_not_a_conflict(self, agenda_item, active_user):
+        participation = SessionParticipation.objects.create(
+            session=agenda_item.session,
+            user=active_user,
+            status=SessionParticipationStatus.CONFIRMED,
+        )
+
+        eligibility = get_enrollment_eligibility(agenda_item.session, [active_user.pk])
+
+        assert eligibility.participations == {active_user.pk: participation}
+        assert not eligibility.has_conflict(active_user.pk)
+
+    def test_overlapping_session_is_a_conflict(self, agenda_item, active_user):
+        other = AgendaItemFactory(
+            session=SessionFactory(sphere=agenda_item.session.sphere),
+            space=agenda_item.space,
+            start_time=agenda_item.start_time,
+            end_time=agenda_item.end_time,
+        )
+        SessionParticipation.objects.create(
+            session=other.session,
+            user=active_user,
+            status=SessionParticipationStatus.CONFIRMED,
+        )
+
+        eligibility = get_enrollment_eligibility(agenda_item.session, [active_user.pk])
+
+        assert not eligibility.participations
+        assert eligibility.has_conflict(active_user.pk)
+
+
 class TestTimeSlot:
     def test_validate_unique_ok(self, event, faker):
         TimeSlot.objects.create(
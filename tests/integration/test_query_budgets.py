@@ -0,0 +1,355 @@
+"""Query budgets of repository methods and key pages as the schedule grows.
+
+Each test grows the data from a few rows to hundreds and fails when a call
+runs more queries than its budget or more queries at the larger size; the
+failure lists the SQL fingerprints that grew.
+"""
+
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from ludamus.adapters.db.django.models import (
+    AgendaItem,
+    Encounter,
+    EncounterRSVP,
+    Facilitator,
+    Session,
+    SessionField,
+    SessionFieldValue,
+    SessionParticipation,
+    SessionParticipationStatus,
+    Track,
+    UserEnrollmentConfig,
+)
+from ludamus.links.db.django.uow import UnitOfWork
+from ludamus.pacts import (
+    SCHEDULE_API_FIELDS,
+    SCHEDULE_API_MAX_PAGE_SIZE,
+    ScheduleResource,
+    SessionStatus,
+)
+from tests.integration.conftest import UserFactory
+from tests.integration.utils import assert_query_budget
+
+_SINGLE_QUERY = 1
+_PENDING_BUDGET = 3  # sessions, then their tags and time slots
+_SCHEDULE_ROWS_BUDGET = 2  # rows, then public field values
+_EVENT_PAGE_BUDGET = 40
+_USER_EVENT_PAGE_BUDGET = 60
+_TIMETABLE_PAGE_BUDGET = 100
+_NOTICE_BOARD_BUDGET = 25
+_API_BUDGET = 10
+_CALENDAR_BUDGET = 10
+
+
+@pytest.fixture(name="grow_schedule")
+def grow_schedule_fixture(event, space, sphere, proposal_category, active_user):
+    field = SessionField.objects.create(
+        event=event, name="System", question="System", slug="system", is_public=True
+    )
+
+    def grow(start, stop):
+        sessions = Session.objects.bulk_create(
+            Session(
+                sphere=sphere,
+                category=proposal_category,
+                display_name=f"Host {i}",
+                title=f"Session {i}",
+                slug=f"session-{i}",
+                participants_limit=10,
+                status=SessionStatus.SCHEDULED,
+            )
+            for i in range(start, stop)
+        )
+        AgendaItem.objects.bulk_create(
+            AgendaItem(
+                session=session,
+                space=space,
+                start_time=event.start_time + timedelta(minutes=i),
+                end_time=event.start_time + timedelta(minutes=i + 60),
+            )
+            for i, session in enumerate(sessions, start)
+        )
+        SessionFieldValue.objects.bulk_create(
+            SessionFieldValue(session=session, field=field, value="Other")
+            for session in sessions
+        )
+        SessionParticipation.objects.bulk_create(
+            SessionParticipation(
+                session=session,
+                user=active_user,
+                status=SessionParticipationStatus.CONFIRMED,
+            )
+            for session in sessions
+        )
+
+    return grow
+
+
+@pytest.fixture(name="grow_timetable")
+def grow_timetable_fixture(event, space, sphere, proposal_category, time_slot):
+    # Every session overlaps its neighbours in one room, shares a facilitator
+    # with all of them, sits in a track of its own and prefers the first two
+    # hours: space, facilitator and cross-track conflicts and preferred slot
+    # violations all grow with the schedule.
+    facilitator = Facilitator.objects.create(
+        event=event, display_name="Facilitator", slug="facilitator"
+    )
+    manager = UserFactory()
+
+    def grow(start, stop):
+        sessions = Session.objects.bulk_create(
+            Session(
+                sphere=sphere,
+                category=proposal_category,
+                display_name=f"Host {i}",
+                title=f"Session {i}",
+                slug=f"session-{i}",
+                participants_limit=10,
+                status=SessionStatus.SCHEDULED,
+            )
+            for i in range(start, stop)
+        )
+        AgendaItem.objects.bulk_create(
+            AgendaItem(
+                session=session,
+                space=space,
+                start_time=event.start_time + timedelta(minutes=i),
+                end_time=event.start_time + timedelta(minutes=i + 60),
+            )
+            for i, session in enumerate(sessions, start)
+        )
+        tracks = Track.objects.bulk_create(
+            Track(event=event, name=f"Track {i}", slug=f"track-{i}")
+            for i in range(start, stop)
+        )
+        Track.managers.through.objects.bulk_create(
+            Track.managers.through(track=track, user=manager) for track in tracks
+        )
+        Session.tracks.through.objects.bulk_create(
+            Session.tracks.through(session=session, track=track)
+            for session, track in zip(sessions, tracks, strict=True)
+        )
+        Session.facilitators.through.objects.bulk_create(
+            Session.facilitators.through(session=session, facilitator=facilitator)
+            for session in sessions
+        )
+        Session.time_slots.through.objects.bulk_create(
+            Session.time_slots.through(session=session, timeslot=time_slot)
+            for session in sessions
+        )
+
+    return grow
+
+
+@pytest.fixture(name="grow_encounters")
+def grow_encounters_fixture(sphere, active_user):
+    organizer = UserFactory()
+    now = datetime.now(UTC)
+
+    def grow(start, stop):
+        upcoming = Encounter.objects.bulk_create(
+            Encounter(
+                sphere=sphere,
+                creator=organizer,
+                title=f"Upcoming {i}",
+                start_time=now + timedelta(hours=i + 1),
+                share_code=f"u{i:05d}",
+            )
+            for i in range(start, stop)
+        )
+        past = Encounter.objects.bulk_create(
+            Encounter(
+                sphere=sphere,
+                creator=active_user,
+                title=f"Past {i}",
+                start_time=now - timedelta(hours=i + 1),
+                share_code=f"p{i:05d}",
+            )
+            for i in range(start, stop)
+        )
+        EncounterRSVP.objects.bulk_create(
+            [
+                *(
+                    EncounterRSVP(
+                        encounter=encounter, user=active_user, ip_address="127.0.0.1"
+                    )
+                    for encounter in upcoming
+                ),
+                *(
+                    EncounterRSVP(
+                        encounter=encounter, user=organizer, ip_address="127.0.0.1"
+                    )
+                    for encounter in past
+                ),
+            ]
+        )
+
+    return grow
+
+
+@pytest.fixture(name="grow_proposals")
+def grow_proposals_fixture(sphere, proposal_category, time_slot):
+    def grow(start, stop):
+        sessions = Session.objects.bulk_create(
+            Session(
+                sphere=sphere,
+                category=proposal_category,
+                display_name=f"Host {i}",
+                title=f"Proposal {i}",
+                slug=f"proposal-{i}",
+                participants_limit=10,
+                status=SessionStatus.PENDING,
+            )
+            for i in range(start, stop)
+        )
+        Session.time_slots.through.objects.bulk_create(
+            Session.time_slots.through(session=session, timeslot=time_slot)
+            for session in sessions
+        )
+
+    return grow
+
+
+class TestRepositoryQueryBudgets:
+    def test_list_sessions_by_event(self, event, grow_proposals):
+        assert_query_budget(
+            lambda: UnitOfWork().sessions.list_sessions_by_event(event.pk),
+            grow=grow_proposals,
+            budget=_SINGLE_QUERY,
+        )
+
+    def test_read_pending_by_event(self, event, grow_proposals):
+        assert_query_budget(
+            lambda: UnitOfWork().sessions.read_pending_by_event(event.pk),
+            grow=grow_proposals,
+            budget=_PENDING_BUDGET,
+        )
+
+    def test_list_unscheduled_by_event(self, event, grow_proposals):
+        assert_query_budget(
+            lambda: UnitOfWork().sessions.list_unscheduled_by_event(event.pk),
+            grow=grow_proposals,
+            budget=_SINGLE_QUERY,
+        )
+
+    def test_list_calendar_entries(self, event, grow_schedule):
+        assert_query_budget(
+            lambda: UnitOfWork().agenda_items.list_calendar_entries(event.pk),
+            grow=grow_schedule,
+            budget=_SINGLE_QUERY,
+        )
+
+    def test_read_schedule_rows(self, event, grow_schedule):
+        assert_query_budget(
+            lambda: UnitOfWork().schedule_rows.read_page(
+                ScheduleResource.SESSIONS,
+                event.pk,
+                SCHEDULE_API_FIELDS[ScheduleResource.SESSIONS],
+                after=None,
+                limit=SCHEDULE_API_MAX_PAGE_SIZE,
+            ),
+            grow=grow_schedule,
+            budget=_SCHEDULE_ROWS_BUDGET,
+        )
+
+
+class TestPageQueryBudgets:
+    def test_event_page(self, client, event, grow_schedule):
+        url = reverse("web:chronology:event", kwargs={"slug": event.slug})
+
+        def run():
+            assert client.get(url).status_code == HTTPStatus.OK
+
+        assert_query_budget(run, grow=grow_schedule, budget=_EVENT_PAGE_BUDGET)
+
+    def test_event_page_for_enrolled_user(
+        self,
+        authenticated_client,
+        active_user,
+        connected_user,
+        event,
+        enrollment_config,
+        grow_schedule,
+    ):
+        # An explicit user config keeps the membership API out of the request
+        UserEnrollmentConfig.objects.create(
+            enrollment_config=enrollment_config,
+            user_email=active_user.email,
+            allowed_slots=8,
+        )
+        url = reverse("web:chronology:event", kwargs={"slug": event.slug})
+
+        def grow(start, stop):
+            # The user's confirmed sessions all overlap; a connected user
+            # waits for each of them
+            grow_schedule(start, stop)
+            SessionParticipation.objects.bulk_create(
+                SessionParticipation(
+                    session=session,
+                    user=connected_user,
+                    status=SessionParticipationStatus.WAITING,
+                )
+                for session in Session.objects.filter(
+                    slug__in=[f"session-{i}" for i in range(start, stop)]
+                )
+            )
+
+        def run():
+            assert authenticated_client.get(url).status_code == HTTPStatus.OK
+
+        assert_query_budget(run, grow=grow, budget=_USER_EVENT_PAGE_BUDGET)
+
+    def test_timetable_overview(
+        self, authenticated_client, active_user, sphere, event, grow_timetable
+    ):
+        sphere.managers.add(active_user)
+        url = reverse("panel:timetable-overview", kwargs={"slug": event.slug})
+
+        def run():
+            assert authenticated_client.get(url).status_code == HTTPStatus.OK
+
+        assert_query_budget(run, grow=grow_timetable, budget=_TIMETABLE_PAGE_BUDGET)
+
+    def test_timetable_problems(
+        self, authenticated_client, active_user, sphere, event, grow_timetable
+    ):
+        sphere.managers.add(active_user)
+        url = reverse("panel:timetable-problems", kwargs={"slug": event.slug})
+
+        def run():
+            assert authenticated_client.get(url).status_code == HTTPStatus.OK
+
+        assert_query_budget(run, grow=grow_timetable, budget=_TIMETABLE_PAGE_BUDGET)
+
+    def test_notice_board_index(self, authenticated_client, grow_encounters):
+        url = reverse("web:notice-board:index")
+
+        def run():
+            assert authenticated_client.get(url).status_code == HTTPStatus.OK
+
+        assert_query_budget(run, grow=grow_encounters, budget=_NOTICE_BOARD_BUDGET)
+
+    def test_schedule_api_sessions(self, client, event, grow_schedule):
+        url = reverse("api:sessions", kwargs={"event_slug": event.slug})
+
+        def run():
+            assert client.get(url).status_code == HTTPStatus.OK
+
+        assert_query_budget(run, grow=grow_schedule, budget=_API_BUDGET)
+
+    def test_event_calendar_feed(self, client, event, grow_schedule):
+        url = reverse(
+            "web:chronology:event-calendar", kwargs={"event_slug": event.slug}
+        )
+
+        def run():
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            # The feed is built while it streams
+            b"".join(response.streaming_content)
+
+        assert_query_budget(run, grow=grow_schedule, budget=_CALENDAR_BUDGET)
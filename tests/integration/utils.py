@@ -1,11 +1,22 @@
+import json
+import threading
+import time
 from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import TYPE_CHECKING, Any
 from unittest.mock import ANY
+from urllib.parse import parse_qs, urlparse
 
 from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db import connection
+
+from ludamus.inits.instrumentation import RequestMetrics
+from ludamus.links.db.django.sphere_cache import sphere_domain_cache
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections import Counter
+    from collections.abc import Callable, Iterable, Sequence
 
     from django.http import HttpResponse
 
@@ -53,3 +64,94 @@ def assert_response_404(
         messages=messages,
         **response_fields,
     )
+
+
+QUERY_BUDGET_SIZES = (10, 500)
+
+
+def _describe_queries(fingerprints: Counter[str]) -> str:
+    return "\n".join(
+        f"  {count}x {statement}" for statement, count in fingerprints.most_common()
+    )
+
+
+def assert_query_budget(
+    run: Callable[[], object],
+    *,
+    grow: Callable[[int, int], object],
+    budget: int,
+    sizes: Sequence[int] = QUERY_BUDGET_SIZES,
+) -> None:
+    """Check that ``run`` stays within ``budget`` queries as the data grows.
+
+    ``grow(start, stop)`` adds the rows numbered ``start`` to ``stop - 1``. The
+    data is grown to each of ``sizes`` in turn and ``run`` is measured against
+    cold caches. Fails when any size needs more than ``budget`` queries, or
+    when the largest size needs more than the smallest, listing the SQL
+    fingerprints whose counts grew.
+    """
+    profiles: list[tuple[int, Counter[str]]] = []
+    seeded = 0
+    for size in sizes:
+        grow(seeded, size)
+        seeded = size
+        cache.clear()
+        sphere_domain_cache.clear()
+        metrics = RequestMetrics()
+        with connection.execute_wrapper(metrics):
+            run()
+        profiles.append((size, metrics.fingerprints()))
+
+    for size, fingerprints in profiles:
+        assert fingerprints.total() <= budget, (
+            f"{fingerprints.total()} queries at N={size}, budget is {budget}:\n"
+            + _describe_queries(fingerprints)
+        )
+    (small_size, small), (large_size, large) = profiles[0], profiles[-1]
+    assert not (grown := large - small), (
+        f"Queries grew from {small.total()} at N={small_size} to "
+        f"{large.total()} at N={large_size}:\n" + _describe_queries(grown)
+    )
+
+
+class MembershipStubServer(ThreadingHTTPServer):
+    """Local stand-in for the external membership API."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _MembershipStubHandler)
+        self.counts: dict[str, int] = {}
+        self.failing: set[str] = set()
+        self.delay = 0.0
+        self.hits: list[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/members"
+
+    def record(self, email: str) -> None:
+        with self._lock:
+            self.hits.append(email)
+
+
+class _MembershipStubHandler(BaseHTTPRequestHandler):
+    server: MembershipStubServer
+
+    def do_GET(self):
+        email = parse_qs(urlparse(self.path).query).get("email", [""])[0]
+        self.server.record(email)
+        time.sleep(self.server.delay)
+        if email in self.server.failing:
+            self.send_response(HTTPStatus.INTERNAL_SERVER_ERROR)
+            self.end_headers()
+            return
+        body = json.dumps({"membership_count": self.server.counts.get(email, 0)})
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
@@ -0,0 +1,152 @@
+"""Integration tests for the event's iCalendar feeds."""
+
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ludamus.adapters.db.django.models import (
+    SessionParticipation,
+    SessionParticipationStatus,
+)
+from tests.integration.conftest import AgendaItemFactory, SessionFactory
+
+_NOT_MODIFIED_QUERY_LIMIT = 1
+
+
+def _feed_url(event):
+    return reverse("web:chronology:event-calendar", kwargs={"event_slug": event.slug})
+
+
+def _content(response):
+    return b"".join(response.streaming_content).decode()
+
+
+def _personal_url(client, event):
+    response = client.get(
+        reverse("web:chronology:event-calendar-mine", kwargs={"event_slug": event.slug})
+    )
+    assert response.status_code == HTTPStatus.FOUND
+    return response.url
+
+
+class TestEventCalendarFeed:
+    @pytest.mark.usefixtures("agenda_item")
+    def test_lists_scheduled_sessions(self, client, event, session):
+        response = client.get(_feed_url(event))
+
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"] == "text/calendar; charset=utf-8"
+        content = _content(response)
+        assert content.startswith("BEGIN:VCALENDAR\r\n")
+        assert f"UID:session-{session.pk}@ludamus\r\n" in content
+        assert content.endswith("END:VCALENDAR\r\n")
+
+    @pytest.mark.usefixtures("agenda_item")
+    def test_not_modified_costs_one_query(self, client, event):
+        first = client.get(_feed_url(event))
+        _content(first)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(
+                _feed_url(event), headers={"if-none-match": first["ETag"]}
+            )
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response["ETag"] == first["ETag"]
+        assert len(ctx.captured_queries) <= _NOT_MODIFIED_QUERY_LIMIT
+
+    def test_schedule_change_is_served(self, client, event, agenda_item, space, sphere):
+        first = client.get(_feed_url(event))
+        _content(first)
+        added = AgendaItemFactory(
+            session=SessionFactory(sphere=sphere, title="Added later"), space=space
+        )
+
+        response = client.get(
+            _feed_url(event), headers={"if-none-match": first["ETag"]}
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        content = _content(response)
+        assert f"UID:session-{added.session_id}@ludamus" in content
+        assert f"UID:session-{agenda_item.session_id}@ludamus" in content
+
+    def test_unpublished_event_is_not_found(self, client, event):
+        event.publication_time = None
+        event.save()
+
+        response = client.get(_feed_url(event))
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+class TestPersonalCalendarFeed:
+    def test_lists_only_enrolled_sessions(
+        self, authenticated_client, active_user, event, agenda_item, space, sphere
+    ):
+        other = AgendaItemFactory(session=SessionFactory(sphere=sphere), space=space)
+        SessionParticipation.objects.create(
+            session=agenda_item.session,
+            user=active_user,
+            status=SessionParticipationStatus.CONFIRMED,
+        )
+        url = _personal_url(authenticated_client, event)
+
+        response = authenticated_client.get(url)
+
+        content = _content(response)
+        assert f"UID:session-{agenda_item.session_id}@ludamus" in content
+        assert f"UID:session-{other.session_id}@ludamus" not in content
+        assert "private" in response["Cache-Control"]
+
+    def test_includes_connected_users_enrollments(
+        self, authenticated_client, connected_user, event, agenda_item
+    ):
+        SessionParticipation.objects.create(
+            session=agenda_item.session,
+            user=connected_user,
+            status=SessionParticipationStatus.CONFIRMED,
+        )
+
+        response = authenticated_client.get(_personal_url(authenticated_client, event))
+
+        assert f"UID:session-{agenda_item.session_id}@ludamus" in _content(response)
+
+    def test_feed_works_without_login(
+        self, authenticated_client, active_user, event, agenda_item
+    ):
+        SessionParticipation.objects.create(
+            session=agenda_item.session,
+            user=active_user,
+            status=SessionParticipationStatus.CONFIRMED,
+        )
+        url = _personal_url(authenticated_client, event)
+        authenticated_client.logout()
+
+        response = authenticated_client.get(url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert f"UID:session-{agenda_item.session_id}@ludamus" in _content(response)
+
+    def test_tampered_token_is_not_found(self, client, event):
+        url = reverse(
+            "web:chronology:event-calendar-personal",
+            kwargs={"event_slug": event.slug, "token": "1:forged"},
+        )
+
+        response = client.get(url)
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_link_requires_login(self, client, event):
+        response = client.get(
+            reverse(
+                "web:chronology:event-calendar-mine", kwargs={"event_slug": event.slug}
+            )
+        )
+
+        assert response.status_code == HTTPStatus.FOUND
+        assert "calendar" not in response.url.split("?")[0]
@@ -0,0 +1,134 @@
+"""Conditional GETs of the public event page and its HTMX parts."""
+
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ludamus.adapters.db.django.models import (
+    SessionParticipation,
+    SessionParticipationStatus,
+)
+from tests.integration.conftest import EnrollmentConfigFactory
+
+_NOT_MODIFIED_QUERY_LIMIT = 2
+# Loading the session and the logged-in user happens before any view runs
+_AUTHENTICATION_QUERIES = 2
+
+
+def _url(event):
+    return reverse("web:chronology:event", kwargs={"slug": event.slug})
+
+
+def _revalidate(client, url, response):
+    return client.get(url, headers={"if-none-match": response.headers["ETag"]})
+
+
+class TestEventPageConditionalGet:
+    def test_sends_validators(self, client, event):
+        response = client.get(_url(event))
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["ETag"]
+        assert response.headers["Last-Modified"]
+        assert "private" in response.headers["Cache-Control"]
+        assert "no-cache" in response.headers["Cache-Control"]
+
+    @pytest.mark.usefixtures("agenda_item")
+    def test_not_modified_skips_page_build(self, client, event):
+        first = client.get(_url(event))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = _revalidate(client, _url(event), first)
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response.headers["ETag"] == first.headers["ETag"]
+        assert len(ctx.captured_queries) <= _NOT_MODIFIED_QUERY_LIMIT
+
+    @pytest.mark.usefixtures("agenda_item")
+    def test_not_modified_for_authenticated_user(self, authenticated_client, event):
+        first = authenticated_client.get(_url(event))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = _revalidate(authenticated_client, _url(event), first)
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert (
+            len(ctx.captured_queries)
+            <= _NOT_MODIFIED_QUERY_LIMIT + _AUTHENTICATION_QUERIES
+        )
+
+    @pytest.mark.usefixtures("agenda_item")
+    def test_enrollment_changes_page(self, client, event, session, connected_user):
+        first = client.get(_url(event))
+        SessionParticipation.objects.create(
+            session=session,
+            user=connected_user,
+            status=SessionParticipationStatus.CONFIRMED,
+        )
+
+        response = _revalidate(client, _url(event), first)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["ETag"] != first.headers["ETag"]
+
+    def test_agenda_change_changes_page(self, client, event, agenda_item):
+        first = client.get(_url(event))
+        agenda_item.delete()
+
+        response = _revalidate(client, _url(event), first)
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_enrollment_config_change_changes_page(self, client, event):
+        first = client.get(_url(event))
+        EnrollmentConfigFactory(event=event)
+
+        response = _revalidate(client, _url(event), first)
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_other_user_gets_own_page(self, client, active_user, event):
+        first = client.get(_url(event))
+        client.force_login(active_user)
+
+        response = _revalidate(client, _url(event), first)
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_user_change_changes_page(self, authenticated_client, active_user, event):
+        first = authenticated_client.get(_url(event))
+        active_user.name = "Renamed"
+        active_user.save()
+
+        response = _revalidate(authenticated_client, _url(event), first)
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_unpublished_event_sends_no_validators(self, client, event):
+        event.publication_time = None
+        event.save()
+
+        response = client.get(_url(event))
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert "ETag" not in response.headers
+
+
+class TestUserDiscordUsernameConditionalGet:
+    def test_not_modified_until_username_changes(self, client, active_user):
+        active_user.discord_username = "first#1234"
+        active_user.save()
+        url = reverse("web:crowd:user-discord-username", args=[active_user.slug])
+        first = client.get(url)
+
+        unchanged = _revalidate(client, url, first)
+        active_user.discord_username = "second#1234"
+        active_user.save()
+        changed = _revalidate(client, url, first)
+
+        assert unchanged.status_code == HTTPStatus.NOT_MODIFIED
+        assert changed.status_code == HTTPStatus.OK
+        assert b"second#1234" in changed.content
@@ -0,0 +1,137 @@
+"""Performance tests for the public event page — bounded query counts at scale."""
+
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ludamus.adapters.db.django.models import (
+    AgendaItem,
+    EnrollmentConfig,
+    Session,
+    SessionField,
+    SessionFieldValue,
+    SessionParticipation,
+    SessionParticipationStatus,
+    UserEnrollmentConfig,
+)
+from tests.integration.conftest import UserFactory
+
+_EVENT_PAGE_QUERY_LIMIT = 40
+_SESSION_COUNT = 500
+
+
+def _schedule_sessions(event, space, sphere, users, count, offset=0):
+    start = datetime.now(UTC) + timedelta(days=1)
+    sessions = Session.objects.bulk_create(
+        Session(
+            sphere=sphere,
+            presenter=users[i % len(users)] if i % 2 else None,
+            display_name=f"Host {i}",
+            title=f"Session {i}",
+            slug=f"session-{i}",
+            participants_limit=10,
+        )
+        for i in range(offset, offset + count)
+    )
+    AgendaItem.objects.bulk_create(
+        AgendaItem(
+            session=session,
+            space=space,
+            start_time=start + timedelta(hours=i % 24),
+            end_time=start + timedelta(hours=i % 24 + 1),
+        )
+        for i, session in enumerate(sessions)
+    )
+    SessionParticipation.objects.bulk_create(
+        SessionParticipation(
+            session=session,
+            user=user,
+            status=(
+                SessionParticipationStatus.CONFIRMED
+                if j == 0
+                else SessionParticipationStatus.WAITING
+            ),
+        )
+        for session in sessions
+        for j, user in enumerate(users)
+    )
+    field = SessionField.objects.get(event=event, slug="system")
+    SessionFieldValue.objects.bulk_create(
+        SessionFieldValue(session=session, field=field, value="Other")
+        for session in sessions
+    )
+
+
+@pytest.fixture(name="event_page_setup")
+def event_page_setup_fixture(event, space, sphere, active_user):
+    now = datetime.now(UTC)
+    config = EnrollmentConfig.objects.create(
+        event=event,
+        start_time=now - timedelta(days=1),
+        end_time=now + timedelta(days=30),
+        percentage_slots=50,
+    )
+    # An explicit user config keeps the membership API out of the request.
+    UserEnrollmentConfig.objects.create(
+        enrollment_config=config, user_email=active_user.email, allowed_slots=3
+    )
+    SessionField.objects.create(
+        event=event,
+        name="System",
+        question="System",
+        slug="system",
+        field_type="select",
+        is_public=True,
+    )
+    users = [active_user, UserFactory(), UserFactory()]
+    return {"event": event, "space": space, "sphere": sphere, "users": users}
+
+
+def _count_queries(client, event):
+    url = reverse("web:chronology:event", kwargs={"slug": event.slug})
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.context["sessions"]) > 0
+    return len(ctx.captured_queries)
+
+
+class TestEventPageQueryBounds:
+    def test_event_page_bounded_queries_at_scale(
+        self, authenticated_client, event_page_setup
+    ):
+        """Event page with 500 sessions should use a bounded number of queries."""
+        _schedule_sessions(
+            event_page_setup["event"],
+            event_page_setup["space"],
+            event_page_setup["sphere"],
+            event_page_setup["users"],
+            _SESSION_COUNT,
+        )
+
+        count = _count_queries(authenticated_client, event_page_setup["event"])
+
+        assert (
+            count <= _EVENT_PAGE_QUERY_LIMIT
+        ), f"Event page used {count} queries, expected ≤ {_EVENT_PAGE_QUERY_LIMIT}"
+
+    def test_event_page_queries_do_not_grow_with_sessions(
+        self, authenticated_client, event_page_setup
+    ):
+        """Adding sessions must not add per-session queries."""
+        setup = event_page_setup
+        args = (setup["event"], setup["space"], setup["sphere"], setup["users"])
+        _schedule_sessions(*args, count=5)
+        small = _count_queries(authenticated_client, setup["event"])
+
+        _schedule_sessions(*args, count=_SESSION_COUNT - 5, offset=5)
+        large = _count_queries(authenticated_client, setup["event"])
+
+        assert large <= small, (
+            f"Event page used {large} queries for {_SESSION_COUNT} sessions "
+            f"and {small} for 5"
+        )
@@ -0,0 +1,194 @@
+"""Integration tests for the read-only JSON schedule API."""
+
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ludamus.adapters.db.django.models import (
+    SessionField,
+    SessionFieldValue,
+    SessionParticipation,
+    SessionParticipationStatus,
+)
+from ludamus.pacts import SCHEDULE_API_FIELDS, ScheduleResource
+from tests.integration.conftest import AgendaItemFactory, SessionFactory
+
+_PAGE = 2
+_MANY_SESSIONS = 12
+
+
+def _url(name, event=None, **params):
+    kwargs = {} if event is None else {"event_slug": event.slug}
+    url = reverse(f"api:{name}", kwargs=kwargs)
+    if params:
+        url += "?" + "&".join(f"{key}={value}" for key, value in params.items())
+    return url
+
+
+def _schedule(sphere, space, count):
+    return [
+        AgendaItemFactory(session=SessionFactory(sphere=sphere), space=space)
+        for _ in range(count)
+    ]
+
+
+class TestEventList:
+    def test_lists_published_events(self, client, event):
+        response = client.get(_url("events"))
+
+        assert response.status_code == HTTPStatus.OK
+        (row,) = response.json()["data"]
+        assert row["id"] == event.pk
+        assert set(row) == set(SCHEDULE_API_FIELDS[ScheduleResource.EVENTS])
+
+    def test_hides_unpublished_events(self, client, event):
+        event.publication_time = None
+        event.save()
+
+        response = client.get(_url("events"))
+
+        assert response.json() == {"data": [], "next": None}
+
+    @pytest.mark.usefixtures("event")
+    def test_answers_conditional_get(self, client):
+        first = client.get(_url("events"))
+
+        response = client.get(_url("events"), headers={"if-none-match": first["ETag"]})
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+class TestEventSchedule:
+    @pytest.mark.usefixtures("agenda_item")
+    def test_lists_every_resource_with_its_fields(self, client, event):
+        for resource in (
+            ScheduleResource.SPACES,
+            ScheduleResource.AGENDA,
+            ScheduleResource.SESSIONS,
+        ):
+            response = client.get(_url(resource, event))
+
+            assert response.status_code == HTTPStatus.OK
+            (row,) = response.json()["data"]
+            assert set(row) == set(SCHEDULE_API_FIELDS[resource])
+
+    @pytest.mark.usefixtures("agenda_item")
+    def test_session_rows(self, client, event, session, connected_user):
+        SessionParticipation.objects.create(
+            session=session,
+            user=connected_user,
+            status=SessionParticipationStatus.CONFIRMED,
+        )
+        public = SessionField.objects.create(
+            event=event, name="System", question="?", slug="system", is_public=True
+        )
+        private = SessionField.objects.create(
+            event=event, name="Notes", question="?", slug="notes"
+        )
+        SessionFieldValue.objects.create(session=session, field=public, value="Dnd")
+        SessionFieldValue.objects.create(session=session, field=private, value="x")
+
+        response = client.get(_url("sessions", event))
+
+        (row,) = response.json()["data"]
+        assert row["id"] == session.pk
+        assert row["title"] == session.title
+        assert row["enrolled_count"] == 1
+        assert row["field_values"] == {"system": "Dnd"}
+
+    @pytest.mark.usefixtures("agenda_item")
+    def test_projects_requested_fields(self, client, event):
+        response = client.get(_url("sessions", event, fields="title,host"))
+
+        (row,) = response.json()["data"]
+        assert set(row) == {"id", "title", "host"}
+
+    def test_rejects_unknown_fields(self, client, event):
+        response = client.get(_url("sessions", event, fields="title,password"))
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert "password" in response.json()["error"]
+
+    def test_rejects_bad_limit_and_cursor(self, client, event):
+        bad_limit = client.get(_url("agenda", event, limit=0))
+        bad_cursor = client.get(_url("agenda", event, cursor="!"))
+
+        assert bad_limit.status_code == HTTPStatus.BAD_REQUEST
+        assert bad_cursor.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_cursor_walks_every_row_once(self, client, event, space, sphere):
+        items = _schedule(sphere, space, _PAGE * 2 + 1)
+        seen = []
+        url = _url("agenda", event, limit=_PAGE, fields="id")
+
+        while url:
+            body = client.get(url).json()
+            seen.extend(row["id"] for row in body["data"])
+            url = body["next"]
+
+        assert seen == sorted(item.pk for item in items)
+
+    def test_page_query_count_does_not_grow_with_rows(
+        self, client, event, space, sphere
+    ):
+        _schedule(sphere, space, 1)
+        with CaptureQueriesContext(connection) as few:
+            client.get(_url("sessions", event))
+        _schedule(sphere, space, _MANY_SESSIONS)
+
+        with CaptureQueriesContext(connection) as many:
+            response = client.get(_url("sessions", event))
+
+        assert len(response.json()["data"]) == _MANY_SESSIONS + 1
+        assert len(many.captured_queries) == len(few.captured_queries)
+
+    @pytest.mark.usefixtures("agenda_item")
+    def test_not_modified_until_schedule_changes(self, client, event, space, sphere):
+        url = _url("agenda", event)
+        first = client.get(url)
+
+        unchanged = client.get(url, headers={"if-none-match": first["ETag"]})
+        _schedule(sphere, space, 1)
+        changed = client.get(url, headers={"if-none-match": first["ETag"]})
+
+        assert unchanged.status_code == HTTPStatus.NOT_MODIFIED
+        assert changed.status_code == HTTPStatus.OK
+        assert len(changed.json()["data"]) == _PAGE
+
+    def test_space_rename_changes_etag(self, client, event, space):
+        url = _url("spaces", event)
+        first = client.get(url)
+        space.name = "Renamed"
+        space.save()
+
+        response = client.get(url, headers={"if-none-match": first["ETag"]})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["data"][0]["name"] == "Renamed"
+
+    def test_hiding_a_field_changes_etag(self, client, event, session):
+        field = SessionField.objects.create(
+            event=event, name="System", question="?", slug="system", is_public=True
+        )
+        SessionFieldValue.objects.create(session=session, field=field, value="Dnd")
+        url = _url("sessions", event)
+        first = client.get(url)
+        field.is_public = False
+        field.save()
+
+        response = client.get(url, headers={"if-none-match": first["ETag"]})
+
+        assert first.json()["data"][0]["field_values"] == {"system": "Dnd"}
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["data"][0]["field_values"] == {}
+
+    def test_unpublished_event_is_not_found(self, client, event):
+        event.publication_time = None
+        event.save()
+
+        response = client.get(_url("sessions", event))
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
@@ -3,6 +3,8 @@ from unittest.mock import ANY, Mock, patch
 
 import pytest
 from django.contrib import messages
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from ludamus.adapters.db.django.models import (
@@ -20,6 +22,7 @@ from tests.integration.conftest import (
     SessionFactory,
     SpaceFactory,
     TimeSlotFactory,
+    UserFactory,
 )
 from tests.integration.utils import assert_response
 
@@ -1512,3 +1515,47 @@ class TestSessionEnrollPageView:
             },
             template_name="chronology/enroll_select.html",
         )
+
+    def test_get_queries_do_not_grow_with_connected_users(
+        self, active_user, agenda_item, authenticated_client, enrollment_config
+    ):
+        # An explicit user config keeps the membership API out of the request.
+        UserEnrollmentConfig.objects.create(
+            enrollment_config=enrollment_config,
+            user_email=active_user.email,
+            allowed_slots=8,
+        )
+        other_session = SessionFactory(sphere=agenda_item.session.sphere)
+        AgendaItemFactory(
+            session=other_session,
+            space=agenda_item.space,
+            start_time=agenda_item.start_time,
+            end_time=agenda_item.end_time,
+        )
+
+        def add_connected_users(count):
+            for _ in range(count):
+                user = UserFactory(user_type="connected", manager=active_user)
+                SessionParticipation.objects.create(
+                    user=user,
+                    session=other_session,
+                    status=SessionParticipationStatus.CONFIRMED,
+                )
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                response = authenticated_client.get(
+                    self._get_url(agenda_item.session.pk)
+                )
+            assert response.status_code == HTTPStatus.OK
+            return len(ctx.captured_queries)
+
+        add_connected_users(1)
+        few = count_queries()
+        add_connected_users(6)
+        many = count_queries()
+
+        assert many <= few, (
+            f"Enrollment form used {many} queries for 7 connected users "
+            f"and {few} for 1"
+        )
@@ -2,10 +2,12 @@ from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
 from unittest.mock import ANY
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from ludamus.gates.web.django.notice_board.views import SAMPLE_COUNT
-from ludamus.pacts import EncounterDTO, EncounterIndexItem
+from ludamus.pacts import ENCOUNTER_PAST_PAGE_SIZE, EncounterDTO, EncounterIndexItem
 from tests.integration.conftest import (
     EncounterFactory,
     EncounterRSVPFactory,
@@ -37,6 +39,8 @@ class TestEncountersIndexPageView:
             context_data={
                 "upcoming_encounters": [],
                 "past_encounters": [],
+                "past_before": None,
+                "past_next_before": None,
                 "view": ANY,
             },
             template_name=["notice_board/index.html"],
@@ -69,6 +73,8 @@ class TestEncountersIndexPageView:
                     )
                 ],
                 "past_encounters": [],
+                "past_before": None,
+                "past_next_before": None,
                 "view": ANY,
             },
             template_name=["notice_board/index.html"],
@@ -101,6 +107,8 @@ class TestEncountersIndexPageView:
                     )
                 ],
                 "past_encounters": [],
+                "past_before": None,
+                "past_next_before": None,
                 "view": ANY,
             },
             template_name=["notice_board/index.html"],
@@ -124,6 +132,8 @@ class TestEncountersIndexPageView:
             context_data={
                 "upcoming_encounters": [],
                 "past_encounters": [],
+                "past_before": None,
+                "past_next_before": None,
                 "view": ANY,
             },
             template_name=["notice_board/index.html"],
@@ -156,6 +166,8 @@ class TestEncountersIndexPageView:
                         organizer_name="Past Organizer",
                     )
                 ],
+                "past_before": None,
+                "past_next_before": None,
                 "view": ANY,
             },
             template_name=["notice_board/index.html"],
@@ -186,7 +198,69 @@ class TestEncountersIndexPageView:
                         organizer_name="",
                     )
                 ],
+                "past_before": None,
+                "past_next_before": None,
                 "view": ANY,
             },
             template_name=["notice_board/index.html"],
         )
+
+    def test_past_encounters_are_paginated(
+        self, authenticated_client, active_user, sphere
+    ):
+        now = datetime.now(UTC)
+        encounters = [
+            EncounterFactory(
+                creator=active_user, sphere=sphere, start_time=now - timedelta(days=i)
+            )
+            for i in range(1, ENCOUNTER_PAST_PAGE_SIZE + 2)
+        ]
+
+        response = authenticated_client.get(self.URL)
+
+        first_page = response.context_data["past_encounters"]
+        assert len(first_page) == ENCOUNTER_PAST_PAGE_SIZE
+        assert response.context_data["past_next_before"] == first_page[-1].encounter.pk
+
+        response = authenticated_client.get(
+            self.URL, {"past_before": response.context_data["past_next_before"]}
+        )
+
+        second_page = response.context_data["past_encounters"]
+        assert [item.encounter.pk for item in second_page] == [encounters[-1].pk]
+        assert response.context_data["past_next_before"] is None
+
+    def test_query_count_does_not_grow_with_encounters(
+        self, authenticated_client, active_user, sphere
+    ):
+        def index_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                authenticated_client.get(self.URL)
+            return len(ctx.captured_queries)
+
+        now = datetime.now(UTC)
+        other_user = UserFactory(name="Other Organizer")
+        EncounterRSVPFactory(
+            encounter=EncounterFactory(
+                creator=other_user, sphere=sphere, start_time=now + timedelta(days=1)
+            ),
+            user=active_user,
+        )
+        index_queries()  # warm request-independent caches
+        baseline = index_queries()
+        for days in range(2, 6):
+            EncounterRSVPFactory(
+                encounter=EncounterFactory(
+                    creator=other_user,
+                    sphere=sphere,
+                    start_time=now + timedelta(days=days),
+                ),
+                user=active_user,
+            )
+            EncounterFactory(
+                creator=active_user,
+                sphere=sphere,
+                start_time=now - timedelta(days=days),
+            )
+
+        assert index_queries() == baseline
@@ -94,6 +94,21 @@ class TestProposalRejectActionView:
         session.refresh_from_db()
         assert session.status == "rejected"
 
+    def test_post_refreshes_cached_header_stats(
+        self, authenticated_client, active_user, sphere, event
+    ):
+        sphere.managers.add(active_user)
+        session = _make_session(event, sphere)
+        proposals_url = reverse("panel:proposals", kwargs={"slug": event.slug})
+        before = authenticated_client.get(proposals_url)
+
+        authenticated_client.post(self.get_url(event, session.pk))
+
+        after = authenticated_client.get(proposals_url)
+        assert before.context["stats"]["pending_proposals"] == 1
+        assert after.context["stats"]["pending_proposals"] == 0
+        assert after.context["stats"]["total_proposals"] == 1
+
     def test_post_redirects_when_proposal_not_found(
         self, authenticated_client, active_user, sphere, event
     ):
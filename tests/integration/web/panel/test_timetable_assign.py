@@ -4,7 +4,7 @@ from http import HTTPStatus
 from django.contrib import messages
 from django.urls import reverse
 
-from ludamus.adapters.db.django.models import AgendaItem
+from ludamus.adapters.db.django.models import AgendaItem, TimeSlot
 from ludamus.pacts.chronology import TIMETABLE_SLOT_MINUTES, TimetableGridDTO
 from tests.integration.conftest import (
     AgendaItemFactory,
@@ -180,6 +180,44 @@ class TestTimetableAssignView:
         session.refresh_from_db()
         assert session.status == "scheduled"
 
+    def test_assignment_invalidates_cached_grid(
+        self, authenticated_client, active_user, sphere, event, proposal_category, area
+    ):
+        sphere.managers.add(active_user)
+        space = SpaceFactory(area=area)
+        TimeSlot.objects.create(
+            event=event,
+            start_time=event.start_time,
+            end_time=event.start_time + timedelta(hours=4),
+        )
+        session = SessionFactory(
+            category=proposal_category,
+            sphere=sphere,
+            status="pending",
+            participants_limit=10,
+            min_age=0,
+        )
+        grid_url = reverse("panel:timetable-grid-part", kwargs={"slug": event.slug})
+        authenticated_client.get(grid_url)
+
+        authenticated_client.post(
+            self.get_url(event),
+            {
+                "session_pk": session.pk,
+                "space_pk": space.pk,
+                "start_time": event.start_time.isoformat(),
+                "end_time": (event.start_time + timedelta(hours=1)).isoformat(),
+            },
+        )
+        response = authenticated_client.get(grid_url)
+
+        grid = response.context["grid"]
+        assert [
+            position.agenda_item.session_id
+            for column in grid.columns
+            for position in column.sessions
+        ] == [session.pk]
+
     def test_returns_422_for_rejected_session(
         self, authenticated_client, active_user, sphere, event, proposal_category, area
     ):
@@ -142,6 +142,29 @@ class TestTimetableOverviewPageView:
         assert progress[0].accepted_count == 1
         assert progress[0].scheduled_count == 0
 
+    def test_track_progress_follows_track_edits(
+        self, authenticated_client, active_user, sphere, event, proposal_category
+    ):
+        sphere.managers.add(active_user)
+        track = Track.objects.create(event=event, name="Old name", slug="track")
+        session = SessionFactory(
+            category=proposal_category,
+            sphere=sphere,
+            status="pending",
+            participants_limit=5,
+            min_age=0,
+        )
+        authenticated_client.get(self.get_url(event))
+
+        track.name = "New name"
+        track.save()
+        session.tracks.add(track)
+        response = authenticated_client.get(self.get_url(event))
+
+        progress = response.context["track_progress"]
+        assert progress[0].track_name == "New name"
+        assert progress[0].accepted_count == 1
+
     def test_heatmap_shows_scheduled_cell_status(
         self,
         authenticated_client,
@@ -1,14 +1,19 @@
 """Performance tests for timetable views — bounded query counts at scale."""
 
+from datetime import timedelta
 from http import HTTPStatus
 
 from django.db import connection
 from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from ludamus.adapters.db.django.models import AgendaItem, Track
+from tests.integration.conftest import UserFactory
+
 _GRID_QUERY_LIMIT = 30
 _CONFLICT_QUERY_LIMIT = 100
 _OVERVIEW_QUERY_LIMIT = 100
+_MANY_TRACKS = 30
 
 
 class TestTimetableQueryBounds:
@@ -46,6 +51,33 @@ class TestTimetableQueryBounds:
             f"expected ≤ {_CONFLICT_QUERY_LIMIT}"
         )
 
+    def test_conflict_detection_queries_do_not_grow_with_conflicts(
+        self, authenticated_client, active_user, sphere, timetable_scale_data
+    ):
+        """Scheduling more clashing sessions must not add per-item queries."""
+        event = timetable_scale_data["event"]
+        space = timetable_scale_data["spaces"][0]
+        sphere.managers.add(active_user)
+        url = reverse("panel:timetable-conflicts-part", kwargs={"slug": event.slug})
+
+        with CaptureQueriesContext(connection) as baseline:
+            authenticated_client.get(url)
+        for session in timetable_scale_data["sessions"][10:]:
+            AgendaItem.objects.create(
+                session=session,
+                space=space,
+                start_time=event.start_time,
+                end_time=event.start_time + timedelta(hours=1),
+            )
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert len(ctx.captured_queries) <= len(baseline.captured_queries), (
+            f"Conflict detection used {len(ctx.captured_queries)} queries with "
+            f"overlaps, {len(baseline.captured_queries)} without"
+        )
+
     def test_overview_bounded_queries(
         self, authenticated_client, active_user, sphere, timetable_scale_data
     ):
@@ -62,3 +94,30 @@ class TestTimetableQueryBounds:
             f"Overview used {len(ctx.captured_queries)} queries, "
             f"expected ≤ {_OVERVIEW_QUERY_LIMIT}"
         )
+
+    def test_overview_queries_do_not_grow_with_tracks(
+        self, authenticated_client, active_user, sphere, timetable_scale_data
+    ):
+        """Track progress must not add per-track queries."""
+        event = timetable_scale_data["event"]
+        sessions = timetable_scale_data["sessions"]
+        sphere.managers.add(active_user)
+        url = reverse("panel:timetable-overview", kwargs={"slug": event.slug})
+
+        with CaptureQueriesContext(connection) as baseline:
+            authenticated_client.get(url)
+        for idx in range(_MANY_TRACKS):
+            track = Track.objects.create(
+                event=event, name=f"Track {idx}", slug=f"track-{idx}"
+            )
+            track.sessions.add(*sessions[idx % 10 : idx % 10 + 5])
+            track.managers.add(UserFactory())
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.context["track_progress"]) == _MANY_TRACKS
+        assert len(ctx.captured_queries) <= len(baseline.captured_queries), (
+            f"Overview used {len(ctx.captured_queries)} queries with tracks, "
+            f"{len(baseline.captured_queries)} without"
+        )
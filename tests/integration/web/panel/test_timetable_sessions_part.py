@@ -1,10 +1,12 @@
 from datetime import timedelta
 from http import HTTPStatus
+from unittest.mock import ANY
 
 import pytest
 from django.contrib import messages
 from django.urls import reverse
 
+from ludamus.adapters.db.django.models import Session
 from ludamus.pacts import UNSCHEDULED_LIST_LIMIT
 from tests.integration.conftest import (
     AgendaItemFactory,
@@ -15,6 +17,7 @@ from tests.integration.conftest import (
 from tests.integration.utils import assert_response
 
 PERMISSION_ERROR = "You don't have permission to access the backoffice panel."
+LONG_SESSION_MINUTES = 90
 
 
 class TestTimetableSessionListPartView:
@@ -72,6 +75,7 @@ class TestTimetableSessionListPartView:
             context_data={
                 "sessions": [],
                 "has_more": False,
+                "next_after": None,
                 "limit": UNSCHEDULED_LIST_LIMIT,
                 "categories": [],
                 "search": "",
@@ -241,3 +245,95 @@ class TestTimetableSessionListPartView:
         assert len(response.context["sessions"]) == UNSCHEDULED_LIST_LIMIT
         assert response.context["has_more"] is True
         assert response.context["limit"] == UNSCHEDULED_LIST_LIMIT
+        assert response.context["next_after"] == response.context["sessions"][-1]
+        assert f"{UNSCHEDULED_LIST_LIMIT}+ sessions" in response.content.decode()
+
+    def test_load_more_returns_next_page(
+        self, authenticated_client, active_user, sphere, event, proposal_category
+    ):
+        sphere.managers.add(active_user)
+        sessions = [
+            SessionFactory(
+                category=proposal_category,
+                sphere=sphere,
+                status="pending",
+                title=f"Session {index:03d}",
+                participants_limit=10,
+                min_age=0,
+            )
+            for index in range(UNSCHEDULED_LIST_LIMIT + 1)
+        ]
+        first_page = authenticated_client.get(self.get_url(event))
+        last = first_page.context["next_after"]
+
+        response = authenticated_client.get(
+            self.get_url(event), {"after": last.pk, "after_title": last.title}
+        )
+
+        assert_response(
+            response,
+            HTTPStatus.OK,
+            template_name="panel/parts/timetable-session-list-page.html",
+            context_data={
+                "sessions": [ANY],
+                "next_after": None,
+                "search": "",
+                "category_pk": None,
+                "max_duration_minutes": None,
+                "filter_track_pk": None,
+                "slug": event.slug,
+            },
+        )
+        assert response.context["sessions"][0].pk == sessions[-1].pk
+
+    def test_load_more_survives_deleting_the_cursor_session(
+        self, authenticated_client, active_user, sphere, event, proposal_category
+    ):
+        sphere.managers.add(active_user)
+        sessions = [
+            SessionFactory(
+                category=proposal_category,
+                sphere=sphere,
+                status="pending",
+                title=f"Session {index:03d}",
+                participants_limit=10,
+                min_age=0,
+            )
+            for index in range(UNSCHEDULED_LIST_LIMIT + 1)
+        ]
+        last = authenticated_client.get(self.get_url(event)).context["next_after"]
+        Session.objects.filter(pk=last.pk).delete()
+
+        response = authenticated_client.get(
+            self.get_url(event), {"after": last.pk, "after_title": last.title}
+        )
+
+        assert [s.pk for s in response.context["sessions"]] == [sessions[-1].pk]
+
+    def test_max_duration_filters_by_stored_minutes(
+        self, authenticated_client, active_user, sphere, event, proposal_category
+    ):
+        sphere.managers.add(active_user)
+        short = SessionFactory(
+            category=proposal_category,
+            sphere=sphere,
+            status="pending",
+            duration="PT45M",
+            participants_limit=10,
+            min_age=0,
+        )
+        long = SessionFactory(
+            category=proposal_category,
+            sphere=sphere,
+            status="pending",
+            duration="PT1H30M",
+            participants_limit=10,
+            min_age=0,
+        )
+
+        response = authenticated_client.get(self.get_url(event), {"max_duration": "60"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert [s.pk for s in response.context["sessions"]] == [short.pk]
+        long.refresh_from_db()
+        assert long.duration_minutes == LONG_SESSION_MINUTES
@@ -0,0 +1,199 @@
+"""Integration tests for /panel/event/<slug>/venues/do/copy-layout page."""
+
+from datetime import timedelta
+from http import HTTPStatus
+from unittest.mock import ANY
+
+from django.contrib import messages
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ludamus.adapters.db.django.models import Area, Space, TimeSlot, Track, Venue
+from ludamus.links.db.django.repositories import VenueRepository
+from ludamus.pacts import EventDTO
+from tests.integration.conftest import EventFactory, UserFactory
+from tests.integration.utils import assert_response
+
+PERMISSION_ERROR = "You don't have permission to access the backoffice panel."
+_SPACES_PER_AREA = 30
+_STATS = {
+    "hosts_count": 0,
+    "pending_proposals": 0,
+    "rooms_count": 0,
+    "scheduled_sessions": 0,
+    "total_proposals": 0,
+    "total_sessions": 0,
+}
+
+
+def _layout(event, spaces_per_area=2):
+    venue = Venue.objects.create(event=event, name="Main Hall", slug="main-hall")
+    area = Area.objects.create(venue=venue, name="Ground Floor", slug="ground-floor")
+    spaces = [
+        Space.objects.create(area=area, name=f"Room {i}", slug=f"room-{i}")
+        for i in range(spaces_per_area)
+    ]
+    track = Track.objects.create(event=event, name="RPG", slug="rpg")
+    track.spaces.add(spaces[0])
+    return venue, track
+
+
+class TestVenueLayoutCopyPageView:
+    """Tests for /panel/event/<slug>/venues/do/copy-layout page."""
+
+    @staticmethod
+    def get_url(event):
+        return reverse("panel:venues-copy-layout", kwargs={"slug": event.slug})
+
+    def test_get_redirects_non_manager_user(self, authenticated_client, event):
+        response = authenticated_client.get(self.get_url(event))
+
+        assert_response(
+            response,
+            HTTPStatus.FOUND,
+            messages=[(messages.ERROR, PERMISSION_ERROR)],
+            url="/",
+        )
+
+    def test_get_shows_form_for_manager(
+        self, authenticated_client, active_user, sphere, event
+    ):
+        sphere.managers.add(active_user)
+        source = EventFactory(name="Last Year", slug="last-year", sphere=sphere)
+
+        response = authenticated_client.get(self.get_url(event))
+
+        events = sorted(
+            [EventDTO.model_validate(event), EventDTO.model_validate(source)],
+            key=lambda e: e.start_time,
+            reverse=True,
+        )
+        assert_response(
+            response,
+            HTTPStatus.OK,
+            context_data={
+                "active_nav": "venues",
+                "current_event": EventDTO.model_validate(event),
+                "events": events,
+                "form": ANY,
+                "is_proposal_active": False,
+                "stats": _STATS,
+            },
+            template_name="panel/venue-layout-copy.html",
+        )
+
+    def test_get_redirects_when_no_other_events_available(
+        self, authenticated_client, active_user, sphere, event
+    ):
+        sphere.managers.add(active_user)
+
+        response = authenticated_client.get(self.get_url(event))
+
+        assert_response(
+            response,
+            HTTPStatus.FOUND,
+            messages=[(messages.WARNING, "No other events available to copy from.")],
+            url=f"/panel/event/{event.slug}/venues/",
+        )
+
+    def test_post_copies_layout(self, authenticated_client, active_user, sphere, event):
+        sphere.managers.add(active_user)
+        source = EventFactory(
+            name="Last Year",
+            slug="last-year",
+            sphere=sphere,
+            start_time=event.start_time - timedelta(days=365),
+        )
+        _, track = _layout(source)
+        manager = UserFactory()
+        track.managers.add(manager)
+        TimeSlot.objects.create(
+            event=source,
+            start_time=source.start_time,
+            end_time=source.start_time + timedelta(hours=2),
+        )
+        Venue.objects.create(event=event, name="Main Hall", slug="main-hall")
+
+        response = authenticated_client.post(
+            self.get_url(event), {"source_event": str(source.pk)}
+        )
+
+        assert_response(
+            response,
+            HTTPStatus.FOUND,
+            messages=[
+                (
+                    messages.SUCCESS,
+                    (
+                        "Copied 1 venues, 2 spaces, 1 time slots and 1 tracks "
+                        "from Last Year."
+                    ),
+                )
+            ],
+            url=f"/panel/event/{event.slug}/venues/",
+        )
+        copied_venue = Venue.objects.get(event=event, name="Main Hall", order=1)
+        assert copied_venue.slug.startswith("main-hall-")
+        copied_spaces = Space.objects.filter(area__venue=copied_venue)
+        assert sorted(s.slug for s in copied_spaces) == ["room-0", "room-1"]
+        slot = TimeSlot.objects.get(event=event)
+        assert slot.start_time == event.start_time
+        copied_track = Track.objects.get(event=event)
+        assert list(copied_track.spaces.values_list("slug", flat=True)) == ["room-0"]
+        assert list(copied_track.managers.all()) == [manager]
+
+    def test_post_skips_overlapping_time_slots(
+        self, authenticated_client, active_user, sphere, event
+    ):
+        sphere.managers.add(active_user)
+        source = EventFactory(sphere=sphere, start_time=event.start_time)
+        TimeSlot.objects.create(
+            event=source,
+            start_time=source.start_time,
+            end_time=source.start_time + timedelta(hours=2),
+        )
+        TimeSlot.objects.create(
+            event=event,
+            start_time=event.start_time + timedelta(hours=1),
+            end_time=event.start_time + timedelta(hours=3),
+        )
+
+        authenticated_client.post(self.get_url(event), {"source_event": str(source.pk)})
+
+        assert TimeSlot.objects.filter(event=event).count() == 1
+
+    def test_post_returns_form_on_validation_error(
+        self, authenticated_client, active_user, sphere, event
+    ):
+        sphere.managers.add(active_user)
+        EventFactory(sphere=sphere)
+
+        response = authenticated_client.post(self.get_url(event), {"source_event": ""})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.template_name == "panel/venue-layout-copy.html"
+        assert response.context["form"].errors
+
+
+class TestVenueBulkClone:
+    def test_duplicate_query_count_does_not_grow_with_spaces(self, event):
+        small, _ = _layout(event)
+        large = Venue.objects.create(event=event, name="Annex", slug="annex")
+        area = Area.objects.create(venue=large, name="Floor", slug="floor")
+        Space.objects.bulk_create(
+            Space(area=area, name=f"Room {i}", slug=f"room-{i}")
+            for i in range(_SPACES_PER_AREA)
+        )
+        repository = VenueRepository()
+
+        with CaptureQueriesContext(connection) as small_ctx:
+            repository.duplicate(small.pk, "Main Hall 2")
+        with CaptureQueriesContext(connection) as large_ctx:
+            repository.duplicate(large.pk, "Annex 2")
+
+        assert len(large_ctx.captured_queries) == len(small_ctx.captured_queries)
+        assert (
+            Space.objects.filter(area__venue__name="Annex 2").count()
+            == _SPACES_PER_AREA
+        )
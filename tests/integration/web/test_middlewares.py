@@ -1,7 +1,9 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from django.db import connection
 from django.http import HttpResponseRedirect
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from ludamus.adapters.db.django.models import Sphere
@@ -99,6 +101,39 @@ class TestRequestContextMiddleware:
             mock_messages.error.assert_called_once()
             get_response_mock.assert_not_called()
 
+    @pytest.mark.django_db
+    @staticmethod
+    def test_resolution_is_cached_between_requests(middleware, rf, sphere):
+        def resolve():
+            request = rf.get("/")
+            request.META["HTTP_HOST"] = sphere.site.domain
+            request.di = DependencyInjector()
+            middleware(request)
+            return request.context
+
+        resolve()
+        with CaptureQueriesContext(connection) as ctx:
+            context = resolve()
+
+        assert not ctx.captured_queries
+        assert context.current_sphere.pk == sphere.pk
+        assert context.current_site.domain == sphere.site.domain
+        assert context.root_site.pk == context.root_site_id
+
+    @pytest.mark.django_db
+    @staticmethod
+    def test_sphere_save_invalidates_cached_resolution(middleware, rf, sphere):
+        request = rf.get("/")
+        request.META["HTTP_HOST"] = sphere.site.domain
+        request.di = DependencyInjector()
+        middleware(request)
+
+        sphere.name = "Renamed sphere"
+        sphere.save()
+        middleware(request)
+
+        assert request.context.current_sphere.name == "Renamed sphere"
+
     @staticmethod
     @pytest.mark.parametrize(
         "path", ("/static/test.css", "/admin/", "/__debug__/toolbar/", "/__reload__/")
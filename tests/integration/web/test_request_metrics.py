@@ -0,0 +1,76 @@
+"""Integration tests for the request metrics middleware."""
+
+import logging
+import re
+
+import pytest
+from django.urls import reverse
+
+_BUDGET = 1
+
+
+@pytest.fixture(name="sampled")
+def sampled_fixture(settings):
+    settings.REQUEST_METRICS_SAMPLE_RATE = 1.0
+    return settings
+
+
+def _url(event):
+    return reverse("web:chronology:event", kwargs={"slug": event.slug})
+
+
+class TestRequestMetricsMiddleware:
+    def test_off_by_default(self, client, event):
+        response = client.get(_url(event))
+
+        assert "Server-Timing" not in response.headers
+
+    @pytest.mark.usefixtures("sampled", "agenda_item")
+    def test_reports_server_timing_to_staff(self, staff_client, event):
+        response = staff_client.get(_url(event))
+
+        timing = response.headers["Server-Timing"]
+        queries = int(re.search(r'desc="(\d+) queries', timing).group(1))
+        assert queries > 0
+        assert "tpl;dur=" in timing
+        assert "total;dur=" in timing
+
+    @pytest.mark.usefixtures("sampled")
+    def test_hides_server_timing_from_other_users(self, authenticated_client, event):
+        response = authenticated_client.get(_url(event))
+
+        assert "Server-Timing" not in response.headers
+
+    def test_reports_server_timing_under_debug(self, client, event, sampled):
+        sampled.DEBUG = True
+
+        response = client.get(_url(event))
+
+        assert "Server-Timing" in response.headers
+
+    @pytest.mark.usefixtures("sampled")
+    def test_logs_structured_line(self, client, event, caplog):
+        with caplog.at_level(logging.INFO, logger="ludamus.inits.instrumentation"):
+            client.get(_url(event))
+
+        (record,) = [r for r in caplog.records if hasattr(r, "request_metrics")]
+        assert record.request_metrics["view"] == "web:chronology:event"
+        assert record.request_metrics["template_ms"] > 0
+
+    def test_warns_over_view_budget(self, client, event, sampled, caplog):
+        sampled.REQUEST_METRICS_VIEW_BUDGETS = {"web:chronology:event": _BUDGET}
+
+        with caplog.at_level(logging.WARNING, logger="ludamus.inits.instrumentation"):
+            client.get(_url(event))
+
+        assert any(
+            "over its budget of 1" in record.getMessage() for record in caplog.records
+        )
+
+    def test_budget_of_zero_never_warns(self, client, event, sampled, caplog):
+        sampled.REQUEST_METRICS_QUERY_BUDGET = 0
+
+        with caplog.at_level(logging.WARNING, logger="ludamus.inits.instrumentation"):
+            client.get(_url(event))
+
+        assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
@@ -1,25 +1,32 @@
-from datetime import UTC, datetime
+import random
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call, patch
+from zoneinfo import ZoneInfo
 
 import pytest
 from pydantic import BaseModel
 
 from ludamus.mills.chronology import (
     ConflictDetectionService,
+    EventCalendarService,
     EventIntegrationsService,
     IntegrationImplementationNotFoundError,
+    ScheduleSnapshotService,
     TimetableOverviewService,
     TimetableService,
+    render_calendar_entry,
 )
 from ludamus.pacts import (
     AgendaItemDTO,
     AreaDTO,
+    CalendarEntryDTO,
     NotFoundError,
     ScheduleChangeAction,
     SessionStatus,
     SpaceDTO,
     TimeSlotDTO,
+    TrackAttributionDTO,
     VenueDTO,
 )
 from ludamus.pacts.chronology import (
@@ -27,6 +34,7 @@ from ludamus.pacts.chronology import (
     CheckResult,
     ConflictType,
     EventIntegrationCreateData,
+    HeatmapCellStatus,
     IntegrationCheckRequest,
     IntegrationImplementationId,
     IntegrationKind,
@@ -270,7 +278,7 @@ class TestAssignUnassignScope:
 
 class TestListAllForTrackAttribution:
     def test_no_other_tracks_returns_conflict_unchanged(self):
-        """Lines 351, 353: filtering removes current track, leaving empty list."""
+        """Filtering removes current track, leaving empty list."""
         uow = MagicMock()
         current_track_pk = 5
 
@@ -281,35 +289,32 @@ class TestListAllForTrackAttribution:
             start_time=datetime(2026, 1, 1, 10, 0, tzinfo=UTC),
             end_time=datetime(2026, 1, 1, 11, 0, tzinfo=UTC),
         )
-        uow.agenda_items.list_by_track.return_value = [item]
-
-        session = MagicMock()
-        session.participants_limit = 5
-        uow.sessions.read.return_value = session
-
-        space = MagicMock()
-        space.capacity = None
-        uow.spaces.read.return_value = space
-
-        facilitator = MagicMock()
-        facilitator.pk = 1
-        facilitator.display_name = "Alice"
-        uow.sessions.read_facilitators.return_value = [facilitator]
-
         overlap_item = _make_item(
             pk=2,
             session_id=20,
-            space_id=1,
+            space_id=2,
             session_title="Other",
             start_time=datetime(2026, 1, 1, 10, 0, tzinfo=UTC),
             end_time=datetime(2026, 1, 1, 11, 0, tzinfo=UTC),
         )
-        uow.agenda_items.list_overlapping_in_space.return_value = []
-        uow.agenda_items.list_overlapping_by_facilitator.return_value = [overlap_item]
+        uow.agenda_items.list_by_event.return_value = [item, overlap_item]
+        uow.tracks.read_session_pks_by_event.return_value = {current_track_pk: [10]}
 
-        track = MagicMock()
-        track.pk = current_track_pk
-        uow.tracks.list_by_session.return_value = [track]
+        facilitator = MagicMock()
+        facilitator.pk = 1
+        facilitator.display_name = "Alice"
+        uow.sessions.read_facilitators_by_sessions.return_value = {
+            10: [facilitator],
+            20: [facilitator],
+        }
+
+        uow.tracks.read_attributions_by_sessions.return_value = {
+            20: [
+                TrackAttributionDTO(
+                    track_pk=current_track_pk, track_name="Current", manager_names=[]
+                )
+            ]
+        }
 
         svc = ConflictDetectionService(uow)
         conflicts = svc.list_all_for_track(event_pk=1, track_pk=current_track_pk)
@@ -322,6 +327,364 @@ class TestListAllForTrackAttribution:
             assert conflict.track_name is None
             assert conflict.manager_names == []
 
+    def test_attributions_are_loaded_in_one_call(self):
+        uow = MagicMock()
+        start = datetime(2026, 1, 1, 10, 0, tzinfo=UTC)
+        items = [
+            _make_item(
+                pk=pk,
+                session_id=pk + 100,
+                session_title=f"Session {pk}",
+                space_id=pk,
+                start_time=start,
+                end_time=start + timedelta(hours=1),
+            )
+            for pk in range(1, 7)
+        ]
+        uow.agenda_items.list_by_event.return_value = items
+        facilitator = SimpleNamespace(pk=1, display_name="Alice")
+        uow.sessions.read_facilitators_by_sessions.return_value = {
+            item.session_id: [facilitator] for item in items
+        }
+        uow.tracks.read_attributions_by_sessions.return_value = {
+            item.session_id: [
+                TrackAttributionDTO(
+                    track_pk=7, track_name="RPG", manager_names=["Manager"]
+                )
+            ]
+            for item in items
+        }
+
+        svc = ConflictDetectionService(uow)
+        conflicts = svc.list_all_for_track(event_pk=1, track_pk=None)
+
+        assert len(conflicts) > len(items)
+        assert {c.track_name for c in conflicts} == {"RPG"}
+        assert all(c.manager_names == ["Manager"] for c in conflicts)
+        uow.tracks.read_attributions_by_sessions.assert_called_once()
+
+
+class TestListAllForTrackSweep:
+    @staticmethod
+    def _facilitator(pk):
+        return SimpleNamespace(pk=pk, display_name=f"Facilitator {pk}")
+
+    @staticmethod
+    def _per_item_conflicts(items, facilitators_by_session):
+        # Reference: the per-item detection the bulk engine replaces.
+        def overlaps(a, b):
+            return a.start_time < b.end_time and a.end_time > b.start_time
+
+        result = []
+        seen = set()
+        for item in items:
+            found = [
+                (ConflictType.SPACE_OVERLAP, other.session_id, None)
+                for other in items
+                if other.space_id == item.space_id
+                and other.session_id != item.session_id
+                and overlaps(item, other)
+            ]
+            if item.space_capacity is not None and (
+                item.space_capacity < item.session_participants_limit
+            ):
+                found.append((ConflictType.CAPACITY_EXCEEDED, item.session_id, None))
+            for facilitator in facilitators_by_session.get(item.session_id, []):
+                found.extend(
+                    (
+                        ConflictType.FACILITATOR_OVERLAP,
+                        other.session_id,
+                        facilitator.display_name,
+                    )
+                    for other in items
+                    if other.session_id != item.session_id
+                    and facilitator in facilitators_by_session.get(other.session_id, [])
+                    and overlaps(item, other)
+                )
+            for conflict_type, session_pk, facilitator_name in found:
+                if (item.session_id, session_pk) in seen or (
+                    session_pk,
+                    item.session_id,
+                ) in seen:
+                    continue
+                seen.add((item.session_id, session_pk))
+                result.append((conflict_type, session_pk, facilitator_name))
+        return result
+
+    def test_matches_per_item_detection_on_random_schedule(self):
+        rng = random.Random(1234)
+        base = datetime(2026, 1, 1, 8, 0, tzinfo=UTC)
+        facilitators = [self._facilitator(pk) for pk in range(1, 9)]
+        items = []
+        facilitators_by_session = {}
+        for pk in range(1, 121):
+            start = base + timedelta(minutes=15 * rng.randrange(40))
+            items.append(
+                _make_item(
+                    pk=pk,
+                    session_id=pk + 1000,
+                    session_title=f"Session {pk}",
+                    space_id=rng.randrange(1, 7),
+                    start_time=start,
+                    end_time=start + timedelta(minutes=15 * rng.randrange(1, 9)),
+                    space_capacity=rng.choice([None, 10, 20]),
+                    session_participants_limit=rng.randrange(5, 25),
+                )
+            )
+            facilitators_by_session[pk + 1000] = sorted(
+                rng.sample(facilitators, rng.randrange(3)), key=lambda f: f.pk
+            )
+        uow = MagicMock()
+        uow.agenda_items.list_by_event.return_value = items
+        uow.sessions.read_facilitators_by_sessions.return_value = (
+            facilitators_by_session
+        )
+        uow.tracks.read_attributions_by_sessions.return_value = {}
+
+        conflicts = ConflictDetectionService(uow).list_all_for_track(
+            event_pk=1, track_pk=None
+        )
+
+        assert [
+            (c.type, c.session_pk, c.facilitator_name) for c in conflicts
+        ] == self._per_item_conflicts(items, facilitators_by_session)
+        uow.agenda_items.list_by_event.assert_called_once_with(1)
+        uow.agenda_items.list_overlapping_in_space.assert_not_called()
+        uow.agenda_items.list_overlapping_by_facilitator.assert_not_called()
+
+    def test_touching_items_do_not_conflict(self):
+        first = _make_item(
+            pk=1,
+            session_id=1,
+            start_time=datetime(2026, 1, 1, 10, 0, tzinfo=UTC),
+            end_time=datetime(2026, 1, 1, 11, 0, tzinfo=UTC),
+        )
+        second = _make_item(
+            pk=2,
+            session_id=2,
+            start_time=datetime(2026, 1, 1, 11, 0, tzinfo=UTC),
+            end_time=datetime(2026, 1, 1, 12, 0, tzinfo=UTC),
+        )
+        uow = MagicMock()
+        uow.agenda_items.list_by_event.return_value = [first, second]
+        uow.sessions.read_facilitators_by_sessions.return_value = {}
+
+        conflicts = ConflictDetectionService(uow).list_all_for_track(
+            event_pk=1, track_pk=None
+        )
+
+        assert conflicts == []
+
+
+class _DictCache:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, timeout=None):  # noqa: ARG002 - protocol shape
+        self.data[key] = value
+
+    def get_many(self, keys):
+        return {key: self.data[key] for key in keys if key in self.data}
+
+    def set_many(self, values, timeout=None):  # noqa: ARG002 - protocol shape
+        self.data.update(values)
+
+
+class TestScheduleSnapshotService:
+    @pytest.fixture
+    def uow(self):
+        uow = MagicMock()
+        uow.agenda_items.list_by_event.return_value = [_make_item()]
+        uow.events.read_version.return_value = "v1"
+        return uow
+
+    def test_snapshot_is_shared_through_cache(self, uow):
+        cache = _DictCache()
+
+        first = ScheduleSnapshotService(uow, cache).get(1)
+        second = ScheduleSnapshotService(uow, cache).get(1)
+
+        assert second is first
+        uow.agenda_items.list_by_event.assert_called_once_with(1)
+
+    def test_new_event_version_rebuilds_snapshot(self, uow):
+        cache = _DictCache()
+        first = ScheduleSnapshotService(uow, cache).get(1)
+
+        uow.events.read_version.return_value = "v2"
+        second = ScheduleSnapshotService(uow, cache).get(1)
+
+        assert second.version == "v2"
+        assert first.version == "v1"
+        assert uow.agenda_items.list_by_event.call_args_list == [call(1), call(1)]
+
+    def test_forget_drops_local_copy(self, uow):
+        snapshots = ScheduleSnapshotService(uow)
+        first = snapshots.get(1)
+
+        snapshots.forget(1)
+
+        assert snapshots.get(1) is not first
+
+    def test_assign_session_drops_local_copy(self, uow):
+        snapshots = ScheduleSnapshotService(uow)
+        first = snapshots.get(1)
+        uow.sessions.read_event.return_value.pk = 1
+        uow.spaces.list_by_event.return_value = [SimpleNamespace(pk=1)]
+        uow.agenda_items.read_by_session.return_value = None
+        uow.sessions.read.return_value.status = SessionStatus.PENDING
+
+        TimetableService(uow, snapshots).assign_session(
+            session_pk=1,
+            placement=SessionPlacement(
+                space_pk=1,
+                start_time=datetime(2026, 1, 1, 10, 0, tzinfo=UTC),
+                end_time=datetime(2026, 1, 1, 11, 0, tzinfo=UTC),
+            ),
+            event_pk=1,
+        )
+
+        assert snapshots.get(1) is not first
+
+
+_ICS_LINE_OCTETS = 75
+_EVENT_URL = "https://example.com/event/con/"
+
+
+def _make_calendar_entry(**overrides):
+    defaults = {
+        "description": "",
+        "end_time": datetime(2026, 1, 1, 11, 0, tzinfo=UTC),
+        "host_name": "Alice",
+        "location": "Room 1, Hall, Venue",
+        "modification_time": datetime(2025, 12, 1, 9, 0, tzinfo=UTC),
+        "session_pk": 1,
+        "start_time": datetime(2026, 1, 1, 10, 0, tzinfo=UTC),
+        "title": "Session",
+    }
+    defaults.update(overrides)
+    return CalendarEntryDTO(**defaults)
+
+
+class TestRenderCalendarEntry:
+    def test_renders_vevent(self):
+        block = render_calendar_entry(_make_calendar_entry(), _EVENT_URL)
+
+        assert block.split("\r\n") == [
+            "BEGIN:VEVENT",
+            "UID:session-1@ludamus",
+            "DTSTAMP:20251201T090000Z",
+            "DTSTART:20260101T100000Z",
+            "DTEND:20260101T110000Z",
+            "SUMMARY:Session",
+            "LOCATION:Room 1\\, Hall\\, Venue",
+            "DESCRIPTION:Alice",
+            f"URL:{_EVENT_URL}#session-1",
+            "END:VEVENT",
+            "",
+        ]
+
+    def test_escapes_text(self):
+        entry = _make_calendar_entry(title="a;b\\c", description="one\ntwo")
+
+        block = render_calendar_entry(entry, _EVENT_URL)
+
+        assert "SUMMARY:a\\;b\\\\c\r\n" in block
+        assert "DESCRIPTION:Alice\\n\\none\\ntwo\r\n" in block
+
+    def test_folds_long_lines_without_splitting_characters(self):
+        title = "ż" * 100
+
+        block = render_calendar_entry(_make_calendar_entry(title=title), _EVENT_URL)
+
+        lines = block.split("\r\n")
+        assert all(len(line.encode()) <= _ICS_LINE_OCTETS for line in lines)
+        summary = lines[5] + "".join(
+            line.removeprefix(" ") for line in lines[6:] if line.startswith(" ")
+        )
+        assert summary == f"SUMMARY:{title}"
+
+
+class TestEventCalendarService:
+    @pytest.fixture
+    def uow(self):
+        uow = MagicMock()
+        uow.agenda_items.list_calendar_entries.return_value = [
+            _make_calendar_entry(session_pk=1, title="First"),
+            _make_calendar_entry(session_pk=2, title="Second"),
+        ]
+        return uow
+
+    @pytest.fixture
+    def event(self):
+        event = MagicMock()
+        event.pk = 1
+        event.name = "Con"
+        return event
+
+    def test_feed_wraps_entries_in_calendar(self, uow, event):
+        feed = "".join(EventCalendarService(uow, _DictCache()).feed(event, "v1", "u"))
+
+        assert feed.startswith("BEGIN:VCALENDAR\r\n")
+        assert feed.endswith("END:VCALENDAR\r\n")
+        assert feed.count("BEGIN:VEVENT") == len(
+            uow.agenda_items.list_calendar_entries.return_value
+        )
+        assert "X-WR-CALNAME:Con\r\n" in feed
+
+    def test_feed_is_cached_per_version(self, uow, event):
+        cache = _DictCache()
+        first = "".join(EventCalendarService(uow, cache).feed(event, "v1", "u"))
+
+        second = "".join(EventCalendarService(uow, cache).feed(event, "v1", "u"))
+
+        assert second == first
+        uow.agenda_items.list_calendar_entries.assert_called_once_with(1, None)
+
+    def test_feed_streams_before_it_is_cached(self, uow, event):
+        cache = _DictCache()
+        chunks = EventCalendarService(uow, cache).feed(event, "v1", "u")
+
+        header = next(chunks)
+
+        assert header.startswith("BEGIN:VCALENDAR\r\n")
+        assert not cache.data
+        rest = "".join(chunks)
+        assert cache.data["calendar:feed:1:all:v1"] == header + rest
+
+    def test_new_version_renders_only_changed_entries(self, uow, event):
+        cache = _DictCache()
+        "".join(EventCalendarService(uow, cache).feed(event, "v1", "u"))
+        uow.agenda_items.list_calendar_entries.return_value[1] = _make_calendar_entry(
+            session_pk=2,
+            title="Renamed",
+            modification_time=datetime(2025, 12, 2, 9, 0, tzinfo=UTC),
+        )
+
+        with patch(
+            "ludamus.mills.chronology.render_calendar_entry",
+            wraps=render_calendar_entry,
+        ) as render:
+            feed = "".join(EventCalendarService(uow, cache).feed(event, "v2", "u"))
+
+        assert render.call_count == 1
+        assert "SUMMARY:First" in feed
+        assert "SUMMARY:Renamed" in feed
+
+    def test_participant_feed_is_cached_separately(self, uow, event):
+        cache = _DictCache()
+        "".join(EventCalendarService(uow, cache).feed(event, "v1", "u"))
+
+        "".join(EventCalendarService(uow, cache).feed(event, "v1", "u", 7))
+
+        assert uow.agenda_items.list_calendar_entries.call_args_list == [
+            call(1, None),
+            call(1, 7),
+        ]
+
 
 class TestTimetableOverviewServiceDefaults:
     @pytest.fixture
@@ -351,6 +714,141 @@ class TestTimetableOverviewServiceDefaults:
 
         assert not result
 
+    def test_track_progress_reads_counts_for_all_tracks_at_once(self, mock_uow):
+        mock_uow.tracks.list_by_event.return_value = [
+            SimpleNamespace(pk=1, name="RPG"),
+            SimpleNamespace(pk=2, name="Board games"),
+        ]
+        mock_uow.tracks.get_progress_counts.return_value = {
+            1: {"accepted": 4, "scheduled": 1},
+            2: {"accepted": 0, "scheduled": 0},
+        }
+        mock_uow.tracks.read_manager_names_by_event.return_value = {1: ["Alice"]}
+
+        result = TimetableOverviewService(mock_uow).track_progress(event_pk=1)
+
+        progress = [(p.track_name, p.manager_names, p.progress_pct) for p in result]
+        assert progress == [("RPG", ["Alice"], 25), ("Board games", [], 0)]
+        mock_uow.tracks.get_progress_counts.assert_called_once_with(1)
+        mock_uow.sessions.list_sessions_by_event.assert_not_called()
+
+
+class TestBuildHeatmapIntervalIndex:
+    @staticmethod
+    def _space(pk):
+        now = datetime(2026, 1, 1, tzinfo=UTC)
+        return SpaceDTO(
+            area_id=1,
+            capacity=None,
+            creation_time=now,
+            modification_time=now,
+            name=f"Room {pk}",
+            order=pk,
+            pk=pk,
+            slug=f"room-{pk}",
+        )
+
+    @staticmethod
+    def _scan_status(items, slot_time, conflict_session_pks):
+        # Reference: the per-slot linear scan the interval index replaces.
+        overlapping = next(
+            (it for it in items if it.start_time <= slot_time < it.end_time), None
+        )
+        if overlapping is None:
+            return HeatmapCellStatus.EMPTY
+        if overlapping.session_id in conflict_session_pks:
+            return HeatmapCellStatus.CONFLICT
+        return HeatmapCellStatus.SCHEDULED
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("tz", (UTC, ZoneInfo("Europe/Warsaw")))
+    def test_matches_per_slot_scan_on_random_schedule(self, seed, tz):
+        rng = random.Random(seed)
+        # Spans the 2026-03-29 DST change in Europe/Warsaw.
+        base = datetime(2026, 3, 27, 6, 0, tzinfo=UTC)
+        spaces = [self._space(pk) for pk in range(1, 9)]
+        slots = []
+        for day in range(4):
+            start = base + timedelta(days=day, minutes=15 * rng.randrange(8))
+            slots.append(
+                TimeSlotDTO(
+                    pk=day + 1,
+                    start_time=start,
+                    end_time=start + timedelta(hours=rng.randrange(6, 22)),
+                )
+            )
+        items = []
+        for pk in range(1, 200):
+            start = base + timedelta(minutes=5 * rng.randrange(4 * 24 * 12))
+            items.append(
+                _make_item(
+                    pk=pk,
+                    session_id=pk,
+                    space_id=rng.randrange(1, 10),
+                    start_time=start,
+                    end_time=start + timedelta(minutes=5 * rng.randrange(1, 40)),
+                )
+            )
+        conflicts = [MagicMock(session_pk=pk) for pk in rng.sample(range(1, 200), 30)]
+        conflict_session_pks = {c.session_pk for c in conflicts}
+        uow = MagicMock()
+        uow.spaces.list_by_event.return_value = spaces
+        uow.agenda_items.list_by_event.return_value = items
+        uow.time_slots.list_by_event.return_value = slots
+
+        result = TimetableOverviewService(uow).build_heatmap(
+            event_pk=1, tz=tz, conflicts=conflicts
+        )
+
+        assert result.rows
+        for row in result.rows:
+            assert [cell.space_pk for cell in row.cells] == [s.pk for s in spaces]
+            assert [cell.status for cell in row.cells] == [
+                self._scan_status(
+                    [it for it in items if it.space_id == space.pk],
+                    row.time,
+                    conflict_session_pks,
+                )
+                for space in spaces
+            ]
+
+    def test_sub_hour_slots_cover_the_dst_gap(self, monkeypatch):
+        monkeypatch.setattr("ludamus.mills.chronology.TIMETABLE_SLOT_MINUTES", 15)
+        tz = ZoneInfo("Europe/Warsaw")
+        # 00:00 CET to 04:00 CEST; wall clock skips 02:00-03:00 that night
+        slot = TimeSlotDTO(
+            pk=1,
+            start_time=datetime(2026, 3, 28, 23, 0, tzinfo=UTC),
+            end_time=datetime(2026, 3, 29, 2, 0, tzinfo=UTC),
+        )
+        item = _make_item(
+            pk=1,
+            session_id=1,
+            space_id=1,
+            start_time=datetime(2026, 3, 29, 1, 0, tzinfo=UTC),
+            end_time=datetime(2026, 3, 29, 1, 30, tzinfo=UTC),
+        )
+        uow = MagicMock()
+        uow.spaces.list_by_event.return_value = [self._space(1)]
+        uow.agenda_items.list_by_event.return_value = [item]
+        uow.time_slots.list_by_event.return_value = [slot]
+
+        result = TimetableOverviewService(uow).build_heatmap(
+            event_pk=1, tz=tz, conflicts=[]
+        )
+
+        scheduled = [
+            index
+            for index, row in enumerate(result.rows)
+            if row.cells[0].status == HeatmapCellStatus.SCHEDULED
+        ]
+        expected = [
+            index
+            for index, row in enumerate(result.rows)
+            if self._scan_status([item], row.time, set()) == HeatmapCellStatus.SCHEDULED
+        ]
+        assert scheduled == expected == [8, 9, 12, 13]
+
 
 # --- EventIntegrationsService ---
 
@@ -0,0 +1,63 @@
+from collections import Counter
+
+from ludamus.inits.instrumentation import (
+    RequestMetrics,
+    duplicate_count,
+    server_timing,
+    sql_fingerprint,
+)
+
+_REPEATS = 3
+
+
+class TestSqlFingerprint:
+    def test_folds_in_list_lengths(self):
+        three = sql_fingerprint('SELECT * FROM "session" WHERE "id" IN (%s, %s, %s)')
+        one = sql_fingerprint('SELECT * FROM "session" WHERE "id" IN (%s)')
+
+        assert three == one
+
+    def test_folds_inlined_numbers_and_whitespace(self):
+        fingerprint = sql_fingerprint("SELECT 1 FROM t0\n LIMIT 21")
+
+        assert fingerprint == "SELECT ? FROM t0 LIMIT ?"
+
+    def test_keeps_different_statements_apart(self):
+        event = sql_fingerprint('SELECT * FROM "event"')
+        space = sql_fingerprint('SELECT * FROM "space"')
+
+        assert event != space
+
+
+class TestRequestMetrics:
+    def test_counts_queries_through_execute_wrapper(self):
+        metrics = RequestMetrics()
+        for pk in range(_REPEATS):
+            metrics(
+                lambda *_args: None,
+                'SELECT * FROM "session" WHERE "id" = %s',
+                (pk,),
+                many=False,
+                context={},
+            )
+        metrics(
+            lambda *_args: None, 'SELECT * FROM "event"', (), many=False, context={}
+        )
+
+        fingerprints = metrics.fingerprints()
+
+        assert metrics.queries == _REPEATS + 1
+        assert duplicate_count(fingerprints) == _REPEATS - 1
+        assert fingerprints.most_common(1)[0][1] == _REPEATS
+
+    def test_server_timing_header(self):
+        metrics = RequestMetrics(queries=2, db_seconds=0.0015, template_seconds=0.004)
+
+        header = server_timing(metrics, 1, 0.02)
+
+        assert header == (
+            'db;dur=1.5;desc="2 queries, 1 duplicated", tpl;dur=4.0, total;dur=20.0'
+        )
+
+    def test_no_duplicates_without_repeats(self):
+        assert duplicate_count(Counter({"a": 1, "b": 1})) == 0
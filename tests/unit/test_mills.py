@@ -330,7 +330,7 @@ class TestPanelService:
             pending_proposals=5,
             scheduled_sessions=10,
             total_proposals=total_proposals,
-            unique_host_ids={1, 2, 3},
+            hosts_count=3,
             rooms_count=4,
         )
 
@@ -340,30 +340,30 @@ class TestPanelService:
         mock_uow.events.get_stats_data.assert_called_once_with(1)
 
     def test_get_event_stats_counts_unique_hosts(self, panel_service, mock_uow):
-        hosts = {10, 20, 30, 40, 50}
+        hosts_count = 5
         mock_uow.events.get_stats_data.return_value = EventStatsData(
             pending_proposals=0,
             scheduled_sessions=0,
             total_proposals=0,
-            unique_host_ids=hosts,
+            hosts_count=hosts_count,
             rooms_count=0,
         )
 
         result = panel_service.get_event_stats(event_id=42)
 
-        assert result.hosts_count == len(hosts)
+        assert result.hosts_count == hosts_count
 
     def test_get_event_stats_returns_panel_stats_dto(self, panel_service, mock_uow):
         pending_proposals = 3
         scheduled_sessions = 7
         total_proposals = 10
-        unique_host_ids = {1, 2}
+        hosts_count = 2
         rooms_count = 5
         mock_uow.events.get_stats_data.return_value = EventStatsData(
             pending_proposals=pending_proposals,
             scheduled_sessions=scheduled_sessions,
             total_proposals=total_proposals,
-            unique_host_ids=unique_host_ids,
+            hosts_count=hosts_count,
             rooms_count=rooms_count,
         )
 
@@ -374,7 +374,7 @@ class TestPanelService:
         assert result.scheduled_sessions == scheduled_sessions
         assert result.total_proposals == total_proposals
         assert result.rooms_count == rooms_count
-        assert result.hosts_count == len(unique_host_ids)
+        assert result.hosts_count == hosts_count
         assert result.total_sessions == total_proposals
 
     def test_get_event_stats_with_empty_hosts(self, panel_service, mock_uow):
@@ -382,7 +382,7 @@ class TestPanelService:
             pending_proposals=0,
             scheduled_sessions=0,
             total_proposals=0,
-            unique_host_ids=set(),
+            hosts_count=0,
             rooms_count=0,
         )
 
@@ -694,7 +694,7 @@ class TestProposeSessionService:
             sphere_id=1,
             start_time=now + timedelta(days=5),
         )
-        mock_uow.sessions.slug_exists.return_value = False
+        mock_uow.sessions.read_taken_slugs.return_value = set()
         facilitator = FacilitatorDTO(
             display_name="Anon Host", event_id=1, pk=10, slug="anon-host", user_id=None
         )
@@ -716,6 +716,62 @@ class TestProposeSessionService:
         assert create_call["user_id"] is None
         assert create_call["display_name"] == "Anon Host"
 
+    @staticmethod
+    def _event():
+        now = datetime.now(tz=UTC)
+        return EventDTO(
+            description="Test",
+            end_time=now + timedelta(days=7),
+            name="Test Event",
+            pk=1,
+            proposal_end_time=now + timedelta(days=1),
+            proposal_start_time=now - timedelta(days=1),
+            publication_time=now - timedelta(days=2),
+            slug="test-event",
+            sphere_id=1,
+            start_time=now + timedelta(days=5),
+        )
+
+    def test_submit_resolves_fields_with_one_read_per_kind(self, service, mock_uow):
+        mock_uow.session_fields.read_pks_by_slug.return_value = {"genre": 3, "gm": 4}
+        mock_uow.personal_data_fields.read_pks_by_slug.return_value = {"phone": 7}
+        mock_uow.sessions.read_taken_slugs.return_value = set()
+        wizard_data = {
+            "category_id": 1,
+            "session_data": {
+                "title": "Test Session",
+                "session_genre": "horror",
+                "session_gm": "yes",
+                "session_unknown": "skipped",
+            },
+            "personal_data": {"personal_phone": "123", "personal_unknown": "x"},
+        }
+
+        service.submit(self._event(), wizard_data)
+
+        mock_uow.session_fields.read_pks_by_slug.assert_called_once_with(1)
+        mock_uow.personal_data_fields.read_pks_by_slug.assert_called_once_with(1)
+        mock_uow.session_fields.read_by_slug.assert_not_called()
+        mock_uow.personal_data_fields.read_by_slug.assert_not_called()
+        saved = mock_uow.sessions.save_field_values.call_args[0][1]
+        assert [(v["field_id"], v["value"]) for v in saved] == [
+            (3, "horror"),
+            (4, "yes"),
+        ]
+        entries = mock_uow.host_personal_data.save.call_args[0][0]
+        assert [(e["field_id"], e["value"]) for e in entries] == [(7, "123")]
+
+    def test_submit_suffixes_taken_slug_after_one_read(self, service, mock_uow):
+        mock_uow.sessions.read_taken_slugs.return_value = {"test-session"}
+        wizard_data = {"category_id": 1, "session_data": {"title": "Test Session"}}
+
+        service.submit(self._event(), wizard_data)
+
+        mock_uow.sessions.read_taken_slugs.assert_called_once_with(1, "test-session")
+        mock_uow.sessions.slug_exists.assert_not_called()
+        slug = mock_uow.sessions.create.call_args[0][0]["slug"]
+        assert slug.startswith("test-session-")
+
     def test_get_saved_personal_data_returns_empty_for_anonymous(self, mock_uow):
         anon_context = RequestContext(
             current_site_id=1, current_sphere_id=1, root_site_id=1, root_sphere_id=1
@@ -743,6 +799,12 @@ class TestCheckProposalRateLimit:
                 del timeout
                 cache[key] = value
 
+            @staticmethod
+            def incr(key: str, delta: int = 1, timeout: int | None = None) -> int:
+                del timeout
+                cache[key] = count = int(str(cache.get(key, 0))) + delta
+                return count
+
         result = check_proposal_rate_limit(FakeCache(), "1.2.3.4", event_id=1)
 
         assert result is True
@@ -761,6 +823,12 @@ class TestCheckProposalRateLimit:
                 del timeout
                 cache[key] = value
 
+            @staticmethod
+            def incr(key: str, delta: int = 1, timeout: int | None = None) -> int:
+                del timeout
+                cache[key] = count = int(str(cache.get(key, 0))) + delta
+                return count
+
         result = check_proposal_rate_limit(FakeCache(), "1.2.3.4", event_id=1)
 
         assert result is False
@@ -778,6 +846,12 @@ class TestCheckProposalRateLimit:
                 del timeout
                 cache[key] = value
 
+            @staticmethod
+            def incr(key: str, delta: int = 1, timeout: int | None = None) -> int:
+                del timeout
+                cache[key] = count = int(str(cache.get(key, 0))) + delta
+                return count
+
         result = check_proposal_rate_limit(FakeCache(), "1.2.3.4", event_id=2)
 
         assert result is True